@@ -0,0 +1,117 @@
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger('spendify.queries')
+
+# `IN (%s, %s, ...)` lists of any length are one shape.
+PLACEHOLDER_LIST_RE = re.compile(r'%s(?:, %s)+')
+
+
+class QueryMetrics:
+    """
+    Database execute wrapper counting and timing the queries it sees and grouping them by
+    shape (the SQL text with placeholders), so the same query repeated once per row
+    (N+1) stands out.
+    """
+
+    def __init__(self, repeat_threshold=None):
+        self.repeat_threshold = (
+            settings.QUERY_METRICS_REPEAT_THRESHOLD if repeat_threshold is None
+            else repeat_threshold
+        )
+        self.count = 0
+        self.duration = 0.0
+        self.shapes = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+            self.shapes[PLACEHOLDER_LIST_RE.sub('%s, ...', sql)] += 1
+
+    @property
+    def duration_ms(self):
+        return round(self.duration * 1000, 2)
+
+    def repeated(self):
+        """
+        [(sql, times)] for shapes executed at least `repeat_threshold` times, most first.
+        """
+        return [
+            (sql, times) for sql, times in self.shapes.most_common()
+            if times >= self.repeat_threshold
+        ]
+
+    def report(self):
+        lines = [f"{self.count} queries in {self.duration_ms} ms"]
+        lines += [f"  {times}x {sql}" for sql, times in self.repeated()]
+        return '\n'.join(lines)
+
+
+@contextmanager
+def capture_queries(repeat_threshold=None):
+    """
+    Collects QueryMetrics for every query run on any database connection inside the block.
+    """
+    metrics = QueryMetrics(repeat_threshold)
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(metrics))
+        yield metrics
+
+
+class QueryMetricsMiddleware:
+    """
+    Counts and times the SQL each request runs and flags repeated query shapes.
+    With QUERY_METRICS_HEADERS (on in DEBUG) the totals are returned as X-DB-* headers;
+    they are always logged to `spendify.queries` as structured fields, at WARNING level
+    when a shape repeats. Queries run while a streaming response is consumed happen after
+    the middleware returns and are not counted.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with capture_queries() as metrics:
+            response = self.get_response(request)
+
+        repeated = metrics.repeated()
+        fields = {
+            'path': request.path,
+            'method': request.method,
+            'status': response.status_code,
+            'db_query_count': metrics.count,
+            'db_query_time_ms': metrics.duration_ms,
+            'db_repeated_queries': len(repeated),
+        }
+
+        if repeated:
+            sql, times = repeated[0]
+            logger.warning(
+                "Possible N+1 on %s %s: %d queries, %dx %s",
+                request.method, request.path, metrics.count, times, sql[:300],
+                extra=fields
+            )
+        else:
+            logger.info(
+                "%s %s: %d queries in %s ms",
+                request.method, request.path, metrics.count, metrics.duration_ms,
+                extra=fields
+            )
+
+        if settings.QUERY_METRICS_HEADERS:
+            response['X-DB-Query-Count'] = str(metrics.count)
+            response['X-DB-Query-Time-Ms'] = str(metrics.duration_ms)
+            response['X-DB-Repeated-Queries'] = str(len(repeated))
+
+        return response
@@ -40,6 +40,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
 
     'django_filters',
     'drf_spectacular',
@@ -54,9 +55,11 @@ INSTALLED_APPS = [
     'social',
     'integrations',
     'reports',
+    'sync',
 ]
 
 MIDDLEWARE = [
+    'config.query_metrics.QueryMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -102,6 +105,60 @@ DATABASES = {
 
 AUTH_USER_MODEL = 'users.CustomUser'
 
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('CACHE_LOCATION', 'spendify'),
+    }
+}
+
+REPORTS_CACHE_TIMEOUT = int(os.getenv('REPORTS_CACHE_TIMEOUT', 60 * 60))
+
+# Category lookups (transactions.category_cache): maps kept in the shared cache and an
+# in-process LRU of this many users, both invalidated on Category save and delete.
+# Invalidation reaches other processes only through a shared CACHE_BACKEND (Redis,
+# Memcached). With a per-process cache such as LocMemCache the category list endpoint reads
+# the database, and other lookups reload after CATEGORY_CACHE_VERSION_TIMEOUT seconds.
+CATEGORY_CACHE_SHARED = CACHES['default']['BACKEND'] not in (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+CATEGORY_CACHE_TIMEOUT = int(os.getenv('CATEGORY_CACHE_TIMEOUT', 24 * 60 * 60))
+CATEGORY_CACHE_VERSION_TIMEOUT = int(os.getenv('CATEGORY_CACHE_VERSION_TIMEOUT', 60))
+CATEGORY_CACHE_LOCAL_SIZE = int(os.getenv('CATEGORY_CACHE_LOCAL_SIZE', 1024))
+
+# Delta sync: rows changed up to SYNC_TOKEN_OVERLAP seconds before a token are sent again,
+# and clients older than the tombstone retention get a full snapshot.
+SYNC_TOKEN_OVERLAP = int(os.getenv('SYNC_TOKEN_OVERLAP', 60))
+SYNC_TOMBSTONE_RETENTION_DAYS = int(os.getenv('SYNC_TOMBSTONE_RETENTION_DAYS', 90))
+
+# Optional date partitioning of the transactions table ('month', 'year' or empty), and how
+# many future partitions `manage.py transaction_partitions` keeps ready.
+TRANSACTIONS_PARTITION_INTERVAL = os.getenv('TRANSACTIONS_PARTITION_INTERVAL', '')
+TRANSACTIONS_PARTITIONS_AHEAD = int(os.getenv('TRANSACTIONS_PARTITIONS_AHEAD', 3))
+
+# Per-request SQL metrics (config.query_metrics): X-DB-* response headers in debug, and
+# a query shape repeated this many times in one request is reported as a possible N+1.
+QUERY_METRICS_HEADERS = DEBUG
+QUERY_METRICS_REPEAT_THRESHOLD = int(os.getenv('QUERY_METRICS_REPEAT_THRESHOLD', 5))
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'spendify.queries': {
+            'handlers': ['console'],
+            'level': os.getenv('QUERY_METRICS_LOG_LEVEL', 'INFO'),
+            'propagate': False,
+        },
+    },
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -17,6 +17,7 @@ urlpatterns = [
     path('api/social/', include('social.urls')),
     path('api/integrations/', include('integrations.urls')),
     path('api/reports/', include('reports.urls')),
+    path('api/sync/', include('sync.urls')),
     path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
     path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
 ]
@@ -14,6 +14,7 @@ from .llm_service import get_ai_advice
 from .serializers import FinancialAdviceSerializer, ReceiptUploadSerializer
 from .services import scan_receipt
 from .models import FinancialAdvice
+from transactions.category_cache import get_standard_categories
 from transactions.models import Transaction, Category
 from transactions.serializers import TransactionSerializer
 
@@ -70,18 +71,11 @@ class ScanReceiptView(APIView):
         )
 
     def _find_standard_category(self, name):
-        category = Category.objects.filter(
-            owner=None,
-            name__iexact=name
-        ).first()
+        categories = get_standard_categories()
+        category_id = categories.get_id(str(name)) or categories.get_id("Other")
 
-        if category:
-            return category
-
-        fallback = Category.objects.filter(owner=None, name__in=["Other"]).first()
-
-        if fallback:
-            return fallback
+        if category_id:
+            return categories.get_instance(category_id)
 
         return Category.objects.create(name="Other", type="EXPENSE", owner=None)
 
@@ -0,0 +1,108 @@
+import hashlib
+from datetime import datetime, time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Max, Sum
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework.response import Response
+
+from .models import GLOBAL_DATA_VERSION_ID, UserDataVersion
+
+
+def get_data_version(request):
+    """
+    (version, changed_at) of the data visible to the requesting user, looked up once per
+    request: their own version plus the shared one bumped by standard category changes.
+    Both only grow, so their sum changes whenever either does. Version 0 and no change
+    time mean nothing was written yet.
+    """
+    if not hasattr(request, '_data_version'):
+        row = UserDataVersion.objects.filter(
+            user_id__in=(request.user.id, GLOBAL_DATA_VERSION_ID)
+        ).aggregate(version=Sum('version'), changed_at=Max('changed_at'))
+        request._data_version = (row['version'] or 0, row['changed_at'])
+    return request._data_version
+
+
+def build_report_cache_key(report_name, user_id, version, query_params):
+    """
+    Cache key for a report response. Query params are normalized (sorted, blanks dropped),
+    so `?a=1&b=2` and `?b=2&a=1&c=` share an entry. The current date is part of the key
+    because reports without an explicit date range default to "the last 30 days".
+    """
+    normalized = '&'.join(
+        f'{key}={value}'
+        for key in sorted(query_params)
+        for value in sorted(query_params.getlist(key))
+        if value != ''
+    )
+    digest = hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+    today = timezone.now().date().isoformat()
+    return f'reports:{report_name}:{user_id}:v{version}:{today}:{digest}'
+
+
+def cache_report(view_method):
+    """
+    Caches successful report responses per user, filter params and data version.
+    A hit costs one indexed lookup on UserDataVersion and never touches the
+    transaction tables; any change to the user's data bumps the version.
+    """
+    @wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        version, _ = get_data_version(request)
+        key = build_report_cache_key(
+            self.__class__.__name__, request.user.id, version, request.query_params
+        )
+
+        data = cache.get(key)
+        if data is not None:
+            return Response(data)
+
+        response = view_method(self, request, *args, **kwargs)
+        if response.status_code == 200:
+            cache.set(key, response.data, settings.REPORTS_CACHE_TIMEOUT)
+        return response
+
+    return wrapper
+
+
+def conditional_on_user_data(daily=False):
+    """
+    Answers If-None-Match / If-Modified-Since with 304 based on the user's data version,
+    before the wrapped handler runs any query. With daily=True the validators also change
+    at midnight, for responses whose default date range is relative to today.
+    """
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            version, changed_at = get_data_version(request)
+
+            tag = f'{request.user.id}-{version}'
+            if daily:
+                today = timezone.now().date()
+                tag = f'{tag}-{today.isoformat()}'
+                midnight = timezone.make_aware(datetime.combine(today, time.min))
+                changed_at = max(changed_at, midnight) if changed_at else midnight
+
+            etag = f'W/"{tag}"'
+            last_modified = int(changed_at.timestamp()) if changed_at else None
+
+            response = get_conditional_response(
+                request, etag=etag, last_modified=last_modified
+            )
+            if response is None:
+                response = view_method(self, request, *args, **kwargs)
+
+            if response.status_code in (200, 304):
+                response['ETag'] = etag
+                if last_modified is not None:
+                    response['Last-Modified'] = http_date(last_modified)
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,35 @@
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+EXPORT_COLUMNS = ['id', 'type', 'date', 'amount', 'category_name', 'description']
+
+
+class Echo:
+    """File-like object that returns what is written, for streaming csv.writer output."""
+
+    def write(self, value):
+        return value
+
+
+def stream_csv(rows):
+    writer = csv.writer(Echo())
+    yield writer.writerow(EXPORT_COLUMNS)
+    for row in rows:
+        yield writer.writerow([row[column] for column in EXPORT_COLUMNS])
+
+
+def stream_ndjson(rows):
+    for row in rows:
+        yield json.dumps(
+            {column: row[column] for column in EXPORT_COLUMNS},
+            cls=DjangoJSONEncoder,
+            ensure_ascii=False
+        ) + '\n'
+
+
+EXPORT_FORMATS = {
+    'csv': (stream_csv, 'text/csv', 'csv'),
+    'ndjson': (stream_ndjson, 'application/x-ndjson', 'ndjson'),
+}
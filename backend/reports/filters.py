@@ -11,6 +11,11 @@ class ReportFilter(django_filters.FilterSet):
         label='Transaction Type',
         method='filter_noop'
     )
+    granularity = django_filters.ChoiceFilter(
+        choices=[('day', 'Day'), ('week', 'Week'), ('month', 'Month')],
+        label='Time Bucket Size',
+        method='filter_noop'
+    )
 
     class Meta:
         model = Transaction
@@ -18,3 +23,10 @@ class ReportFilter(django_filters.FilterSet):
 
     def filter_noop(self, queryset, name, value):
         return queryset
+
+
+class ActivityReportFilter(ReportFilter):
+    search = django_filters.CharFilter(
+        label='Search descriptions (full-text prefix match)',
+        method='filter_noop'
+    )
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from reports.rollup import find_rollup_mismatches, rebuild_rollup
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds (or verifies with --verify) the per-user daily spending rollup table'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--verify',
+            action='store_true',
+            help='Only compare the rollup with the raw rows and report mismatches.'
+        )
+        parser.add_argument(
+            '--show',
+            type=int,
+            default=20,
+            help='Maximum number of mismatched buckets to print with --verify.'
+        )
+
+    def handle(self, *args, **options):
+        if not options['verify']:
+            count = rebuild_rollup()
+            self.stdout.write(self.style.SUCCESS(f"Rollup rebuilt: {count} daily buckets."))
+            return
+
+        mismatches = find_rollup_mismatches()
+        if not mismatches:
+            self.stdout.write(self.style.SUCCESS("Rollup is consistent."))
+            return
+
+        for row in mismatches[:options['show']]:
+            user_id, category_id, day, source, expected, actual, exp_count, act_count = row
+            self.stdout.write(
+                f"user={user_id} category={category_id} date={day} source={source}: "
+                f"expected {expected} ({exp_count}), stored {actual} ({act_count})"
+            )
+
+        raise CommandError(
+            f"Rollup has {len(mismatches)} inconsistent buckets. "
+            f"Run without --verify to rebuild it."
+        )
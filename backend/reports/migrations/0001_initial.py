@@ -0,0 +1,166 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:39
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+ROLLUP_FUNCTIONS_SQL = """
+CREATE OR REPLACE FUNCTION reports_apply_daily_spending(
+    p_user_id bigint, p_category_id bigint, p_date date, p_source varchar,
+    p_amount numeric, p_count integer
+) RETURNS void AS $$
+BEGIN
+    IF p_count > 0 THEN
+        INSERT INTO reports_dailyspending
+            (user_id, category_id, date, source, total_amount, transaction_count)
+        VALUES (p_user_id, p_category_id, p_date, p_source, p_amount, p_count)
+        ON CONFLICT ON CONSTRAINT reports_dailyspending_unique_bucket DO UPDATE SET
+            total_amount = reports_dailyspending.total_amount + EXCLUDED.total_amount,
+            transaction_count = reports_dailyspending.transaction_count + EXCLUDED.transaction_count;
+    ELSE
+        UPDATE reports_dailyspending SET
+            total_amount = total_amount + p_amount,
+            transaction_count = transaction_count + p_count
+        WHERE user_id = p_user_id AND date = p_date AND source = p_source
+            AND category_id IS NOT DISTINCT FROM p_category_id;
+
+        IF p_count < 0 THEN
+            DELETE FROM reports_dailyspending
+            WHERE user_id = p_user_id AND date = p_date AND source = p_source
+                AND category_id IS NOT DISTINCT FROM p_category_id
+                AND transaction_count <= 0;
+        END IF;
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION reports_transaction_rollup() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE'
+            AND OLD.owner_id = NEW.owner_id AND OLD.date = NEW.date
+            AND OLD.category_id IS NOT DISTINCT FROM NEW.category_id THEN
+        IF OLD.amount <> NEW.amount THEN
+            PERFORM reports_apply_daily_spending(
+                NEW.owner_id, NEW.category_id, NEW.date, 'personal', NEW.amount - OLD.amount, 0);
+        END IF;
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM reports_apply_daily_spending(
+            OLD.owner_id, OLD.category_id, OLD.date, 'personal', -OLD.amount, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM reports_apply_daily_spending(
+            NEW.owner_id, NEW.category_id, NEW.date, 'personal', NEW.amount, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION reports_sharedspentmember_rollup() RETURNS trigger AS $$
+DECLARE
+    spent RECORD;
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        SELECT date, category_id INTO spent
+        FROM splitting_sharedspent WHERE id = OLD.shared_spent_id;
+        IF FOUND THEN
+            PERFORM reports_apply_daily_spending(
+                OLD.user_id, spent.category_id, spent.date, 'shared', -OLD.amount, -1);
+        END IF;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        SELECT date, category_id INTO spent
+        FROM splitting_sharedspent WHERE id = NEW.shared_spent_id;
+        PERFORM reports_apply_daily_spending(
+            NEW.user_id, spent.category_id, spent.date, 'shared', NEW.amount, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION reports_sharedspent_rollup() RETURNS trigger AS $$
+DECLARE
+    member RECORD;
+BEGIN
+    FOR member IN
+        SELECT user_id, amount FROM splitting_sharedspentmember WHERE shared_spent_id = NEW.id
+    LOOP
+        PERFORM reports_apply_daily_spending(
+            member.user_id, OLD.category_id, OLD.date, 'shared', -member.amount, -1);
+        PERFORM reports_apply_daily_spending(
+            member.user_id, NEW.category_id, NEW.date, 'shared', member.amount, 1);
+    END LOOP;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER reports_transaction_rollup
+AFTER INSERT OR UPDATE OR DELETE ON transactions_transaction
+FOR EACH ROW EXECUTE FUNCTION reports_transaction_rollup();
+
+CREATE TRIGGER reports_sharedspentmember_rollup
+AFTER INSERT OR UPDATE OR DELETE ON splitting_sharedspentmember
+FOR EACH ROW EXECUTE FUNCTION reports_sharedspentmember_rollup();
+
+CREATE TRIGGER reports_sharedspent_rollup
+AFTER UPDATE OF date, category_id ON splitting_sharedspent
+FOR EACH ROW
+WHEN (OLD.date IS DISTINCT FROM NEW.date OR OLD.category_id IS DISTINCT FROM NEW.category_id)
+EXECUTE FUNCTION reports_sharedspent_rollup();
+"""
+
+DROP_ROLLUP_FUNCTIONS_SQL = """
+DROP TRIGGER IF EXISTS reports_sharedspent_rollup ON splitting_sharedspent;
+DROP TRIGGER IF EXISTS reports_sharedspentmember_rollup ON splitting_sharedspentmember;
+DROP TRIGGER IF EXISTS reports_transaction_rollup ON transactions_transaction;
+DROP FUNCTION IF EXISTS reports_sharedspent_rollup();
+DROP FUNCTION IF EXISTS reports_sharedspentmember_rollup();
+DROP FUNCTION IF EXISTS reports_transaction_rollup();
+DROP FUNCTION IF EXISTS reports_apply_daily_spending(bigint, bigint, date, varchar, numeric, integer);
+"""
+
+BACKFILL_SQL = """
+INSERT INTO reports_dailyspending
+    (user_id, category_id, date, source, total_amount, transaction_count)
+SELECT owner_id, category_id, date, 'personal', SUM(amount), COUNT(*)
+FROM transactions_transaction
+GROUP BY owner_id, category_id, date
+UNION ALL
+SELECT m.user_id, s.category_id, s.date, 'shared', SUM(m.amount), COUNT(*)
+FROM splitting_sharedspentmember m
+JOIN splitting_sharedspent s ON s.id = m.shared_spent_id
+GROUP BY m.user_id, s.category_id, s.date;
+"""
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('transactions', '0002_delete_budget'),
+        ('splitting', '0002_alter_sharedspentmember_amount_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailySpending',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('source', models.CharField(choices=[('personal', 'Personal'), ('shared', 'Shared')], max_length=8)),
+                ('total_amount', models.DecimalField(decimal_places=2, max_digits=14)),
+                ('transaction_count', models.IntegerField()),
+                ('category', models.ForeignKey(db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='transactions.category')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_spending', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('user', 'date', 'category', 'source'), name='reports_dailyspending_unique_bucket', nulls_distinct=False)],
+            },
+        ),
+        migrations.RunSQL(ROLLUP_FUNCTIONS_SQL, DROP_ROLLUP_FUNCTIONS_SQL),
+        migrations.RunSQL(BACKFILL_SQL, migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,128 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:42
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+VERSION_FUNCTIONS_SQL = """
+CREATE OR REPLACE FUNCTION reports_bump_data_versions(p_user_ids bigint[]) RETURNS void AS $$
+    INSERT INTO reports_userdataversion (user_id, version, changed_at)
+    SELECT user_id, 1, now()
+    FROM unnest(p_user_ids) AS user_id
+    WHERE user_id IS NOT NULL
+    GROUP BY user_id
+    ORDER BY user_id
+    ON CONFLICT (user_id) DO UPDATE SET
+        version = reports_userdataversion.version + 1,
+        changed_at = EXCLUDED.changed_at;
+$$ LANGUAGE sql;
+
+CREATE OR REPLACE FUNCTION reports_transaction_version() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM reports_bump_data_versions(ARRAY(SELECT owner_id FROM new_rows));
+    ELSIF TG_OP = 'UPDATE' THEN
+        PERFORM reports_bump_data_versions(ARRAY(
+            SELECT owner_id FROM new_rows UNION SELECT owner_id FROM old_rows));
+    ELSE
+        PERFORM reports_bump_data_versions(ARRAY(SELECT owner_id FROM old_rows));
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION reports_sharedspentmember_version() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM reports_bump_data_versions(ARRAY(SELECT user_id FROM new_rows));
+    ELSIF TG_OP = 'UPDATE' THEN
+        PERFORM reports_bump_data_versions(ARRAY(
+            SELECT user_id FROM new_rows UNION SELECT user_id FROM old_rows));
+    ELSE
+        PERFORM reports_bump_data_versions(ARRAY(SELECT user_id FROM old_rows));
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION reports_sharedspent_version() RETURNS trigger AS $$
+BEGIN
+    PERFORM reports_bump_data_versions(ARRAY(
+        SELECT m.user_id FROM splitting_sharedspentmember m
+        WHERE m.shared_spent_id IN (SELECT id FROM new_rows)));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION reports_category_version() RETURNS trigger AS $$
+BEGIN
+    PERFORM reports_bump_data_versions(ARRAY(SELECT owner_id FROM new_rows));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER reports_transaction_version_ins
+AFTER INSERT ON transactions_transaction REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION reports_transaction_version();
+CREATE TRIGGER reports_transaction_version_upd
+AFTER UPDATE ON transactions_transaction REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION reports_transaction_version();
+CREATE TRIGGER reports_transaction_version_del
+AFTER DELETE ON transactions_transaction REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION reports_transaction_version();
+
+CREATE TRIGGER reports_sharedspentmember_version_ins
+AFTER INSERT ON splitting_sharedspentmember REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION reports_sharedspentmember_version();
+CREATE TRIGGER reports_sharedspentmember_version_upd
+AFTER UPDATE ON splitting_sharedspentmember
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION reports_sharedspentmember_version();
+CREATE TRIGGER reports_sharedspentmember_version_del
+AFTER DELETE ON splitting_sharedspentmember REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION reports_sharedspentmember_version();
+
+CREATE TRIGGER reports_sharedspent_version_upd
+AFTER UPDATE ON splitting_sharedspent REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION reports_sharedspent_version();
+
+CREATE TRIGGER reports_category_version_upd
+AFTER UPDATE ON transactions_category REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION reports_category_version();
+"""
+
+DROP_VERSION_FUNCTIONS_SQL = """
+DROP TRIGGER IF EXISTS reports_category_version_upd ON transactions_category;
+DROP TRIGGER IF EXISTS reports_sharedspent_version_upd ON splitting_sharedspent;
+DROP TRIGGER IF EXISTS reports_sharedspentmember_version_del ON splitting_sharedspentmember;
+DROP TRIGGER IF EXISTS reports_sharedspentmember_version_upd ON splitting_sharedspentmember;
+DROP TRIGGER IF EXISTS reports_sharedspentmember_version_ins ON splitting_sharedspentmember;
+DROP TRIGGER IF EXISTS reports_transaction_version_del ON transactions_transaction;
+DROP TRIGGER IF EXISTS reports_transaction_version_upd ON transactions_transaction;
+DROP TRIGGER IF EXISTS reports_transaction_version_ins ON transactions_transaction;
+DROP FUNCTION IF EXISTS reports_category_version();
+DROP FUNCTION IF EXISTS reports_sharedspent_version();
+DROP FUNCTION IF EXISTS reports_sharedspentmember_version();
+DROP FUNCTION IF EXISTS reports_transaction_version();
+DROP FUNCTION IF EXISTS reports_bump_data_versions(bigint[]);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0001_initial'),
+        ('users', '0002_alter_profile_gender'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserDataVersion',
+            fields=[
+                ('user', models.OneToOneField(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='+', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('version', models.BigIntegerField(default=0)),
+                ('changed_at', models.DateTimeField()),
+            ],
+        ),
+        migrations.RunSQL(VERSION_FUNCTIONS_SQL, DROP_VERSION_FUNCTIONS_SQL),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:50
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0002_userdataversion'),
+        ('transactions', '0004_transaction_transaction_owner_date_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='dailyspending',
+            index=models.Index(fields=['user', 'category', 'date'], name='rollup_user_cat_date_idx'),
+        ),
+    ]
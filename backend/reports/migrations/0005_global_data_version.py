@@ -0,0 +1,34 @@
+from django.db import migrations
+
+# Standard categories have no owner: their changes bump the shared row of user id 0,
+# which every user's data version includes (see reports.cache.get_data_version).
+CATEGORY_VERSION_SQL = """
+CREATE OR REPLACE FUNCTION reports_category_version() RETURNS trigger AS $$
+BEGIN
+    PERFORM reports_bump_data_versions(ARRAY(SELECT COALESCE(owner_id, 0) FROM new_rows));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+PREVIOUS_CATEGORY_VERSION_SQL = """
+CREATE OR REPLACE FUNCTION reports_category_version() RETURNS trigger AS $$
+BEGIN
+    PERFORM reports_bump_data_versions(ARRAY(SELECT owner_id FROM new_rows));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DELETE FROM reports_userdataversion WHERE user_id = 0;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0004_drop_dailyspending_user_index'),
+    ]
+
+    operations = [
+        migrations.RunSQL(CATEGORY_VERSION_SQL, PREVIOUS_CATEGORY_VERSION_SQL),
+    ]
@@ -0,0 +1,45 @@
+from django.db import migrations
+
+# A personal category can be used by its owner's shared spents, so its changes also show
+# up in the reports of everyone taking part in them.
+CATEGORY_VERSION_SQL = """
+CREATE OR REPLACE FUNCTION reports_category_version() RETURNS trigger AS $$
+BEGIN
+    PERFORM reports_bump_data_versions(ARRAY(
+        SELECT COALESCE(owner_id, 0) FROM new_rows
+        UNION
+        SELECT m.user_id
+        FROM new_rows c
+        JOIN splitting_sharedspent s ON s.category_id = c.id
+        JOIN splitting_sharedspentmember m ON m.shared_spent_id = s.id
+        WHERE c.owner_id IS NOT NULL
+        UNION
+        SELECT s.owner_id
+        FROM new_rows c
+        JOIN splitting_sharedspent s ON s.category_id = c.id
+        WHERE c.owner_id IS NOT NULL));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+PREVIOUS_CATEGORY_VERSION_SQL = """
+CREATE OR REPLACE FUNCTION reports_category_version() RETURNS trigger AS $$
+BEGIN
+    PERFORM reports_bump_data_versions(ARRAY(SELECT COALESCE(owner_id, 0) FROM new_rows));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0005_global_data_version'),
+        ('splitting', '0007_drop_sharedspentmember_user_index'),
+    ]
+
+    operations = [
+        migrations.RunSQL(CATEGORY_VERSION_SQL, PREVIOUS_CATEGORY_VERSION_SQL),
+    ]
@@ -0,0 +1,76 @@
+from django.db import models
+
+from users.models import CustomUser
+from transactions.models import Category
+
+
+class DailySpending(models.Model):
+    """
+    Per-user daily totals by category and source (personal/shared).
+    Maintained by database triggers on Transaction, SharedSpent and
+    SharedSpentMember (see migration 0001), so bulk writes are covered too.
+    """
+
+    class Source(models.TextChoices):
+        PERSONAL = 'personal', 'Personal'
+        SHARED = 'shared', 'Shared'
+
+    # Covered by the unique bucket constraint and rollup_user_cat_date_idx, both led by user.
+    user = models.ForeignKey(
+        CustomUser,
+        on_delete=models.CASCADE,
+        related_name='daily_spending',
+        db_index=False
+    )
+    category = models.ForeignKey(
+        Category,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        related_name='+'
+    )
+    date = models.DateField()
+    source = models.CharField(max_length=8, choices=Source.choices)
+    total_amount = models.DecimalField(max_digits=14, decimal_places=2)
+    transaction_count = models.IntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'date', 'category', 'source'],
+                name='reports_dailyspending_unique_bucket',
+                nulls_distinct=False
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=['user', 'category', 'date'], name='rollup_user_cat_date_idx'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} - {self.source} {self.total_amount} on {self.date}"
+
+
+# UserDataVersion row bumped when a standard category changes; it has no user behind it.
+GLOBAL_DATA_VERSION_ID = 0
+
+
+class UserDataVersion(models.Model):
+    """
+    Monotonic per-user counter bumped by database triggers whenever the user's
+    transactions, shared parts or categories change. Used to key cached report responses.
+    Standard category changes bump the row of GLOBAL_DATA_VERSION_ID instead.
+    """
+    user = models.OneToOneField(
+        CustomUser,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        primary_key=True,
+        related_name='+'
+    )
+    version = models.BigIntegerField(default=0)
+    changed_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.user_id} v{self.version}"
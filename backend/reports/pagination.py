@@ -0,0 +1,118 @@
+from base64 import b64decode, b64encode
+from datetime import date
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, _positive_int
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class ActivityCursorPagination(BasePagination):
+    """
+    Keyset pagination for the merged personal/shared activity feed.
+    The cursor is the (date, type, id) of the last row of the previous page.
+    """
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    page_size = 50
+    max_page_size = 500
+    invalid_cursor_message = 'Invalid cursor'
+
+    def get_page_size(self, request):
+        try:
+            return _positive_int(
+                request.query_params[self.page_size_query_param],
+                strict=True,
+                cutoff=self.max_page_size
+            )
+        except (KeyError, ValueError):
+            return self.page_size
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+
+        try:
+            raw = b64decode(encoded.encode('ascii')).decode('ascii')
+            date_str, entry_type, entry_id = raw.split('|')
+            if entry_type not in ('personal', 'shared'):
+                raise ValueError(entry_type)
+            return date.fromisoformat(date_str), entry_type, int(entry_id)
+        except (TypeError, ValueError, UnicodeDecodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, position):
+        entry_date, entry_type, entry_id = position
+        raw = f'{entry_date.isoformat()}|{entry_type}|{entry_id}'
+        encoded = b64encode(raw.encode('ascii')).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def paginate_feed(self, rows_fetcher, request, base_url=None):
+        """
+        rows_fetcher(cursor, limit) must return up to `limit` feed rows ordered
+        newest first; one extra row is requested to detect the next page.
+        `base_url` overrides the endpoint the `next` link points to.
+        """
+        self.base_url = request.build_absolute_uri()
+        if base_url is not None:
+            query = request.GET.urlencode()
+            self.base_url = f'{base_url}?{query}' if query else base_url
+        self.page_size = self.get_page_size(request)
+        cursor = self.decode_cursor(request)
+
+        rows = list(rows_fetcher(cursor, self.page_size + 1))
+        self.has_next = len(rows) > self.page_size
+        self.page = rows[:self.page_size]
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        last = self.page[-1]
+        return self.encode_cursor((last['date'], last['type'], last['id']))
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'results': data
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {
+                    'type': 'string',
+                    'nullable': True,
+                    'format': 'uri',
+                },
+                'results': schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                'name': self.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'The pagination cursor value.',
+                'schema': {'type': 'string'},
+            },
+            {
+                'name': self.page_size_query_param,
+                'required': False,
+                'in': 'query',
+                'description': f'Number of results to return per page (max {self.max_page_size}).',
+                'schema': {'type': 'integer'},
+            },
+        ]
+
+
+class DashboardActivityPagination(ActivityCursorPagination):
+    """
+    Short first page for the dashboard; `next` continues on the activity endpoint.
+    """
+    page_size = 10
@@ -0,0 +1,56 @@
+from django.db import connection, transaction
+
+EXPECTED_ROLLUP_SQL = """
+    SELECT owner_id AS user_id, category_id, date, 'personal' AS source,
+           SUM(amount) AS total_amount, COUNT(*) AS transaction_count
+    FROM transactions_transaction
+    GROUP BY owner_id, category_id, date
+    UNION ALL
+    SELECT m.user_id, s.category_id, s.date, 'shared',
+           SUM(m.amount), COUNT(*)
+    FROM splitting_sharedspentmember m
+    JOIN splitting_sharedspent s ON s.id = m.shared_spent_id
+    GROUP BY m.user_id, s.category_id, s.date
+"""
+
+REBUILD_ROLLUP_SQL = f"""
+    INSERT INTO reports_dailyspending
+        (user_id, category_id, date, source, total_amount, transaction_count)
+    {EXPECTED_ROLLUP_SQL}
+"""
+
+ROLLUP_DIFF_SQL = f"""
+    SELECT COALESCE(e.user_id, a.user_id), COALESCE(e.category_id, a.category_id),
+           COALESCE(e.date, a.date), COALESCE(e.source, a.source),
+           e.total_amount, a.total_amount, e.transaction_count, a.transaction_count
+    FROM ({EXPECTED_ROLLUP_SQL}) AS e
+    FULL OUTER JOIN reports_dailyspending a
+        ON a.user_id = e.user_id AND a.date = e.date AND a.source = e.source
+        AND a.category_id IS NOT DISTINCT FROM e.category_id
+    WHERE e.user_id IS NULL OR a.user_id IS NULL
+        OR e.total_amount <> a.total_amount OR e.transaction_count <> a.transaction_count
+    ORDER BY 1, 3
+"""
+
+
+def find_rollup_mismatches():
+    """
+    Compares reports_dailyspending with totals computed from the raw rows.
+    Returns rows of (user_id, category_id, date, source,
+    expected_total, actual_total, expected_count, actual_count).
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(ROLLUP_DIFF_SQL)
+        return cursor.fetchall()
+
+
+def rebuild_rollup():
+    """
+    Recomputes the whole rollup table from Transaction and SharedSpentMember rows.
+    The table is locked for the duration so concurrent writes wait for the rebuild.
+    """
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute('LOCK TABLE reports_dailyspending IN EXCLUSIVE MODE')
+        cursor.execute('DELETE FROM reports_dailyspending')
+        cursor.execute(REBUILD_ROLLUP_SQL)
+        return cursor.rowcount
@@ -0,0 +1,144 @@
+from decimal import Decimal
+
+from django.db import connection
+from django.db.models import CharField, DateField, F, Q, Sum, Value
+from django.db.models.functions import Coalesce, Trunc
+
+TIME_SERIES_SQL = """
+    SELECT series.bucket::date AS bucket, COALESCE(SUM(data.total), 0) AS total_amount
+    FROM generate_series(
+        date_trunc(%s, %s::date), %s::date, %s::interval
+    ) AS series(bucket)
+    LEFT JOIN ({data}) AS data(bucket, total) ON data.bucket::date = series.bucket::date
+    GROUP BY series.bucket
+    ORDER BY series.bucket
+"""
+
+FEED_FIELDS = (
+    'entry_id', 'entry_type', 'entry_amount', 'entry_date', 'entry_category', 'entry_description'
+)
+
+
+def _feed_after_cursor(qs, entry_type, cursor):
+    # Feed order is (date, type, id) descending, so 'shared' rows precede
+    # 'personal' ones on the same day.
+    if cursor is None:
+        return qs
+
+    c_date, c_type, c_id = cursor
+    if entry_type == c_type:
+        return qs.filter(Q(date__lt=c_date) | Q(date=c_date, id__lt=c_id))
+    if entry_type < c_type:
+        return qs.filter(date__lte=c_date)
+    return qs.filter(date__lt=c_date)
+
+
+def _feed_rows(qs, entry_type, cursor, limit):
+    return _feed_after_cursor(qs, entry_type, cursor).annotate(
+        entry_id=F('id'),
+        entry_type=Value(entry_type, output_field=CharField()),
+        entry_amount=F('amount'),
+        entry_date=F('date'),
+        entry_category=F('cat_name'),
+        entry_description=F('description')
+    ).values(*FEED_FIELDS).order_by('-entry_date', '-entry_id')[:limit]
+
+
+def get_activity_feed(personal_qs, shared_qs, cursor=None, limit=50):
+    """
+    Returns up to `limit` feed entries after `cursor`, newest first.
+    Both sources are merged by a single UNION ALL query; each side is limited
+    on its own so only the top of the (owner, date) index is read.
+    """
+    sides = [
+        _feed_rows(qs, entry_type, cursor, limit)
+        for qs, entry_type in ((personal_qs, 'personal'), (shared_qs, 'shared'))
+        if not qs.query.is_empty()
+    ]
+    if not sides:
+        return []
+
+    if len(sides) == 1:
+        combined = sides[0]
+    else:
+        combined = sides[0].union(sides[1], all=True).order_by(
+            '-entry_date', '-entry_type', '-entry_id'
+        )[:limit]
+
+    return [
+        {
+            'id': row['entry_id'],
+            'source_id': row['entry_id'],
+            'type': row['entry_type'],
+            'amount': row['entry_amount'],
+            'date': row['entry_date'],
+            'category_name': row['entry_category'] or 'Other',
+            'description': row['entry_description']
+        }
+        for row in combined
+    ]
+
+
+def iter_activity_feed(personal_qs, shared_qs, batch_size=2000):
+    """
+    Yields every feed entry newest first, fetching keyset batches of `batch_size`
+    rows so memory stays constant regardless of history length.
+    """
+    cursor = None
+    while True:
+        batch = get_activity_feed(personal_qs, shared_qs, cursor, batch_size)
+        yield from batch
+
+        if len(batch) < batch_size:
+            return
+        last = batch[-1]
+        cursor = (last['date'], last['type'], last['id'])
+
+
+def get_category_breakdown(rollup_qs):
+    """
+    Aggregates the daily rollup per category in one grouped query and
+    returns (total_spent, breakdown) with exact Decimal sums.
+    """
+    rows = rollup_qs.order_by().annotate(
+        cat_name=Coalesce('category__name', Value('Other'))
+    ).values('cat_name').annotate(
+        total=Sum('total_amount'), count=Sum('transaction_count')
+    ).order_by('-total')
+
+    rows = list(rows)
+    total_spent = sum((row['total'] for row in rows), Decimal('0'))
+
+    breakdown = []
+    for row in rows:
+        percent = (row['total'] / total_spent * 100) if total_spent > 0 else 0
+        breakdown.append({
+            'category': row['cat_name'],
+            'total_amount': row['total'],
+            'percentage': round(float(percent), 2),
+            'transaction_count': row['count']
+        })
+
+    return total_spent, breakdown
+
+
+def get_time_series(rollup_qs, date_from, date_to, granularity='day'):
+    """
+    Sums spending per day/week/month between date_from and date_to.
+    Bucketing and gap filling (generate_series) are done by PostgreSQL in one query,
+    which reads only the rollup rows inside the period.
+    """
+    data = rollup_qs.filter(date__range=(date_from, date_to)).order_by().annotate(
+        bucket=Trunc('date', granularity, output_field=DateField())
+    ).values('bucket').annotate(total=Sum('total_amount'))
+
+    data_sql, data_params = data.query.sql_with_params()
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            TIME_SERIES_SQL.format(data=data_sql),
+            [granularity, date_from, date_to, f'1 {granularity}', *data_params]
+        )
+        rows = cursor.fetchall()
+
+    return [{'date': bucket, 'total_amount': total} for bucket, total in rows]
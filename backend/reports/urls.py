@@ -1,8 +1,13 @@
 from django.urls import path
-from .views import ActivityReportView, CategorySummaryView, OverTimeReportView
+from .views import (
+    ActivityReportView, ActivityExportView, CategorySummaryView, DashboardReportView,
+    OverTimeReportView
+)
 
 urlpatterns = [
     path('activity/', ActivityReportView.as_view(), name='activity-report'),
+    path('activity/export/', ActivityExportView.as_view(), name='activity-export'),
     path('by-category/', CategorySummaryView.as_view(), name='category-report'),
     path('over-time/', OverTimeReportView.as_view(), name='time-report'),
+    path('dashboard/', DashboardReportView.as_view(), name='dashboard-report'),
 ]
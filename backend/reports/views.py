@@ -1,27 +1,44 @@
 from rest_framework import generics
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django.db.models import Sum, F, Value, CharField
-from datetime import datetime, timedelta
+from datetime import timedelta
+from django.http import StreamingHttpResponse
+from django.urls import reverse
 from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
+from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema, OpenApiParameter, inline_serializer
 from rest_framework import serializers
 
-from .filters import ReportFilter
+from .filters import ActivityReportFilter, ReportFilter
 from transactions.models import Transaction
+from transactions.search import search_descriptions
 from splitting.models import SharedSpentMember
+from .models import DailySpending
 from .serializers import (
     UnifiedTransactionSerializer,
     CategorySummarySerializer,
     TimeSeriesSerializer
 )
+from .cache import cache_report, conditional_on_user_data
+from .exports import EXPORT_FORMATS
+from .pagination import ActivityCursorPagination, DashboardActivityPagination
+from .services import (
+    get_activity_feed,
+    get_category_breakdown,
+    get_time_series,
+    iter_activity_feed
+)
 
 
 class BaseReportView(generics.GenericAPIView):
     """
     Base view containing common logic for filtering and aggregating data
     from both Transaction (personal) and SharedSpentMember (shared) models.
+    Aggregated reports read the DailySpending rollup instead of raw rows, and
+    responses are cached and ETag-validated per user data version (see reports.cache).
     """
     permission_classes = [IsAuthenticated]
 
@@ -30,20 +47,37 @@ class BaseReportView(generics.GenericAPIView):
 
     queryset = Transaction.objects.none()
 
+    def get_report_params(self, request):
+        """
+        Cleaned ReportFilter params, parsed once per request.
+        """
+        if not hasattr(self, 'report_params'):
+            filterset = self.filterset_class(request.GET, queryset=Transaction.objects.none())
+            self.report_params = filterset.form.cleaned_data if filterset.is_valid() else {}
+        return self.report_params
+
+    def get_report_period(self, request):
+        """
+        (date_from, date_to) for time-based reports; defaults to the last 30 days.
+        """
+        params = self.get_report_params(request)
+        d_to = params.get('date_to') or timezone.now().date()
+        d_from = params.get('date_from') or d_to - timedelta(days=30)
+        return d_from, d_to
+
     def get_filtered_querysets(self, request):
+        """
+        Raw personal and shared rows matching the filter (used for row-level feeds).
+        """
         user = request.user
 
-        filterset = self.filterset_class(request.GET, queryset=Transaction.objects.none())
-
-        if filterset.is_valid():
-            params = filterset.form.cleaned_data
-        else:
-            params = {}
+        params = self.get_report_params(request)
 
         date_from = params.get('date_from')
         date_to = params.get('date_to')
         category_val = params.get('category')
         report_type = params.get('type')
+        search = params.get('search')
 
         show_personal = report_type in [None, '', 'personal']
         show_shared = report_type in [None, '', 'shared']
@@ -65,68 +99,125 @@ class BaseReportView(generics.GenericAPIView):
             personal_qs = personal_qs.filter(category_id=cat_id)
             shared_qs = shared_qs.filter(shared_spent__category_id=cat_id)
 
-        if show_personal:
-            personal_qs = personal_qs.annotate(
-                report_type=Value('personal', output_field=CharField()),
-                cat_name=F('category__name')
-            )
+        if search:
+            personal_qs = search_descriptions(personal_qs, search)
+            shared_qs = search_descriptions(shared_qs, search, field='shared_spent__description')
 
-        if show_shared:
-            shared_qs = shared_qs.annotate(
-                report_type=Value('shared', output_field=CharField()),
-                date=F('shared_spent__date'),
-                cat_name=F('shared_spent__category__name'),
-                description=F('shared_spent__description')
-            )
+        personal_qs = personal_qs.annotate(
+            report_type=Value('personal', output_field=CharField()),
+            cat_name=F('category__name')
+        )
+
+        shared_qs = shared_qs.annotate(
+            report_type=Value('shared', output_field=CharField()),
+            date=F('shared_spent__date'),
+            cat_name=F('shared_spent__category__name'),
+            description=F('shared_spent__description')
+        )
 
         return personal_qs, shared_qs
 
+    def get_rollup_queryset(self, request):
+        """
+        Daily rollup buckets matching the filter (used for aggregated reports).
+        """
+        params = self.get_report_params(request)
+
+        rollup_qs = DailySpending.objects.filter(user=request.user)
+
+        if params.get('date_from'):
+            rollup_qs = rollup_qs.filter(date__gte=params['date_from'])
+
+        if params.get('date_to'):
+            rollup_qs = rollup_qs.filter(date__lte=params['date_to'])
+
+        category_val = params.get('category')
+        if category_val:
+            cat_id = category_val.id if hasattr(category_val, 'id') else category_val
+            rollup_qs = rollup_qs.filter(category_id=cat_id)
+
+        if params.get('type') in ('personal', 'shared'):
+            rollup_qs = rollup_qs.filter(source=params['type'])
+
+        return rollup_qs
+
 
 class ActivityReportView(BaseReportView):
     """
     Endpoint for retrieving a chronological feed of all financial activities.
     """
+    pagination_class = ActivityCursorPagination
+    filterset_class = ActivityReportFilter
 
     @extend_schema(
         summary="Get Activity Feed",
         description=(
-                "Returns a combined list of personal transactions and shared expenses "
-                "sorted by date (descending). Supports filtering by date range, category, and type."
+                "Returns a combined, cursor-paginated list of personal transactions and "
+                "shared expenses sorted by date (descending). Supports filtering by date range, "
+                "category, type and a description `search`. Follow `next` to load older entries."
         ),
         responses={200: UnifiedTransactionSerializer(many=True)},
         tags=["Reports"]
     )
+    @conditional_on_user_data(daily=True)
+    @cache_report
     def get(self, request, *args, **kwargs):
         personal_qs, shared_qs = self.get_filtered_querysets(request)
 
-        combined_data = []
+        page = self.paginator.paginate_feed(
+            lambda cursor, limit: get_activity_feed(personal_qs, shared_qs, cursor, limit),
+            request
+        )
 
-        for t in personal_qs:
-            combined_data.append({
-                'id': t.id,
-                'source_id': t.id,
-                'type': 'personal',
-                'amount': t.amount,
-                'date': t.date,
-                'category_name': t.cat_name or 'Other',
-                'description': t.description
-            })
+        serializer = UnifiedTransactionSerializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
 
-        for s in shared_qs:
-            combined_data.append({
-                'id': s.id,
-                'source_id': s.id,
-                'type': 'shared',
-                'amount': s.amount,
-                'date': s.date,
-                'category_name': s.cat_name or 'Other',
-                'description': s.description
-            })
 
-        combined_data.sort(key=lambda x: x['date'], reverse=True)
+class ActivityExportView(BaseReportView):
+    """
+    Endpoint for exporting the full activity history as a streamed file.
+    """
+    filterset_class = ActivityReportFilter
+    export_batch_size = 2000
 
-        serializer = UnifiedTransactionSerializer(combined_data, many=True)
-        return Response(serializer.data)
+    @extend_schema(
+        summary="Export Activity Feed",
+        description=(
+                "Streams every personal transaction and shared expense matching the filters "
+                "as CSV or NDJSON, newest first. Rows are read from the database in batches, "
+                "so memory use does not grow with the size of the history."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name='export_format',
+                type=str,
+                enum=list(EXPORT_FORMATS),
+                default='csv',
+                description='Output format.'
+            )
+        ],
+        responses={
+            (200, 'text/csv'): OpenApiTypes.STR,
+            (200, 'application/x-ndjson'): OpenApiTypes.STR
+        },
+        tags=["Reports"]
+    )
+    def get(self, request, *args, **kwargs):
+        export_format = request.query_params.get('export_format') or 'csv'
+        if export_format not in EXPORT_FORMATS:
+            raise ValidationError(
+                {"export_format": f"Choose one of: {', '.join(EXPORT_FORMATS)}."}
+            )
+
+        personal_qs, shared_qs = self.get_filtered_querysets(request)
+        stream, content_type, extension = EXPORT_FORMATS[export_format]
+
+        response = StreamingHttpResponse(
+            stream(iter_activity_feed(personal_qs, shared_qs, self.export_batch_size)),
+            content_type=content_type
+        )
+        response['Content-Disposition'] = f'attachment; filename="activity.{extension}"'
+        return response
 
 
 class CategorySummaryView(BaseReportView):
@@ -137,7 +228,10 @@ class CategorySummaryView(BaseReportView):
 
     @extend_schema(
         summary="Get Expenses by Category",
-        description="Aggregates expenses by category and calculates percentages for the selected period.",
+        description=(
+                "Aggregates expenses by category from the daily rollup and "
+                "calculates percentages and transaction counts for the selected period."
+        ),
         responses={
             200: inline_serializer(
                 name='CategoryReportResponse',
@@ -149,35 +243,12 @@ class CategorySummaryView(BaseReportView):
         },
         tags=["Reports"]
     )
+    @conditional_on_user_data(daily=True)
+    @cache_report
     def get(self, request, *args, **kwargs):
-        personal_qs, shared_qs = self.get_filtered_querysets(request)
+        rollup_qs = self.get_rollup_queryset(request)
 
-        category_totals = {}
-        total_period_spent = 0
-
-        for t in personal_qs:
-            cat = t.cat_name or 'Other'
-            amount = float(t.amount)
-            category_totals[cat] = category_totals.get(cat, 0) + amount
-            total_period_spent += amount
-
-        for s in shared_qs:
-            cat = s.cat_name or 'Other'
-            amount = float(s.amount)
-            category_totals[cat] = category_totals.get(cat, 0) + amount
-            total_period_spent += amount
-
-        result_data = []
-        for cat, amount in category_totals.items():
-            percent = (amount / total_period_spent * 100) if total_period_spent > 0 else 0
-            result_data.append({
-                'category': cat,
-                'total_amount': amount,
-                'percentage': round(percent, 2),
-                'transaction_count': 0
-            })
-
-        result_data.sort(key=lambda x: x['total_amount'], reverse=True)
+        total_period_spent, result_data = get_category_breakdown(rollup_qs)
 
         return Response({
             "total_spent": total_period_spent,
@@ -187,50 +258,91 @@ class CategorySummaryView(BaseReportView):
 
 class OverTimeReportView(BaseReportView):
     """
-    Endpoint for retrieving daily spending dynamics.
+    Endpoint for retrieving daily, weekly or monthly spending dynamics.
     Ideal for Line Charts.
     """
 
     @extend_schema(
         summary="Get Spending Over Time",
-        description="Returns total daily spending for the selected period. Fills missing days with 0.0.",
+        description=(
+                "Returns total spending per day, week or month (`granularity`) for the selected "
+                "period. Buckets and gap filling are computed by the database; "
+                "empty buckets are returned as 0.0."
+        ),
         responses={200: TimeSeriesSerializer(many=True)},
         tags=["Reports"]
     )
+    @conditional_on_user_data(daily=True)
+    @cache_report
     def get(self, request, *args, **kwargs):
-        personal_qs, shared_qs = self.get_filtered_querysets(request)
+        rollup_qs = self.get_rollup_queryset(request)
+
+        d_from, d_to = self.get_report_period(request)
+        granularity = self.report_params.get('granularity') or 'day'
 
-        daily_totals = {}
+        result_list = get_time_series(rollup_qs, d_from, d_to, granularity)
 
-        for t in personal_qs:
-            date_str = t.date.isoformat()
-            daily_totals[date_str] = daily_totals.get(date_str, 0) + float(t.amount)
+        return Response(TimeSeriesSerializer(result_list, many=True).data)
 
-        for s in shared_qs:
-            date_str = s.date.isoformat()
-            daily_totals[date_str] = daily_totals.get(date_str, 0) + float(s.amount)
 
-        filterset = self.filterset_class(request.GET, queryset=Transaction.objects.none())
-        d_from, d_to = None, None
+class DashboardReportView(BaseReportView):
+    """
+    Endpoint combining the activity feed, category breakdown and time series
+    for the dashboard screen in a single request.
+    """
+    pagination_class = DashboardActivityPagination
 
-        if filterset.is_valid():
-            d_from = filterset.form.cleaned_data.get('date_from')
-            d_to = filterset.form.cleaned_data.get('date_to')
+    @extend_schema(
+        summary="Get Dashboard",
+        description=(
+                "Returns the first page of the activity feed, the category breakdown, the "
+                "spending time series and the period total in one response. The filter is "
+                "parsed once and the aggregates are read from the daily rollup, so a dashboard "
+                "open costs three small queries instead of three full report requests."
+        ),
+        responses={
+            200: inline_serializer(
+                name='DashboardResponse',
+                fields={
+                    'total_spent': serializers.DecimalField(max_digits=12, decimal_places=2),
+                    'breakdown': CategorySummarySerializer(many=True),
+                    'time_series': TimeSeriesSerializer(many=True),
+                    'activity': inline_serializer(
+                        name='DashboardActivity',
+                        fields={
+                            'next': serializers.URLField(allow_null=True),
+                            'results': UnifiedTransactionSerializer(many=True)
+                        }
+                    )
+                }
+            )
+        },
+        tags=["Reports"]
+    )
+    @conditional_on_user_data(daily=True)
+    @cache_report
+    def get(self, request, *args, **kwargs):
+        personal_qs, shared_qs = self.get_filtered_querysets(request)
+        rollup_qs = self.get_rollup_queryset(request)
 
-        if not d_to:
-            d_to = timezone.now().date()
-        if not d_from:
-            d_from = d_to - timedelta(days=30)
+        d_from, d_to = self.get_report_period(request)
+        granularity = self.report_params.get('granularity') or 'day'
 
-        result_list = []
-        delta = d_to - d_from
+        total_period_spent, breakdown = get_category_breakdown(rollup_qs)
+        time_series = get_time_series(rollup_qs, d_from, d_to, granularity)
 
-        for i in range(delta.days + 1):
-            day = d_from + timedelta(days=i)
-            day_str = day.isoformat()
-            result_list.append({
-                'date': day,
-                'total_amount': daily_totals.get(day_str, 0.0)
-            })
+        page = self.paginator.paginate_feed(
+            lambda cursor, limit: get_activity_feed(personal_qs, shared_qs, cursor, limit),
+            request,
+            base_url=request.build_absolute_uri(reverse('activity-report'))
+        )
 
-        return Response(TimeSeriesSerializer(result_list, many=True).data)
\ No newline at end of file
+        return Response({
+            "total_spent": total_period_spent,
+            "breakdown": CategorySummarySerializer(breakdown, many=True).data,
+            "time_series": TimeSeriesSerializer(time_series, many=True).data,
+            "activity": {
+                "next": self.paginator.get_next_link(),
+                "results": UnifiedTransactionSerializer(page, many=True).data
+            }
+        })
@@ -29,7 +29,7 @@ class FriendshipViewSet(viewsets.ViewSet):
         user = request.user
         friendships = Friendship.objects.filter(
             (Q(from_user=user) | Q(to_user=user)) & Q(status=Friendship.Status.ACCEPTED)
-        ).distinct()
+        ).select_related('from_user', 'to_user')
 
         serializer = FriendshipSerializer(friendships, many=True)
         return Response(serializer.data)
@@ -94,7 +94,7 @@ class FriendshipViewSet(viewsets.ViewSet):
         requests = Friendship.objects.filter(
             to_user=request.user,
             status=Friendship.Status.PENDING
-        )
+        ).select_related('from_user', 'to_user')
         serializer = FriendshipSerializer(requests, many=True)
         return Response(serializer.data)
 
@@ -108,7 +108,7 @@ class FriendshipViewSet(viewsets.ViewSet):
         requests = Friendship.objects.filter(
             from_user=request.user,
             status=Friendship.Status.PENDING
-        )
+        ).select_related('from_user', 'to_user')
         serializer = FriendshipSerializer(requests, many=True)
         return Response(serializer.data)
 
@@ -0,0 +1,55 @@
+from django.db import connection, transaction
+
+EXPECTED_BALANCES_SQL = """
+    SELECT user_id, counterparty_id, SUM(amount) AS amount
+    FROM (
+        SELECT s.owner_id AS user_id, m.user_id AS counterparty_id, m.amount
+        FROM splitting_sharedspentmember m
+        JOIN splitting_sharedspent s ON s.id = m.shared_spent_id
+        WHERE NOT m.is_owner_part AND m.user_id <> s.owner_id
+        UNION ALL
+        SELECT m.user_id, s.owner_id, -m.amount
+        FROM splitting_sharedspentmember m
+        JOIN splitting_sharedspent s ON s.id = m.shared_spent_id
+        WHERE NOT m.is_owner_part AND m.user_id <> s.owner_id
+    ) AS entries
+    GROUP BY user_id, counterparty_id
+    HAVING SUM(amount) <> 0
+"""
+
+REBUILD_BALANCES_SQL = f"""
+    INSERT INTO splitting_pairbalance (user_id, counterparty_id, amount, updated_at)
+    SELECT user_id, counterparty_id, amount, now() FROM ({EXPECTED_BALANCES_SQL}) AS expected
+"""
+
+BALANCES_DIFF_SQL = f"""
+    SELECT COALESCE(e.user_id, a.user_id), COALESCE(e.counterparty_id, a.counterparty_id),
+           e.amount, a.amount
+    FROM ({EXPECTED_BALANCES_SQL}) AS e
+    FULL OUTER JOIN splitting_pairbalance a
+        ON a.user_id = e.user_id AND a.counterparty_id = e.counterparty_id
+    WHERE e.user_id IS NULL OR a.user_id IS NULL OR e.amount <> a.amount
+    ORDER BY 1, 2
+"""
+
+
+def find_balance_mismatches():
+    """
+    Compares splitting_pairbalance with balances computed from the shared spent members.
+    Returns rows of (user_id, counterparty_id, expected_amount, actual_amount).
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(BALANCES_DIFF_SQL)
+        return cursor.fetchall()
+
+
+def rebuild_balances():
+    """
+    Recomputes the whole balance ledger from SharedSpentMember rows.
+    The table is locked for the duration so concurrent writes wait for the rebuild.
+    """
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute('LOCK TABLE splitting_pairbalance IN EXCLUSIVE MODE')
+        cursor.execute('DELETE FROM splitting_pairbalance')
+        cursor.execute(REBUILD_BALANCES_SQL)
+        return cursor.rowcount
@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from splitting.balances import find_balance_mismatches, rebuild_balances
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds (or verifies with --verify) the pairwise balance ledger of shared spents'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--verify',
+            action='store_true',
+            help='Only compare the ledger with the shared spent members and report mismatches.'
+        )
+        parser.add_argument(
+            '--show',
+            type=int,
+            default=20,
+            help='Maximum number of mismatched pairs to print with --verify.'
+        )
+
+    def handle(self, *args, **options):
+        if not options['verify']:
+            count = rebuild_balances()
+            self.stdout.write(self.style.SUCCESS(f"Ledger rebuilt: {count} balances."))
+            return
+
+        mismatches = find_balance_mismatches()
+        if not mismatches:
+            self.stdout.write(self.style.SUCCESS("Ledger is consistent."))
+            return
+
+        for user_id, counterparty_id, expected, actual in mismatches[:options['show']]:
+            self.stdout.write(
+                f"user={user_id} counterparty={counterparty_id}: "
+                f"expected {expected}, stored {actual}"
+            )
+
+        raise CommandError(
+            f"Ledger has {len(mismatches)} inconsistent balances. "
+            f"Run without --verify to rebuild it."
+        )
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('splitting', '0002_alter_sharedspentmember_amount_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sharedspent',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='sharedspentmember',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:50
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('splitting', '0003_sharedspent_updated_at_sharedspentmember_updated_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='sharedspentmember',
+            index=models.Index(fields=['user', 'shared_spent'], include=('amount',), name='sharedmember_user_spent_idx'),
+        ),
+    ]
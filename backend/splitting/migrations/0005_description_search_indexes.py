@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:58
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+TRIGRAM_INDEX = 'sharedspent_desc_trgm_idx'
+
+
+def create_trigram_index(apps, schema_editor):
+    # transactions 0005 installs pg_trgm where the server provides it.
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        if cursor.fetchone() is None:
+            return
+        cursor.execute(
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {TRIGRAM_INDEX} '
+            f'ON splitting_sharedspent USING gin (description gin_trgm_ops)'
+        )
+
+
+def drop_trigram_index(apps, schema_editor):
+    schema_editor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {TRIGRAM_INDEX}')
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('splitting', '0004_sharedspentmember_sharedmember_user_spent_idx'),
+        ('transactions', '0005_description_search_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='sharedspent',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.SearchVector('description', config='simple'), name='sharedspent_desc_fts_idx'),
+        ),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
@@ -0,0 +1,126 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:32
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+BALANCE_FUNCTIONS_SQL = """
+CREATE OR REPLACE FUNCTION splitting_apply_balance(
+    p_creditor bigint, p_debtor bigint, p_amount numeric
+) RETURNS void AS $$
+BEGIN
+    IF p_creditor IS NULL OR p_creditor = p_debtor OR p_amount = 0 THEN
+        RETURN;
+    END IF;
+
+    -- Both directions, lower user id first so concurrent writers lock in the same order.
+    INSERT INTO splitting_pairbalance (user_id, counterparty_id, amount, updated_at)
+    SELECT user_id, counterparty_id, amount, now()
+    FROM (VALUES (p_creditor, p_debtor, p_amount), (p_debtor, p_creditor, -p_amount))
+        AS pair (user_id, counterparty_id, amount)
+    ORDER BY user_id
+    ON CONFLICT ON CONSTRAINT splitting_pairbalance_unique_pair DO UPDATE SET
+        amount = splitting_pairbalance.amount + EXCLUDED.amount,
+        updated_at = EXCLUDED.updated_at;
+
+    DELETE FROM splitting_pairbalance
+    WHERE amount = 0 AND (
+        (user_id = p_creditor AND counterparty_id = p_debtor)
+        OR (user_id = p_debtor AND counterparty_id = p_creditor)
+    );
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION splitting_sharedspentmember_balance() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') AND NOT OLD.is_owner_part THEN
+        PERFORM splitting_apply_balance(
+            (SELECT owner_id FROM splitting_sharedspent WHERE id = OLD.shared_spent_id),
+            OLD.user_id, -OLD.amount);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NOT NEW.is_owner_part THEN
+        PERFORM splitting_apply_balance(
+            (SELECT owner_id FROM splitting_sharedspent WHERE id = NEW.shared_spent_id),
+            NEW.user_id, NEW.amount);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION splitting_sharedspent_balance() RETURNS trigger AS $$
+DECLARE
+    member RECORD;
+BEGIN
+    FOR member IN
+        SELECT user_id, amount FROM splitting_sharedspentmember
+        WHERE shared_spent_id = NEW.id AND NOT is_owner_part
+    LOOP
+        PERFORM splitting_apply_balance(OLD.owner_id, member.user_id, -member.amount);
+        PERFORM splitting_apply_balance(NEW.owner_id, member.user_id, member.amount);
+    END LOOP;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER splitting_sharedspentmember_balance
+AFTER INSERT OR UPDATE OR DELETE ON splitting_sharedspentmember
+FOR EACH ROW EXECUTE FUNCTION splitting_sharedspentmember_balance();
+
+CREATE TRIGGER splitting_sharedspent_balance
+AFTER UPDATE OF owner_id ON splitting_sharedspent
+FOR EACH ROW
+WHEN (OLD.owner_id IS DISTINCT FROM NEW.owner_id)
+EXECUTE FUNCTION splitting_sharedspent_balance();
+"""
+
+BACKFILL_SQL = """
+INSERT INTO splitting_pairbalance (user_id, counterparty_id, amount, updated_at)
+SELECT user_id, counterparty_id, SUM(amount), now()
+FROM (
+    SELECT s.owner_id AS user_id, m.user_id AS counterparty_id, m.amount
+    FROM splitting_sharedspentmember m
+    JOIN splitting_sharedspent s ON s.id = m.shared_spent_id
+    WHERE NOT m.is_owner_part AND m.user_id <> s.owner_id
+    UNION ALL
+    SELECT m.user_id, s.owner_id, -m.amount
+    FROM splitting_sharedspentmember m
+    JOIN splitting_sharedspent s ON s.id = m.shared_spent_id
+    WHERE NOT m.is_owner_part AND m.user_id <> s.owner_id
+) AS entries
+GROUP BY user_id, counterparty_id
+HAVING SUM(amount) <> 0;
+"""
+
+DROP_BALANCE_FUNCTIONS_SQL = """
+DROP TRIGGER IF EXISTS splitting_sharedspent_balance ON splitting_sharedspent;
+DROP TRIGGER IF EXISTS splitting_sharedspentmember_balance ON splitting_sharedspentmember;
+DROP FUNCTION IF EXISTS splitting_sharedspent_balance();
+DROP FUNCTION IF EXISTS splitting_sharedspentmember_balance();
+DROP FUNCTION IF EXISTS splitting_apply_balance(bigint, bigint, numeric);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('splitting', '0005_description_search_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PairBalance',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=14)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('counterparty', models.ForeignKey(db_constraint=False, db_index=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('user', models.ForeignKey(db_constraint=False, db_index=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('user', 'counterparty'), name='splitting_pairbalance_unique_pair')],
+            },
+        ),
+        migrations.RunSQL(BALANCE_FUNCTIONS_SQL, DROP_BALANCE_FUNCTIONS_SQL),
+        migrations.RunSQL(BACKFILL_SQL, migrations.RunSQL.noop),
+    ]
@@ -1,7 +1,9 @@
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 
 from users.models import CustomUser
 from transactions.models import Category
+from transactions.search import description_vector
 
 
 class SharedSpent(models.Model):
@@ -23,6 +25,13 @@ class SharedSpent(models.Model):
     date = models.DateField()
     description = models.TextField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # Activity search; see transactions.search.
+            GinIndex(description_vector(), name='sharedspent_desc_fts_idx'),
+        ]
 
     def __str__(self):
         return f"Shared spent by {self.owner.email} on {self.date}"
@@ -34,10 +43,13 @@ class SharedSpentMember(models.Model):
         on_delete=models.CASCADE,
         related_name='participants'
     )
+    # Indexed by sharedmember_user_spent_idx, which the planner skips while a plain
+    # user_id index exists.
     user = models.ForeignKey(
         CustomUser,
         on_delete=models.CASCADE,
-        related_name='shared_parts'
+        related_name='shared_parts',
+        db_index=False
     )
     amount = models.DecimalField(
         max_digits=10,
@@ -48,9 +60,55 @@ class SharedSpentMember(models.Model):
         default=False,
         help_text="Owner part"
     )
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         unique_together = ('shared_spent', 'user')
+        indexes = [
+            # Shared reports: a user's parts joined to their spents, amount read from the index.
+            models.Index(
+                fields=['user', 'shared_spent'],
+                include=['amount'],
+                name='sharedmember_user_spent_idx'
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user.email}'s share ({self.amount})"
+
+
+class PairBalance(models.Model):
+    """
+    Net amount `counterparty` owes `user` over all shared spents (negative when `user`
+    owes `counterparty`). Each pair is stored in both directions, so a user's balances are
+    one index range scan. Maintained by database triggers on SharedSpentMember and
+    SharedSpent (see migration 0006); `manage.py rebuild_balances` recomputes it.
+    Pairs that settle to zero are deleted, which also clears the rows of deleted users.
+    """
+
+    user = models.ForeignKey(
+        CustomUser,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        related_name='+'
+    )
+    counterparty = models.ForeignKey(
+        CustomUser,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        related_name='+'
+    )
+    amount = models.DecimalField(max_digits=14, decimal_places=2)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'counterparty'], name='splitting_pairbalance_unique_pair'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.counterparty_id} owes {self.user_id}: {self.amount}"
@@ -0,0 +1,11 @@
+from rest_framework.pagination import CursorPagination
+
+
+class SharedSpentCursorPagination(CursorPagination):
+    """
+    Cursor pagination over (date, id), newest first.
+    """
+    ordering = ('-date', '-id')
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 500
@@ -1,35 +1,52 @@
+from collections import Counter
+
 from rest_framework import serializers
 from django.db import transaction
-from .models import SharedSpent, SharedSpentMember
+from django.db.models import Exists, OuterRef, Q
+from drf_spectacular.utils import extend_schema_field
+from .models import PairBalance, SharedSpent, SharedSpentMember
+from social.models import Friendship
 from users.models import CustomUser
 from transactions.models import Category
+from transactions.serializers import CachedCategoryField
 
 
 class ParticipantSerializer(serializers.Serializer):
     user_id = serializers.IntegerField()
     amount = serializers.DecimalField(max_digits=10, decimal_places=2, min_value=0.01)
-
-    def validate_user_id(self, user_id):
-        if not CustomUser.objects.filter(id=user_id).exists():
-            raise serializers.ValidationError("User does not exist.")
-        return user_id
+    is_owner_part = serializers.BooleanField(read_only=True)
 
 
 class SharedSpentSerializer(serializers.ModelSerializer):
-    participants = ParticipantSerializer(many=True, write_only=True, required=True)
+    participants = ParticipantSerializer(many=True, required=True)
+    my_share = serializers.SerializerMethodField()
 
     owner = serializers.PrimaryKeyRelatedField(read_only=True)
+    category = CachedCategoryField(allow_null=True, required=False)
 
     class Meta:
         model = SharedSpent
         fields = [
             'id', 'owner', 'category', 'total_amount', 'date',
-            'description', 'participants', 'created_at'
+            'description', 'participants', 'my_share', 'created_at', 'updated_at'
         ]
 
+    @extend_schema_field(
+        serializers.DecimalField(max_digits=10, decimal_places=2, allow_null=True)
+    )
+    def get_my_share(self, shared_spent):
+        user_id = self.context['request'].user.id
+        for member in shared_spent.participants.all():
+            if member.user_id == user_id:
+                return self.fields['total_amount'].to_representation(member.amount)
+        return None
+
     def validate_category(self, category):
+        if category is None:
+            return category
+
         user = self.context['request'].user
-        if category.owner is not None and category.owner != user:
+        if category.owner_id is not None and category.owner_id != user.id:
             raise serializers.ValidationError("That`s not your category.")
         if category.type != Category.CategoryType.EXPENSE:
             raise serializers.ValidationError("Only expenses can be shared.")
@@ -39,10 +56,39 @@ class SharedSpentSerializer(serializers.ModelSerializer):
         if not participants:
             raise serializers.ValidationError("There should be at least one participant.")
 
+        user = self.context['request'].user
         user_ids = [p['user_id'] for p in participants]
-        if self.context['request'].user.id in user_ids:
+        if user.id in user_ids:
             raise serializers.ValidationError("You can not be a participant of your own spent.")
 
+        duplicates = sorted(i for i, count in Counter(user_ids).items() if count > 1)
+        if duplicates:
+            raise serializers.ValidationError(
+                f"Duplicate participants: {', '.join(map(str, duplicates))}."
+            )
+
+        # Existence and friendship of every participant in one query.
+        friendship = Friendship.objects.filter(
+            Q(from_user=user, to_user=OuterRef('pk')) | Q(from_user=OuterRef('pk'), to_user=user),
+            status=Friendship.Status.ACCEPTED
+        )
+        found = dict(
+            CustomUser.objects.filter(id__in=user_ids)
+            .annotate(is_friend=Exists(friendship))
+            .values_list('id', 'is_friend')
+        )
+
+        missing = [i for i in user_ids if i not in found]
+        if missing:
+            raise serializers.ValidationError(
+                f"Users do not exist: {', '.join(map(str, missing))}."
+            )
+        strangers = [i for i in user_ids if not found[i]]
+        if strangers:
+            raise serializers.ValidationError(
+                f"You can only share spents with friends: {', '.join(map(str, strangers))}."
+            )
+
         return participants
 
     def validate(self, data):
@@ -95,3 +141,29 @@ class SharedSpentSerializer(serializers.ModelSerializer):
         SharedSpentMember.objects.bulk_create(members_to_create)
 
         return shared_spent
+
+
+class BalanceUserSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = CustomUser
+        fields = ('id', 'username')
+
+
+class PairBalanceSerializer(serializers.ModelSerializer):
+    user = BalanceUserSerializer(source='counterparty', read_only=True)
+    amount = serializers.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        read_only=True,
+        help_text="Positive: they owe you. Negative: you owe them."
+    )
+
+    class Meta:
+        model = PairBalance
+        fields = ('user', 'amount', 'updated_at')
+
+
+class SettlementSerializer(serializers.Serializer):
+    from_user = BalanceUserSerializer(read_only=True)
+    to_user = BalanceUserSerializer(read_only=True)
+    amount = serializers.DecimalField(max_digits=14, decimal_places=2, read_only=True)
@@ -0,0 +1,84 @@
+import heapq
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db.models import Sum
+
+from .models import SharedSpent, SharedSpentMember
+
+ZERO = Decimal('0.00')
+
+
+def plan_settlements(balances):
+    """
+    Suggests transfers that settle every net balance in `balances` ({user_id: amount},
+    positive when the user is owed money; amounts must sum to zero). Debtors who owe
+    exactly what a creditor is owed are paired first. The rest are settled greedily,
+    largest debtor to largest creditor, using max-heaps.
+
+    Returns a list of (from_user_id, to_user_id, amount). That is at most n - 1 transfers
+    for n users with a non-zero balance. Finding the true minimum is NP-hard, and greedy
+    matching is usually close to it. Runs in O(n log n) and the amounts are exact Decimals.
+    """
+    if sum(balances.values(), ZERO) != ZERO:
+        raise ValueError("Balances do not sum to zero.")
+
+    transfers = []
+    creditors_by_amount = defaultdict(list)
+    for user_id, amount in sorted(balances.items()):
+        if amount > 0:
+            creditors_by_amount[amount].append(user_id)
+
+    debtors = []
+    for user_id, amount in sorted(balances.items()):
+        if amount >= 0:
+            continue
+        matches = creditors_by_amount.get(-amount)
+        if matches:
+            transfers.append((user_id, matches.pop(0), -amount))
+        else:
+            debtors.append((amount, user_id))
+
+    creditors = [
+        (-amount, user_id)
+        for amount, user_ids in creditors_by_amount.items()
+        for user_id in user_ids
+    ]
+    heapq.heapify(creditors)
+    heapq.heapify(debtors)
+
+    while debtors and creditors:
+        debt, debtor = heapq.heappop(debtors)
+        credit, creditor = heapq.heappop(creditors)
+        amount = min(-debt, -credit)
+        transfers.append((debtor, creditor, amount))
+
+        if -debt > amount:
+            heapq.heappush(debtors, (debt + amount, debtor))
+        if -credit > amount:
+            heapq.heappush(creditors, (credit + amount, creditor))
+
+    return transfers
+
+
+def get_circle_balances(user):
+    """
+    Net balances of everyone in the shared spents `user` takes part in (as owner or
+    participant), counting only the parts of those spents, which `user` can already see.
+    Debts from spents between other users are left out. One grouped query.
+    """
+    owned = SharedSpent.objects.filter(owner=user).values('id')
+    joined = SharedSpentMember.objects.filter(user=user).values('shared_spent_id')
+    rows = (
+        SharedSpentMember.objects
+        .filter(shared_spent_id__in=owned.union(joined), is_owner_part=False)
+        .values_list('user_id', 'shared_spent__owner_id')
+        .annotate(total=Sum('amount'))
+        .order_by()
+    )
+
+    balances = defaultdict(lambda: ZERO)
+    for debtor, creditor, total in rows:
+        balances[debtor] -= total
+        balances[creditor] += total
+    return dict(balances)
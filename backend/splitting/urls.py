@@ -1,7 +1,11 @@
+from django.urls import path
 from rest_framework.routers import DefaultRouter
-from .views import SharedSpentViewSet
+from .views import BalanceView, SettlementPlanView, SharedSpentViewSet
 
 router = DefaultRouter()
 router.register(r'spents', SharedSpentViewSet, basename='sharedspent')
 
-urlpatterns = router.urls
+urlpatterns = [
+    path('balances/', BalanceView.as_view(), name='balances'),
+    path('settlements/', SettlementPlanView.as_view(), name='settlements'),
+] + router.urls
@@ -1,25 +1,43 @@
-from rest_framework import viewsets, permissions, status
+from decimal import Decimal
+
+from rest_framework import serializers, viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.views import APIView
 from django.db import transaction
-from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiResponse
+from drf_spectacular.utils import (
+    extend_schema,
+    extend_schema_view,
+    inline_serializer,
+    OpenApiResponse
+)
 
-from .models import SharedSpent, SharedSpentMember
-from .serializers import SharedSpentSerializer
-from django.db.models import Q
+from users.models import CustomUser
+from .models import PairBalance, SharedSpent, SharedSpentMember
+from .pagination import SharedSpentCursorPagination
+from .serializers import (
+    PairBalanceSerializer,
+    SettlementSerializer,
+    SharedSpentSerializer
+)
+from .settlements import get_circle_balances, plan_settlements
+from django.db.models import F, Prefetch
 
 
 class IsOwnerOrReadOnly(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
         if request.method in permissions.SAFE_METHODS:
             return True
-        return obj.owner == request.user
+        return obj.owner_id == request.user.id
 
 @extend_schema(tags=["Splitting"])
 @extend_schema_view(
     list=extend_schema(
         summary="List shared spents",
-        description="Shows spents where you are the owner or a participant."
+        description=(
+            "Cursor-paginated list of spents where you are the owner or a participant, "
+            "newest first, with every participant's share and your own."
+        )
     ),
     create=extend_schema(
         summary="Create shared spent",
@@ -35,11 +53,22 @@ class IsOwnerOrReadOnly(permissions.BasePermission):
 class SharedSpentViewSet(viewsets.ModelViewSet):
     serializer_class = SharedSpentSerializer
     permission_classes = [permissions.IsAuthenticated, IsOwnerOrReadOnly]
+    pagination_class = SharedSpentCursorPagination
 
     def get_queryset(self):
-        return SharedSpent.objects.filter(
-            Q(owner=self.request.user) | Q(participants__user=self.request.user)
-        ).distinct()
+        user = self.request.user
+        # Each side of the UNION is an index scan; an OR over the participants join
+        # would need DISTINCT over the whole join instead.
+        owned = SharedSpent.objects.filter(owner=user).values('pk')
+        joined = SharedSpentMember.objects.filter(user=user).values('shared_spent_id')
+        queryset = SharedSpent.objects.filter(pk__in=owned.union(joined))
+
+        if self.action in ('list', 'retrieve'):
+            queryset = queryset.prefetch_related(Prefetch(
+                'participants',
+                queryset=SharedSpentMember.objects.order_by('-is_owner_part', 'id')
+            ))
+        return queryset
 
     def get_permissions(self):
         if self.action == 'leave_spent':
@@ -65,33 +94,107 @@ class SharedSpentViewSet(viewsets.ModelViewSet):
         shared_spent = self.get_object()
         user = request.user
 
-        if shared_spent.owner == user:
+        if shared_spent.owner_id == user.id:
             return Response(
                 {"error": "Owner can not leave the spent, only delete it."},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
         try:
-            member_part = SharedSpentMember.objects.get(
+            # Lock only the leaver's row, so a repeated leave waits and then finds it gone.
+            member_part = SharedSpentMember.objects.select_for_update().get(
                 shared_spent=shared_spent,
-                user=user
+                user=user,
+                is_owner_part=False
             )
-            owner_part = SharedSpentMember.objects.get(
-                shared_spent=shared_spent,
-                is_owner_part=True
+        except SharedSpentMember.DoesNotExist:
+            return Response(
+                {"error": "You are not participant of this spent."},
+                status=status.HTTP_400_BAD_REQUEST
             )
 
-            owner_part.amount += member_part.amount
-            owner_part.save()
+        # Added in the database, so concurrent leaves do not overwrite each other.
+        updated = SharedSpentMember.objects.filter(
+            shared_spent=shared_spent,
+            is_owner_part=True
+        ).update(amount=F('amount') + member_part.amount)
+        if not updated:
+            return Response(
+                {"error": "The owner's part of this spent is missing."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        member_part.delete()
 
-            member_part.delete()
+        return Response(
+            {"status": "You left this spent."},
+            status=status.HTTP_200_OK
+        )
 
-            return Response(
-                {"status": "You left this spent."},
-                status=status.HTTP_200_OK
+
+@extend_schema(tags=["Splitting"])
+class BalanceView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    @extend_schema(
+        summary="Get balances with other users",
+        description=(
+            "Net amount every user you split with owes you (negative when you owe them), "
+            "read from the balance ledger, plus the totals. Settled pairs are omitted."
+        ),
+        responses={
+            200: inline_serializer(
+                name='BalancesResponse',
+                fields={
+                    'owed_to_you': serializers.DecimalField(max_digits=14, decimal_places=2),
+                    'you_owe': serializers.DecimalField(max_digits=14, decimal_places=2),
+                    'net': serializers.DecimalField(max_digits=14, decimal_places=2),
+                    'balances': PairBalanceSerializer(many=True)
+                }
             )
-        except SharedSpentMember.DoesNotExist:
-            return Response(
-                {"error": "You are not participant of this spent."},
-                status=status.HTTP_400_BAD_REQUEST
+        }
+    )
+    def get(self, request):
+        balances = list(
+            PairBalance.objects.filter(user=request.user)
+            .select_related('counterparty')
+            .order_by('-amount', 'counterparty_id')
+        )
+        owed_to_you = sum((b.amount for b in balances if b.amount > 0), Decimal('0.00'))
+        you_owe = -sum((b.amount for b in balances if b.amount < 0), Decimal('0.00'))
+
+        return Response({
+            'owed_to_you': owed_to_you,
+            'you_owe': you_owe,
+            'net': owed_to_you - you_owe,
+            'balances': PairBalanceSerializer(balances, many=True).data
+        })
+
+
+@extend_schema(tags=["Splitting"])
+class SettlementPlanView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    @extend_schema(
+        summary="Suggest settlement payments",
+        description=(
+            "Simplifies the debts within the shared spents you take part in into a short "
+            "list of payments that settles all of them. Debts from spents you are not part "
+            "of are left out."
+        ),
+        responses={
+            200: inline_serializer(
+                name='SettlementPlanResponse',
+                fields={'transfers': SettlementSerializer(many=True)}
             )
+        }
+    )
+    def get(self, request):
+        balances = get_circle_balances(request.user)
+        transfers = plan_settlements(balances)
+
+        users = CustomUser.objects.only('id', 'username').in_bulk(balances.keys())
+        data = [
+            {'from_user': users[debtor], 'to_user': users[creditor], 'amount': amount}
+            for debtor, creditor, amount in transfers
+        ]
+        return Response({'transfers': SettlementSerializer(data, many=True).data})
@@ -0,0 +1,20 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from sync.services import purge_tombstones
+
+
+class Command(BaseCommand):
+    help = 'Deletes delta-sync tombstones older than the retention period'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=settings.SYNC_TOMBSTONE_RETENTION_DAYS,
+            help='Keep tombstones from the last N days.'
+        )
+
+    def handle(self, *args, **options):
+        count = purge_tombstones(options['days'])
+        self.stdout.write(self.style.SUCCESS(f"Deleted {count} tombstones."))
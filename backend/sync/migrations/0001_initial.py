@@ -0,0 +1,110 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:04
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+SYNC_TRIGGERS_SQL = """
+-- Bulk and cascading updates (queryset.update(), SET_NULL) bypass auto_now.
+CREATE OR REPLACE FUNCTION sync_touch_updated_at() RETURNS trigger AS $$
+BEGIN
+    IF NEW.updated_at IS NOT DISTINCT FROM OLD.updated_at THEN
+        NEW.updated_at := now();
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION sync_owner_tombstone() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO sync_tombstone (user_id, kind, object_id, deleted_at)
+    SELECT owner_id, TG_ARGV[0], id, now() FROM old_rows;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Every participant of the spent learns that a member row is gone, including the
+-- removed users themselves (who then drop the whole spent).
+CREATE OR REPLACE FUNCTION sync_sharedspentmember_tombstone() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO sync_tombstone (user_id, kind, object_id, deleted_at)
+    SELECT DISTINCT r.user_id, 'shared_spent_member', o.id, now()
+    FROM old_rows o
+    JOIN (
+        SELECT shared_spent_id, user_id FROM old_rows
+        UNION
+        SELECT shared_spent_id, user_id FROM splitting_sharedspentmember
+        WHERE shared_spent_id IN (SELECT shared_spent_id FROM old_rows)
+    ) r ON r.shared_spent_id = o.shared_spent_id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER sync_transaction_touch
+BEFORE UPDATE ON transactions_transaction
+FOR EACH ROW EXECUTE FUNCTION sync_touch_updated_at();
+CREATE TRIGGER sync_category_touch
+BEFORE UPDATE ON transactions_category
+FOR EACH ROW EXECUTE FUNCTION sync_touch_updated_at();
+CREATE TRIGGER sync_sharedspent_touch
+BEFORE UPDATE ON splitting_sharedspent
+FOR EACH ROW EXECUTE FUNCTION sync_touch_updated_at();
+CREATE TRIGGER sync_sharedspentmember_touch
+BEFORE UPDATE ON splitting_sharedspentmember
+FOR EACH ROW EXECUTE FUNCTION sync_touch_updated_at();
+
+CREATE TRIGGER sync_transaction_tombstone
+AFTER DELETE ON transactions_transaction REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION sync_owner_tombstone('transaction');
+CREATE TRIGGER sync_category_tombstone
+AFTER DELETE ON transactions_category REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION sync_owner_tombstone('category');
+CREATE TRIGGER sync_sharedspent_tombstone
+AFTER DELETE ON splitting_sharedspent REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION sync_owner_tombstone('shared_spent');
+CREATE TRIGGER sync_sharedspentmember_tombstone
+AFTER DELETE ON splitting_sharedspentmember REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION sync_sharedspentmember_tombstone();
+"""
+
+DROP_SYNC_TRIGGERS_SQL = """
+DROP TRIGGER IF EXISTS sync_sharedspentmember_tombstone ON splitting_sharedspentmember;
+DROP TRIGGER IF EXISTS sync_sharedspent_tombstone ON splitting_sharedspent;
+DROP TRIGGER IF EXISTS sync_category_tombstone ON transactions_category;
+DROP TRIGGER IF EXISTS sync_transaction_tombstone ON transactions_transaction;
+DROP TRIGGER IF EXISTS sync_sharedspentmember_touch ON splitting_sharedspentmember;
+DROP TRIGGER IF EXISTS sync_sharedspent_touch ON splitting_sharedspent;
+DROP TRIGGER IF EXISTS sync_category_touch ON transactions_category;
+DROP TRIGGER IF EXISTS sync_transaction_touch ON transactions_transaction;
+DROP FUNCTION IF EXISTS sync_sharedspentmember_tombstone();
+DROP FUNCTION IF EXISTS sync_owner_tombstone();
+DROP FUNCTION IF EXISTS sync_touch_updated_at();
+"""
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('splitting', '0005_description_search_indexes'),
+        ('transactions', '0006_category_updated_at_transaction_owner_upd_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('transaction', 'Transaction'), ('category', 'Category'), ('shared_spent', 'Shared spent'), ('shared_spent_member', 'Shared spent member')], max_length=20)),
+                ('object_id', models.BigIntegerField()),
+                ('deleted_at', models.DateTimeField()),
+                ('user', models.ForeignKey(db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', 'deleted_at'], name='tombstone_user_deleted_idx')],
+            },
+        ),
+        migrations.RunSQL(SYNC_TRIGGERS_SQL, DROP_SYNC_TRIGGERS_SQL),
+    ]
@@ -0,0 +1,37 @@
+from django.db import models
+
+from users.models import CustomUser
+
+
+class Tombstone(models.Model):
+    """
+    Marker of a deleted Transaction, Category, SharedSpent or SharedSpentMember for delta
+    sync. Written by database triggers (see migration 0001), so cascades and bulk deletes
+    are covered. `user` is the account that has to drop the row; NULL means every account
+    (standard categories).
+    """
+
+    class Kind(models.TextChoices):
+        TRANSACTION = 'transaction', 'Transaction'
+        CATEGORY = 'category', 'Category'
+        SHARED_SPENT = 'shared_spent', 'Shared spent'
+        SHARED_SPENT_MEMBER = 'shared_spent_member', 'Shared spent member'
+
+    user = models.ForeignKey(
+        CustomUser,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        related_name='+'
+    )
+    kind = models.CharField(max_length=20, choices=Kind.choices)
+    object_id = models.BigIntegerField()
+    deleted_at = models.DateTimeField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'deleted_at'], name='tombstone_user_deleted_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.object_id} deleted at {self.deleted_at}"
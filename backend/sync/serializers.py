@@ -0,0 +1,50 @@
+from rest_framework import serializers
+
+from transactions.serializers import CategorySerializer, TransactionListSerializer
+from .models import Tombstone
+
+
+class SyncSharedSpentSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    owner = serializers.IntegerField(source='owner_id')
+    category = serializers.IntegerField(source='category_id', allow_null=True)
+    total_amount = serializers.DecimalField(max_digits=10, decimal_places=2)
+    date = serializers.DateField()
+    description = serializers.CharField(allow_blank=True)
+    created_at = serializers.DateTimeField()
+    updated_at = serializers.DateTimeField()
+
+    VALUES_FIELDS = (
+        'id', 'owner_id', 'category_id', 'total_amount', 'date', 'description',
+        'created_at', 'updated_at'
+    )
+
+
+class SyncSharedSpentMemberSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    shared_spent = serializers.IntegerField(source='shared_spent_id')
+    user = serializers.IntegerField(source='user_id')
+    amount = serializers.DecimalField(max_digits=10, decimal_places=2)
+    is_owner_part = serializers.BooleanField()
+    updated_at = serializers.DateTimeField()
+
+    VALUES_FIELDS = ('id', 'shared_spent_id', 'user_id', 'amount', 'is_owner_part', 'updated_at')
+
+
+class TombstoneSerializer(serializers.Serializer):
+    type = serializers.ChoiceField(source='kind', choices=Tombstone.Kind.choices)
+    id = serializers.IntegerField(source='object_id')
+
+    VALUES_FIELDS = ('kind', 'object_id')
+
+
+class SyncSerializer(serializers.Serializer):
+    token = serializers.CharField(help_text="Pass as `since` on the next sync.")
+    full = serializers.BooleanField(
+        help_text="True when this is a full snapshot; drop local data not included in it."
+    )
+    categories = CategorySerializer(many=True)
+    transactions = TransactionListSerializer(many=True)
+    shared_spents = SyncSharedSpentSerializer(many=True)
+    shared_spent_members = SyncSharedSpentMemberSerializer(many=True)
+    deleted = TombstoneSerializer(many=True)
@@ -0,0 +1,90 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
+
+from splitting.models import SharedSpent, SharedSpentMember
+from transactions.models import Category, Transaction
+from .models import Tombstone
+
+
+def encode_sync_token(moment):
+    return urlsafe_b64encode(moment.isoformat().encode('ascii')).decode('ascii')
+
+
+def decode_sync_token(token):
+    """
+    Returns the aware datetime stored in `token`; raises ValueError for a malformed one.
+    """
+    try:
+        moment = datetime.fromisoformat(urlsafe_b64decode(token.encode('ascii')).decode('ascii'))
+    except (TypeError, ValueError, UnicodeError):
+        raise ValueError(token)
+    if timezone.is_naive(moment):
+        raise ValueError(token)
+    return moment
+
+
+def get_sync_since(token, now):
+    """
+    Lower bound for changed rows. Rows are stamped before their transaction commits, so the
+    window reaches SYNC_TOKEN_OVERLAP seconds behind the token; clients apply changes as
+    idempotent upserts. None (full snapshot) for a first sync or a token older than the
+    tombstone retention.
+    """
+    if not token:
+        return None
+    since = decode_sync_token(token) - timedelta(seconds=settings.SYNC_TOKEN_OVERLAP)
+    if since < now - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS):
+        return None
+    return since
+
+
+def get_changes(user, since):
+    """
+    Querysets of the rows visible to `user` that changed after `since` (all of them when
+    `since` is None) and of the tombstones written after it.
+    A newly joined shared spent is sent whole: the spent and all of its members.
+    """
+    my_parts = SharedSpentMember.objects.filter(user=user)
+
+    categories = Category.objects.filter(Q(owner=user) | Q(owner=None))
+    transactions = Transaction.objects.filter(owner=user)
+    shared_spents = SharedSpent.objects.filter(
+        Exists(my_parts.filter(shared_spent=OuterRef('pk')))
+    )
+    members = SharedSpentMember.objects.filter(
+        shared_spent__in=my_parts.values('shared_spent')
+    )
+    deleted = Tombstone.objects.none()
+
+    if since is not None:
+        joined = my_parts.filter(updated_at__gt=since).values('shared_spent')
+
+        categories = categories.filter(updated_at__gt=since)
+        transactions = transactions.filter(updated_at__gt=since)
+        shared_spents = shared_spents.filter(Q(updated_at__gt=since) | Q(id__in=joined))
+        members = members.filter(Q(updated_at__gt=since) | Q(shared_spent__in=joined))
+        deleted = Tombstone.objects.filter(
+            Q(user=user) | Q(user=None), deleted_at__gt=since
+        )
+
+    return {
+        'categories': categories.order_by('id'),
+        'transactions': transactions.order_by('id'),
+        'shared_spents': shared_spents.order_by('id'),
+        'shared_spent_members': members.order_by('id'),
+        'deleted': deleted.order_by('deleted_at', 'id'),
+    }
+
+
+def purge_tombstones(days=None):
+    """
+    Deletes tombstones older than the retention period; returns how many were removed.
+    """
+    days = settings.SYNC_TOMBSTONE_RETENTION_DAYS if days is None else days
+    cutoff = timezone.now() - timedelta(days=days)
+    deleted, _ = Tombstone.objects.filter(deleted_at__lt=cutoff).delete()
+    return deleted
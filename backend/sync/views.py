@@ -0,0 +1,72 @@
+from django.utils import timezone
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from transactions.serializers import CategorySerializer, TransactionListSerializer
+from .serializers import (
+    SyncSerializer,
+    SyncSharedSpentMemberSerializer,
+    SyncSharedSpentSerializer,
+    TombstoneSerializer
+)
+from .services import encode_sync_token, get_changes, get_sync_since
+
+
+class SyncView(APIView):
+    """
+    Delta sync for offline-first clients.
+    """
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        summary="Sync changes",
+        description=(
+            "Returns categories, transactions, shared spents and their members changed "
+            "since the `since` token, plus the ids of rows deleted since then. Without a "
+            "token (or with an expired one) a full snapshot is returned and `full` is true. "
+            "Apply rows as upserts: items changed shortly before the token may be sent again."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name='since',
+                type=str,
+                description='`token` from the previous sync response.'
+            )
+        ],
+        responses={200: SyncSerializer},
+        tags=["Sync"]
+    )
+    def get(self, request, *args, **kwargs):
+        now = timezone.now()
+        try:
+            since = get_sync_since(request.query_params.get('since'), now)
+        except ValueError:
+            raise ValidationError({"since": "Invalid sync token."})
+
+        changes = get_changes(request.user, since)
+
+        return Response({
+            'token': encode_sync_token(now),
+            'full': since is None,
+            'categories': CategorySerializer(changes['categories'], many=True).data,
+            'transactions': TransactionListSerializer(
+                changes['transactions'].values(*TransactionListSerializer.VALUES_FIELDS),
+                many=True
+            ).data,
+            'shared_spents': SyncSharedSpentSerializer(
+                changes['shared_spents'].values(*SyncSharedSpentSerializer.VALUES_FIELDS),
+                many=True
+            ).data,
+            'shared_spent_members': SyncSharedSpentMemberSerializer(
+                changes['shared_spent_members'].values(
+                    *SyncSharedSpentMemberSerializer.VALUES_FIELDS
+                ),
+                many=True
+            ).data,
+            'deleted': TombstoneSerializer(
+                changes['deleted'].values(*TombstoneSerializer.VALUES_FIELDS), many=True
+            ).data,
+        })
@@ -0,0 +1,74 @@
+import json
+from datetime import date
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from django.core.management import call_command
+from users.models import CustomUser
+
+BASELINES_PATH = Path(__file__).with_name('baselines.json')
+MEASURED_KEY = pytest.StashKey[dict]()
+
+# generate_load_data options per size; 'large' (~2M transactions) is for manual runs.
+DATASET_SIZES = {
+    'small': {'users': 10, 'transactions': 500, 'shared': 20, 'friends': 5},
+    'medium': {'users': 20, 'transactions': 5000, 'shared': 200, 'friends': 10},
+    'large': {'users': 50, 'transactions': 40000, 'shared': 1000, 'friends': 20},
+}
+
+
+def pytest_generate_tests(metafunc):
+    if 'benchmark_dataset' in metafunc.fixturenames:
+        sizes = metafunc.config.getoption('--benchmark-sizes').split(',')
+        metafunc.parametrize('benchmark_dataset', sizes, indirect=True, scope='session')
+
+
+@pytest.fixture(scope='session')
+def benchmark_dataset(request, django_db_setup, django_db_blocker):
+    """
+    Seeds the test database with generate_load_data once per size and returns
+    (size, user). The span ends today so the default report periods contain data.
+    """
+    size = request.param
+    with django_db_blocker.unblock():
+        call_command(
+            'generate_load_data', seed=1, prefix='bench', end_date=date.today().isoformat(),
+            stdout=StringIO(), **DATASET_SIZES[size]
+        )
+        user = CustomUser.objects.get(username='bench0')
+
+    yield size, user
+
+    with django_db_blocker.unblock():
+        call_command('flush', interactive=False, verbosity=0)
+
+
+@pytest.fixture(scope='session')
+def baselines(request):
+    """
+    Committed baselines keyed by size and endpoint. With --update-baselines the results
+    measured in this session are written back when it ends.
+    """
+    current = json.loads(BASELINES_PATH.read_text()) if BASELINES_PATH.exists() else {}
+    measured = request.config.stash.setdefault(MEASURED_KEY, {})
+
+    yield current, measured
+
+    if request.config.getoption('--update-baselines') and measured:
+        for size, results in measured.items():
+            current.setdefault(size, {}).update(results)
+        BASELINES_PATH.write_text(json.dumps(current, indent=2, sort_keys=True) + '\n')
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    measured = config.stash.get(MEASURED_KEY, None)
+    if not measured:
+        return
+    terminalreporter.section('benchmark results')
+    for size, results in measured.items():
+        for name, result in sorted(results.items()):
+            terminalreporter.write_line(
+                f"{size:<8} {name:<26} p50 {result['p50_ms']:>8} ms  p95 {result['p95_ms']:>8} ms  "
+                f"queries {result['queries']:>3}  peak {result['peak_kb']:>6} KB"
+            )
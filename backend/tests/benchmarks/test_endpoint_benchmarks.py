@@ -0,0 +1,107 @@
+import gc
+import os
+import statistics
+import time
+import tracemalloc
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db]
+
+REPEAT = 15
+WARMUP = 2
+# Latency depends on the machine, so it gets more room than query counts (which must
+# not grow) and memory.
+LATENCY_TOLERANCE = float(os.getenv('BENCHMARK_LATENCY_TOLERANCE', 2.0))
+LATENCY_SLACK_MS = 5
+MEMORY_TOLERANCE = 1.5
+MEMORY_SLACK_KB = 256
+
+ENDPOINTS = {
+    'reports-activity': ('get', '/api/reports/activity/'),
+    'reports-activity-search': ('get', '/api/reports/activity/?search=silpo'),
+    'reports-by-category': ('get', '/api/reports/by-category/'),
+    'reports-over-time': ('get', '/api/reports/over-time/?granularity=week'),
+    'reports-dashboard': ('get', '/api/reports/dashboard/'),
+    'transactions-list': ('get', '/api/transactions/'),
+    'transactions-filtered': ('get', '/api/transactions/?type=EXPENSE&amount_min=500'),
+    'shared-spents-list': ('get', '/api/splitting/spents/'),
+    'friends-list': ('get', '/api/social/friends/'),
+    'advice-statistics': ('post', '/api/integrations/advice/'),
+    'sync-full': ('get', '/api/sync/'),
+}
+
+
+def request_once(client, method, url):
+    # Measure the uncached path: report responses would otherwise come from the cache.
+    cache.clear()
+    response = getattr(client, method)(url)
+    assert response.status_code in (200, 201), (url, response.status_code)
+    return response
+
+
+def measure(client, method, url):
+    for _ in range(WARMUP):
+        request_once(client, method, url)
+
+    # Like timeit, keep collector pauses caused by earlier allocations out of the timings.
+    timings = []
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(REPEAT):
+            start = time.perf_counter()
+            request_once(client, method, url)
+            timings.append((time.perf_counter() - start) * 1000)
+    finally:
+        gc.enable()
+
+    with CaptureQueriesContext(connection) as queries:
+        request_once(client, method, url)
+    # Read now: the captured slice is taken lazily from a log the next request resets.
+    query_count = len(queries)
+
+    tracemalloc.start()
+    try:
+        request_once(client, method, url)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'p50_ms': round(statistics.median(timings), 2),
+        'p95_ms': round(statistics.quantiles(timings, n=20)[18], 2),
+        'queries': query_count,
+        'peak_kb': round(peak / 1024),
+    }
+
+
+@pytest.mark.parametrize('name', list(ENDPOINTS))
+def test_endpoint_benchmark(name, benchmark_dataset, baselines, request):
+    size, user = benchmark_dataset
+    method, url = ENDPOINTS[name]
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    with patch('integrations.views.get_ai_advice', return_value='Spend less.'):
+        result = measure(client, method, url)
+
+    current, measured = baselines
+    measured.setdefault(size, {})[name] = result
+
+    baseline = current.get(size, {}).get(name)
+    if baseline is None or request.config.getoption('--update-baselines'):
+        return
+
+    assert result['queries'] <= baseline['queries'], (name, result, baseline)
+    assert result['p95_ms'] <= baseline['p95_ms'] * LATENCY_TOLERANCE + LATENCY_SLACK_MS, (
+        name, result, baseline
+    )
+    assert result['peak_kb'] <= baseline['peak_kb'] * MEMORY_TOLERANCE + MEMORY_SLACK_KB, (
+        name, result, baseline
+    )
@@ -1,10 +1,74 @@
 import pytest
 import factory
+from contextlib import contextmanager
+from django.core.cache import cache
+from config.query_metrics import capture_queries
+from django.db.models import Q
 from rest_framework.test import APIClient
+from social.models import Friendship
 from users.models import CustomUser
 from transactions.models import Category
 
 
+def pytest_addoption(parser):
+    group = parser.getgroup('benchmark')
+    group.addoption(
+        '--benchmark', action='store_true', help='Run the endpoint benchmarks in tests/benchmarks.'
+    )
+    group.addoption(
+        '--benchmark-sizes', default='small,medium',
+        help='Comma-separated dataset sizes to benchmark (small, medium, large).'
+    )
+    group.addoption(
+        '--update-baselines', action='store_true',
+        help='Write the measured benchmark results to tests/benchmarks/baselines.json.'
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption('--benchmark'):
+        # The benchmark dataset is committed for the whole session, so the benchmarks
+        # run alone: any other test collected alongside them would see its rows.
+        deselected = [item for item in items if 'benchmark' not in item.keywords]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = [item for item in items if 'benchmark' in item.keywords]
+        return
+    skip = pytest.mark.skip(reason='benchmarks run only with --benchmark')
+    for item in items:
+        if 'benchmark' in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture
+def assert_query_budget():
+    """
+    Context manager asserting that the block runs at most `max_queries` queries and,
+    unless `allow_repeats`, repeats no query shape QUERY_METRICS_REPEAT_THRESHOLD times.
+
+        with assert_query_budget(3):
+            client.get(url)
+    """
+    @contextmanager
+    def check(max_queries, allow_repeats=False):
+        with capture_queries() as metrics:
+            yield metrics
+        assert metrics.count <= max_queries, (
+            f"Query budget {max_queries} exceeded:\n{metrics.report()}"
+        )
+        if not allow_repeats:
+            assert not metrics.repeated(), f"Repeated queries (N+1):\n{metrics.report()}"
+
+    return check
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
 @pytest.fixture
 def user_factory(db):
     class UserFactory(factory.django.DjangoModelFactory):
@@ -51,6 +115,23 @@ def authenticated_client(api_client, user):
     return api_client
 
 
+@pytest.fixture
+def befriend(db):
+    """
+    Makes `user` an accepted friend of each of `others` (shared spents require it).
+    """
+    def make(user, *others):
+        for other in others:
+            if not Friendship.objects.filter(
+                Q(from_user=user, to_user=other) | Q(from_user=other, to_user=user)
+            ).exists():
+                Friendship.objects.create(
+                    from_user=user, to_user=other, status=Friendship.Status.ACCEPTED
+                )
+
+    return make
+
+
 @pytest.fixture
 def standard_category(category_factory):
     return category_factory(owner=None, name="Products")
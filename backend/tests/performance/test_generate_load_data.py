@@ -0,0 +1,78 @@
+import pytest
+from collections import Counter
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db.models import Sum
+from reports.rollup import find_rollup_mismatches
+from social.models import Friendship
+from splitting.models import SharedSpent, SharedSpentMember
+from transactions.models import Transaction
+from users.models import CustomUser
+
+pytestmark = pytest.mark.django_db
+
+OPTIONS = {
+    'users': 6, 'transactions': 40, 'shared': 3, 'friends': 2, 'max_participants': 2,
+    'batch_size': 50, 'seed': 7, 'prefix': 'gen'
+}
+
+
+def fingerprint():
+    return (
+        list(
+            Transaction.objects.order_by('owner__username', 'date', 'amount', 'description')
+            .values_list('owner__username', 'date', 'amount', 'description', 'category__name')
+        ),
+        list(
+            SharedSpentMember.objects.order_by('user__username', 'amount')
+            .values_list('user__username', 'amount', 'is_owner_part')
+        ),
+    )
+
+
+def test_generates_consistent_dataset():
+    call_command('generate_load_data', **OPTIONS)
+
+    users = CustomUser.objects.filter(username__startswith='gen')
+    assert users.count() == 6
+    assert all(hasattr(user, 'profile') for user in users)
+    assert Transaction.objects.count() == 6 * 40
+    friendships = Friendship.objects.filter(status=Friendship.Status.ACCEPTED)
+    assert 0 < friendships.count() <= 6 * 2 // 2
+    degrees = Counter(
+        user_id for pair in friendships.values_list('from_user', 'to_user') for user_id in pair
+    )
+    assert max(degrees.values()) <= 2
+    assert SharedSpent.objects.count() == 6 * 3
+
+    spents = SharedSpent.objects.annotate(parts=Sum('participants__amount'))
+    assert all(spent.parts == spent.total_amount for spent in spents)
+    assert find_rollup_mismatches() == []
+
+
+def test_same_seed_gives_same_data():
+    call_command('generate_load_data', **OPTIONS)
+    first = fingerprint()
+
+    with pytest.raises(CommandError):
+        call_command('generate_load_data', **OPTIONS)
+
+    call_command('generate_load_data', clear=True, **OPTIONS)
+    assert fingerprint() == first
+
+    call_command('generate_load_data', clear=True, **{**OPTIONS, 'seed': 8})
+    assert fingerprint() != first
+
+
+def test_friendships_and_shared_spents_are_written_in_batches(django_assert_max_num_queries):
+    options = {
+        **OPTIONS, 'users': 300, 'transactions': 0, 'shared': 2, 'friends': 5,
+        'max_participants': 3, 'batch_size': 200
+    }
+
+    # Friendships and spents (with their members) are inserted per batch, not all at once.
+    with django_assert_max_num_queries(80):
+        call_command('generate_load_data', **options)
+
+    assert SharedSpent.objects.count() == 300 * 2
+    assert Friendship.objects.count() > 300 * 5 // 2 * 0.9
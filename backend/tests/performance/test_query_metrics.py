@@ -0,0 +1,60 @@
+import logging
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory
+from config.query_metrics import QueryMetricsMiddleware, capture_queries
+from transactions.models import Category
+
+pytestmark = pytest.mark.django_db
+
+
+def test_capture_groups_query_shapes(user, standard_category):
+    with capture_queries(repeat_threshold=3) as metrics:
+        for _ in range(4):
+            Category.objects.filter(id=standard_category.id).first()
+        list(Category.objects.filter(id__in=[1, 2, 3]))
+        list(Category.objects.filter(id__in=[4, 5]))
+
+    assert metrics.count == 6
+    assert metrics.duration > 0
+    assert [times for _, times in metrics.repeated()] == [4]
+    assert '4x' in metrics.report()
+    assert len(metrics.shapes) == 2
+
+
+def test_middleware_headers_and_log_fields(authenticated_client, user, settings, caplog):
+    settings.QUERY_METRICS_HEADERS = True
+
+    with caplog.at_level(logging.INFO, logger='spendify.queries'):
+        response = authenticated_client.get('/api/transactions/')
+
+    assert response.status_code == 200
+    assert int(response['X-DB-Query-Count']) >= 1
+    assert float(response['X-DB-Query-Time-Ms']) >= 0
+    assert response['X-DB-Repeated-Queries'] == '0'
+
+    record = caplog.records[-1]
+    assert record.levelno == logging.INFO
+    assert record.path == '/api/transactions/'
+    assert record.db_query_count == int(response['X-DB-Query-Count'])
+
+
+def test_middleware_flags_repeated_queries(user, standard_category, settings, caplog):
+    settings.QUERY_METRICS_HEADERS = False
+    settings.QUERY_METRICS_REPEAT_THRESHOLD = 3
+
+    def per_row_view(request):
+        for _ in range(3):
+            Category.objects.get(id=standard_category.id).owner
+        return HttpResponse()
+
+    middleware = QueryMetricsMiddleware(per_row_view)
+    with caplog.at_level(logging.INFO, logger='spendify.queries'):
+        response = middleware(RequestFactory().get('/per-row/'))
+
+    assert 'X-DB-Query-Count' not in response
+    record = caplog.records[-1]
+    assert record.levelno == logging.WARNING
+    assert 'Possible N+1' in record.getMessage()
+    assert record.db_repeated_queries == 1
+    assert record.db_query_count == 3
@@ -0,0 +1,180 @@
+import random
+import pytest
+from datetime import date, timedelta
+from django.db import connection
+from django.db.models import Sum
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from reports.services import _feed_rows
+from reports.views import BaseReportView
+from splitting.models import SharedSpent, SharedSpentMember
+from transactions.models import Category, Transaction
+from transactions.search import search_descriptions
+
+pytestmark = pytest.mark.django_db
+
+WATCHED_TABLES = (
+    'transactions_transaction', 'splitting_sharedspentmember', 'reports_dailyspending'
+)
+
+
+@pytest.fixture
+def seeded(user_factory):
+    rng = random.Random(10)
+    users = [user_factory() for _ in range(4)]
+    categories = [
+        Category.objects.create(name=f"Cat {i}", type="EXPENSE", owner=None) for i in range(8)
+    ]
+    start = date(2024, 1, 1)
+
+    Transaction.objects.bulk_create([
+        Transaction(
+            owner=rng.choice(users),
+            category=rng.choice(categories),
+            amount=rng.randint(1, 5000),
+            date=start + timedelta(days=rng.randint(0, 700))
+        )
+        for _ in range(4000)
+    ])
+
+    spents = SharedSpent.objects.bulk_create([
+        SharedSpent(
+            owner=users[0], category=rng.choice(categories), total_amount=100,
+            date=start + timedelta(days=rng.randint(0, 700))
+        )
+        for _ in range(600)
+    ])
+    SharedSpentMember.objects.bulk_create([
+        SharedSpentMember(shared_spent=spent, user=user, amount=25, is_owner_part=user == users[0])
+        for spent in spents
+        for user in users
+    ])
+
+    with connection.cursor() as cursor:
+        for table in WATCHED_TABLES + ('splitting_sharedspent',):
+            cursor.execute(f'ANALYZE {table}')
+
+    return users[1], categories[0]
+
+
+def assert_no_seq_scan(queryset):
+    with connection.cursor() as cursor:
+        cursor.execute('SET LOCAL enable_seqscan = off')
+    plan = queryset.explain()
+    for table in WATCHED_TABLES:
+        assert f'Seq Scan on {table}' not in plan, plan
+    return plan
+
+
+def report_querysets(user, params):
+    request = Request(APIRequestFactory().get('/', params))
+    request.user = user
+    view = BaseReportView()
+    personal_qs, shared_qs = view.get_filtered_querysets(request)
+    return personal_qs, shared_qs, view.get_rollup_queryset(request)
+
+
+# Expected index per query: personal rows, shared rows, rollup. A category filter on
+# shared rows is selective enough for the planner to start from the spent's category.
+@pytest.mark.parametrize('params, expected', [
+    ({}, ('transaction_owner_date_idx', 'sharedmember_user_spent_idx', 'rollup_user_cat_date_idx')),
+    (
+        {'date_from': '2024-03-01', 'date_to': '2024-06-30'},
+        ('transaction_owner_date_idx', 'sharedmember_user_spent_idx',
+         'reports_dailyspending_unique_bucket')
+    ),
+    (
+        {'date_from': '2024-03-01', 'date_to': '2024-06-30', 'category': 'CATEGORY'},
+        ('transaction_owner_cat_idx', None, 'rollup_user_cat_date_idx')
+    ),
+])
+def test_report_queries_use_indexes(seeded, params, expected):
+    user, category = seeded
+    params = {k: category.id if v == 'CATEGORY' else v for k, v in params.items()}
+    personal_qs, shared_qs, rollup_qs = report_querysets(user, params)
+    personal_index, shared_index, rollup_index = expected
+
+    plan = assert_no_seq_scan(personal_qs.order_by('-date', '-id')[:50])
+    assert personal_index in plan
+
+    plan = assert_no_seq_scan(shared_qs.order_by('-date', '-id')[:50])
+    if shared_index:
+        assert shared_index in plan
+
+    plan = assert_no_seq_scan(rollup_qs.values('category').annotate(total=Sum('total_amount')))
+    assert rollup_index in plan
+
+
+def test_activity_feed_union_uses_indexes(seeded):
+    user, _ = seeded
+    personal_qs, shared_qs, _ = report_querysets(user, {'date_to': '2025-01-01'})
+
+    personal = _feed_rows(personal_qs, 'personal', None, 50)
+    shared = _feed_rows(shared_qs, 'shared', None, 50)
+    plan = assert_no_seq_scan(personal.union(shared, all=True))
+    assert 'transaction_owner_date_idx' in plan
+    assert 'sharedmember_user_spent_idx' in plan
+
+
+def test_transaction_list_uses_index(seeded):
+    user, category = seeded
+
+    plan = assert_no_seq_scan(
+        Transaction.objects.filter(owner=user).order_by('-date', '-id')[:51]
+    )
+    assert 'transaction_owner_date_idx' in plan
+
+    # On this little data a top-N sort of a bitmap scan may be cheaper; with sorting
+    # discouraged, the plan shows whether the index can return the rows in order.
+    with connection.cursor() as cursor:
+        cursor.execute('SET LOCAL enable_sort = off')
+    plan = assert_no_seq_scan(
+        Transaction.objects.filter(owner=user, category=category).order_by('-date', '-id')[:51]
+    )
+    assert 'transaction_owner_cat_idx' in plan
+    assert 'Sort' not in plan
+
+
+def test_advice_statistics_use_index(seeded):
+    user, _ = seeded
+    start = date(2024, 6, 1)
+
+    plan = assert_no_seq_scan(
+        Transaction.objects.filter(
+            owner=user, date__gte=start, date__lte=start + timedelta(days=30)
+        ).values('category__name').annotate(total=Sum('amount'))
+    )
+    assert 'transaction_owner_date_idx' in plan
+
+
+def test_description_search_uses_fts_index(seeded):
+    user, _ = seeded
+    ids = list(Transaction.objects.filter(owner=user).values_list('id', flat=True)[:20])
+    Transaction.objects.filter(id__in=ids).update(description='Silpo supermarket')
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE transactions_transaction')
+
+    plan = assert_no_seq_scan(search_descriptions(Transaction.objects.all(), 'silpo'))
+    assert 'transaction_desc_fts_idx' in plan
+
+    plan = assert_no_seq_scan(search_descriptions(SharedSpent.objects.all(), 'silpo'))
+    assert 'sharedspent_desc_fts_idx' in plan
+
+
+def test_transaction_filters_use_indexes(seeded):
+    user, category = seeded
+    other = Category.objects.exclude(id=category.id).first()
+
+    plan = assert_no_seq_scan(
+        Transaction.objects.filter(
+            owner=user, category__in=[category, other],
+            date__gte=date(2024, 3, 1), date__lte=date(2024, 6, 30), amount__gte=500
+        ).order_by('-date', '-id')[:51]
+    )
+    assert 'transaction_owner_' in plan
+
+    assert_no_seq_scan(
+        Transaction.objects.filter(
+            owner=user, category__type='EXPENSE', date__gte=date(2024, 3, 1)
+        ).order_by('-date', '-id')[:51]
+    )
@@ -1,7 +1,14 @@
+import csv
+import io
+import json
 import pytest
 from datetime import date
+from decimal import Decimal
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from transactions.models import Transaction, Category
 from splitting.models import SharedSpent, SharedSpentMember
+from reports.views import ActivityExportView
 
 pytestmark = pytest.mark.django_db
 
@@ -37,7 +44,8 @@ def test_activity_report(authenticated_client, setup_data):
     response = authenticated_client.get(url)
 
     assert response.status_code == 200
-    data = response.data
+    assert response.data['next'] is None
+    data = response.data['results']
 
     assert len(data) == 2
 
@@ -77,4 +85,271 @@ def test_over_time_report(authenticated_client, setup_data):
     today_entry = next((item for item in response.data if item['date'] == today_str), None)
 
     assert today_entry is not None
-    assert float(today_entry['total_amount']) == 300.00
\ No newline at end of file
+    assert float(today_entry['total_amount']) == 300.00
+
+
+def test_category_summary_counts_and_exact_sums(authenticated_client, setup_data, user):
+    food = Category.objects.get(name="Food")
+    Transaction.objects.create(owner=user, category=food, amount="0.10", date=date.today())
+    Transaction.objects.create(owner=user, category=food, amount="0.20", date=date.today())
+
+    response = authenticated_client.get('/api/reports/by-category/')
+
+    assert response.status_code == 200
+    assert response.data['total_spent'] == Decimal('300.30')
+
+    food_data = next(item for item in response.data['breakdown'] if item['category'] == 'Food')
+    assert food_data['total_amount'] == '100.30'
+    assert food_data['transaction_count'] == 3
+
+
+def test_category_summary_type_filter(authenticated_client, setup_data):
+    response = authenticated_client.get('/api/reports/by-category/', {'type': 'shared'})
+
+    assert response.status_code == 200
+    assert float(response.data['total_spent']) == 200.00
+    assert [item['category'] for item in response.data['breakdown']] == ['Transport']
+
+
+def test_over_time_report_fills_gaps(authenticated_client, user):
+    cat = Category.objects.create(name="Food", type="EXPENSE", owner=None)
+    Transaction.objects.create(owner=user, category=cat, amount=10, date=date(2025, 1, 1))
+    Transaction.objects.create(owner=user, category=cat, amount=5, date=date(2025, 1, 3))
+
+    response = authenticated_client.get(
+        '/api/reports/over-time/', {'date_from': '2025-01-01', 'date_to': '2025-01-04'}
+    )
+
+    assert response.status_code == 200
+    assert [(item['date'], float(item['total_amount'])) for item in response.data] == [
+        ('2025-01-01', 10.0), ('2025-01-02', 0.0), ('2025-01-03', 5.0), ('2025-01-04', 0.0)
+    ]
+
+
+def test_over_time_report_monthly_granularity(authenticated_client, user, user2):
+    cat = Category.objects.create(name="Food", type="EXPENSE", owner=None)
+    Transaction.objects.create(owner=user, category=cat, amount=10, date=date(2025, 1, 5))
+    Transaction.objects.create(owner=user, category=cat, amount=20, date=date(2025, 1, 25))
+
+    shared = SharedSpent.objects.create(
+        owner=user2, category=cat, total_amount=100, date=date(2025, 3, 2)
+    )
+    SharedSpentMember.objects.create(shared_spent=shared, user=user, amount=40)
+
+    response = authenticated_client.get('/api/reports/over-time/', {
+        'date_from': '2025-01-10', 'date_to': '2025-03-31', 'granularity': 'month'
+    })
+
+    assert response.status_code == 200
+    assert [(item['date'], float(item['total_amount'])) for item in response.data] == [
+        ('2025-01-01', 20.0), ('2025-02-01', 0.0), ('2025-03-01', 40.0)
+    ]
+
+
+def test_over_time_report_reads_only_default_period(authenticated_client, user):
+    cat = Category.objects.create(name="Food", type="EXPENSE", owner=None)
+    # date_from defaults to 2025-01-01; the 2024-12-31 row shares its first week bucket.
+    Transaction.objects.create(owner=user, category=cat, amount=70, date=date(2024, 12, 31))
+    Transaction.objects.create(owner=user, category=cat, amount=10, date=date(2025, 1, 2))
+
+    response = authenticated_client.get(
+        '/api/reports/over-time/', {'date_to': '2025-01-31', 'granularity': 'week'}
+    )
+
+    assert response.status_code == 200
+    assert response.data[0]['date'] == '2024-12-30'
+    assert float(response.data[0]['total_amount']) == 10.0
+    assert sum(float(item['total_amount']) for item in response.data) == 10.0
+
+
+def test_activity_report_keyset_pagination(authenticated_client, setup_data, user, user2):
+    food = Category.objects.get(name="Food")
+    for day in range(1, 6):
+        Transaction.objects.create(owner=user, category=food, amount=day, date=date(2025, 1, day))
+    shared = SharedSpent.objects.create(
+        owner=user2, category=food, total_amount=50, date=date(2025, 1, 3)
+    )
+    SharedSpentMember.objects.create(shared_spent=shared, user=user, amount=20)
+
+    url = '/api/reports/activity/?date_to=2025-01-31&page_size=2'
+    seen = []
+    while url:
+        response = authenticated_client.get(url)
+        assert response.status_code == 200
+        assert len(response.data['results']) <= 2
+        seen.extend((item['date'], item['type']) for item in response.data['results'])
+        url = response.data['next']
+
+    assert seen == [
+        ('2025-01-05', 'personal'), ('2025-01-04', 'personal'), ('2025-01-03', 'shared'),
+        ('2025-01-03', 'personal'), ('2025-01-02', 'personal'), ('2025-01-01', 'personal'),
+    ]
+
+
+def test_activity_report_search(authenticated_client, setup_data, user, user2):
+    food = Category.objects.get(name="Food")
+    Transaction.objects.create(
+        owner=user, category=food, amount=7, date=date(2025, 1, 2), description='Uber ride'
+    )
+    shared = SharedSpent.objects.create(
+        owner=user2, category=food, total_amount=50, date=date(2025, 1, 3), description='Uber XL'
+    )
+    SharedSpentMember.objects.create(shared_spent=shared, user=user, amount=20)
+
+    response = authenticated_client.get('/api/reports/activity/', {'search': 'uber'})
+
+    assert response.status_code == 200
+    assert [(item['type'], item['description']) for item in response.data['results']] == [
+        ('shared', 'Uber XL'), ('personal', 'Uber ride')
+    ]
+
+
+def test_activity_report_invalid_cursor(authenticated_client, setup_data):
+    response = authenticated_client.get('/api/reports/activity/', {'cursor': 'garbage'})
+
+    assert response.status_code == 404
+
+
+def test_activity_report_type_filter(authenticated_client, setup_data):
+    response = authenticated_client.get('/api/reports/activity/', {'type': 'shared'})
+
+    assert response.status_code == 200
+    assert [item['type'] for item in response.data['results']] == ['shared']
+
+
+@pytest.mark.parametrize('url', [
+    '/api/reports/activity/', '/api/reports/by-category/', '/api/reports/over-time/'
+])
+def test_repeated_report_is_served_from_cache(authenticated_client, setup_data, url):
+    first = authenticated_client.get(url, {'type': '', 'date_to': date.today().isoformat()})
+
+    with CaptureQueriesContext(connection) as queries:
+        second = authenticated_client.get(url, {'date_to': date.today().isoformat(), 'type': ''})
+
+    assert second.status_code == 200
+    assert second.data == first.data
+    assert len(queries) == 1
+    assert 'reports_userdataversion' in queries[0]['sql']
+
+
+def test_report_cache_is_invalidated_by_data_changes(authenticated_client, setup_data, user):
+    url = '/api/reports/by-category/'
+    assert float(authenticated_client.get(url).data['total_spent']) == 300.00
+
+    transaction = Transaction.objects.create(
+        owner=user, category=Category.objects.get(name="Food"), amount=50, date=date.today()
+    )
+    assert float(authenticated_client.get(url).data['total_spent']) == 350.00
+
+    SharedSpentMember.objects.filter(user=user).update(amount=100)
+    assert float(authenticated_client.get(url).data['total_spent']) == 250.00
+
+    transaction.delete()
+    assert float(authenticated_client.get(url).data['total_spent']) == 200.00
+
+
+def test_standard_category_rename_invalidates_reports(authenticated_client, setup_data):
+    url = '/api/reports/by-category/'
+    first = authenticated_client.get(url)
+    assert {item['category'] for item in first.data['breakdown']} == {'Food', 'Transport'}
+
+    food = Category.objects.get(name="Food")
+    food.name = "Groceries"
+    food.save()
+
+    response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+    assert response.status_code == 200
+    assert {item['category'] for item in response.data['breakdown']} == {
+        'Groceries', 'Transport'
+    }
+
+
+def test_shared_spent_category_rename_invalidates_participant_reports(
+        authenticated_client, setup_data, user2
+):
+    taxi = Category.objects.create(name="Taxi", type="EXPENSE", owner=user2)
+    SharedSpent.objects.filter(owner=user2).update(category=taxi)
+    url = '/api/reports/by-category/'
+    first = authenticated_client.get(url)
+    assert {item['category'] for item in first.data['breakdown']} == {'Food', 'Taxi'}
+
+    taxi.name = "Cab"
+    taxi.save()
+
+    response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+    assert response.status_code == 200
+    assert {item['category'] for item in response.data['breakdown']} == {'Food', 'Cab'}
+
+
+def test_activity_export_csv_streams_all_rows(authenticated_client, setup_data, user, monkeypatch):
+    food = Category.objects.get(name="Food")
+    for day in range(1, 6):
+        Transaction.objects.create(
+            owner=user, category=food, amount=day, date=date(2025, 1, day), description=f"d{day}"
+        )
+    monkeypatch.setattr(ActivityExportView, 'export_batch_size', 2)
+
+    response = authenticated_client.get('/api/reports/activity/export/', {'type': 'personal'})
+
+    assert response.status_code == 200
+    assert response.streaming
+    assert response['Content-Type'] == 'text/csv'
+
+    content = b''.join(response.streaming_content).decode()
+    rows = list(csv.DictReader(io.StringIO(content)))
+    assert len(rows) == 6
+    assert [row['description'] for row in rows[1:]] == ['d5', 'd4', 'd3', 'd2', 'd1']
+
+
+def test_activity_export_ndjson(authenticated_client, setup_data):
+    response = authenticated_client.get(
+        '/api/reports/activity/export/', {'export_format': 'ndjson', 'type': 'shared'}
+    )
+
+    assert response.status_code == 200
+    lines = b''.join(response.streaming_content).decode().splitlines()
+    assert [json.loads(line)['amount'] for line in lines] == ['200.00']
+
+
+def test_activity_export_rejects_unknown_format(authenticated_client):
+    response = authenticated_client.get('/api/reports/activity/export/', {'export_format': 'xls'})
+
+    assert response.status_code == 400
+
+
+def test_dashboard_combines_reports(authenticated_client, setup_data, django_assert_num_queries):
+    with django_assert_num_queries(4):
+        response = authenticated_client.get('/api/reports/dashboard/')
+
+    assert response.status_code == 200
+    assert float(response.data['total_spent']) == 300.00
+    assert {item['category'] for item in response.data['breakdown']} == {'Food', 'Transport'}
+    assert len(response.data['time_series']) == 31
+    assert float(response.data['time_series'][-1]['total_amount']) == 300.00
+    assert len(response.data['activity']['results']) == 2
+    assert response.data['activity']['next'] is None
+
+
+def test_dashboard_activity_next_link_points_to_feed(authenticated_client, setup_data):
+    response = authenticated_client.get('/api/reports/dashboard/', {'page_size': 1})
+
+    next_url = response.data['activity']['next']
+    assert '/api/reports/activity/' in next_url
+
+    next_page = authenticated_client.get(next_url)
+    assert len(next_page.data['results']) == 1
+
+
+def test_report_conditional_get(authenticated_client, setup_data, user):
+    url = '/api/reports/by-category/'
+    etag = authenticated_client.get(url)['ETag']
+
+    with CaptureQueriesContext(connection) as queries:
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+    assert len(queries) == 1
+
+    Transaction.objects.create(
+        owner=user, category=Category.objects.get(name="Food"), amount=1, date=date.today()
+    )
+    assert authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
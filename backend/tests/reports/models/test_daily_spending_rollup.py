@@ -0,0 +1,110 @@
+import pytest
+from datetime import date
+from decimal import Decimal
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from reports.models import DailySpending
+from splitting.models import SharedSpent, SharedSpentMember
+from transactions.models import Transaction
+
+pytestmark = pytest.mark.django_db
+
+
+def bucket(user, source='personal', **kwargs):
+    return DailySpending.objects.get(user=user, source=source, **kwargs)
+
+
+def test_transaction_create_update_delete_keeps_rollup(user, standard_category):
+    day = date(2025, 1, 1)
+    first = Transaction.objects.create(
+        owner=user, category=standard_category, amount=10, date=day
+    )
+    Transaction.objects.create(owner=user, category=standard_category, amount=5, date=day)
+
+    row = bucket(user, date=day, category=standard_category)
+    assert row.total_amount == Decimal('15.00')
+    assert row.transaction_count == 2
+
+    first.amount = 20
+    first.save()
+    assert bucket(user, date=day, category=standard_category).total_amount == Decimal('25.00')
+
+    first.date = date(2025, 1, 2)
+    first.save()
+    assert bucket(user, date=day, category=standard_category).transaction_count == 1
+    assert bucket(user, date=date(2025, 1, 2), category=standard_category).total_amount == 20
+
+    Transaction.objects.filter(owner=user).delete()
+    assert not DailySpending.objects.filter(user=user).exists()
+
+
+def test_bulk_create_and_category_delete(user, category_factory):
+    category = category_factory(owner=user)
+    Transaction.objects.bulk_create([
+        Transaction(owner=user, category=category, amount=1, date=date(2025, 1, 1))
+        for _ in range(3)
+    ])
+    assert bucket(user, category=category).transaction_count == 3
+
+    category.delete()
+
+    row = bucket(user, category=None)
+    assert row.total_amount == Decimal('3.00')
+    assert row.transaction_count == 3
+
+
+def test_shared_parts_follow_spent_changes(
+        authenticated_client, user, user2, standard_category, category_factory, api_client,
+        befriend
+):
+    befriend(user, user2)
+    response = authenticated_client.post('/api/splitting/spents/', {
+        "category": standard_category.id,
+        "total_amount": 100,
+        "date": "2025-01-01",
+        "participants": [{"user_id": user2.id, "amount": 30}]
+    }, format='json')
+    spent = SharedSpent.objects.get(id=response.data['id'])
+
+    assert bucket(user, 'shared').total_amount == Decimal('70.00')
+    assert bucket(user2, 'shared').total_amount == Decimal('30.00')
+
+    other = category_factory(owner=None)
+    spent.category = other
+    spent.date = date(2025, 2, 1)
+    spent.save()
+    assert bucket(user2, 'shared').category_id == other.id
+    assert bucket(user2, 'shared').date == date(2025, 2, 1)
+
+    api_client.force_authenticate(user=user2)
+    api_client.post(f'/api/splitting/spents/{spent.id}/leave/')
+
+    assert not DailySpending.objects.filter(user=user2).exists()
+    assert bucket(user, 'shared').total_amount == Decimal('100.00')
+
+    spent.delete()
+    assert not DailySpending.objects.exists()
+
+
+def test_rebuild_command_restores_rollup(user, user2, standard_category):
+    Transaction.objects.create(
+        owner=user, category=standard_category, amount=10, date=date(2025, 1, 1)
+    )
+    spent = SharedSpent.objects.create(
+        owner=user2, category=standard_category, total_amount=50, date=date(2025, 1, 1)
+    )
+    SharedSpentMember.objects.create(shared_spent=spent, user=user, amount=20)
+
+    call_command('rebuild_spending_rollup', '--verify')
+
+    DailySpending.objects.filter(user=user, source='shared').update(total_amount=1)
+    DailySpending.objects.filter(user=user, source='personal').delete()
+
+    with pytest.raises(CommandError):
+        call_command('rebuild_spending_rollup', '--verify')
+
+    call_command('rebuild_spending_rollup')
+    call_command('rebuild_spending_rollup', '--verify')
+
+    assert bucket(user, 'shared').total_amount == Decimal('20.00')
+    assert bucket(user, 'personal', category=standard_category).total_amount == 10
@@ -0,0 +1,38 @@
+import pytest
+from social.models import Friendship
+
+pytestmark = pytest.mark.django_db
+URL = '/api/social/friends/'
+
+
+def test_list_friends_query_budget(authenticated_client, user, user_factory, assert_query_budget):
+    for index in range(8):
+        friend = user_factory()
+        if index % 2:
+            Friendship.objects.create(from_user=user, to_user=friend, status='ACCEPTED')
+        else:
+            Friendship.objects.create(from_user=friend, to_user=user, status='ACCEPTED')
+    Friendship.objects.create(from_user=user_factory(), to_user=user)
+
+    with assert_query_budget(1):
+        response = authenticated_client.get(URL)
+
+    assert response.status_code == 200
+    assert len(response.data) == 8
+    assert {'id', 'username', 'email'} <= set(response.data[0]['from_user'])
+
+
+def test_pending_and_sent_query_budget(
+        authenticated_client, user, user_factory, assert_query_budget
+):
+    for _ in range(6):
+        Friendship.objects.create(from_user=user_factory(), to_user=user)
+        Friendship.objects.create(from_user=user, to_user=user_factory())
+
+    with assert_query_budget(1):
+        pending = authenticated_client.get(URL + 'pending/')
+    with assert_query_budget(1):
+        sent = authenticated_client.get(URL + 'sent/')
+
+    assert len(pending.data) == 6
+    assert len(sent.data) == 6
@@ -0,0 +1,128 @@
+import pytest
+from decimal import Decimal
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from rest_framework.test import APIClient
+from splitting.balances import find_balance_mismatches
+from splitting.models import PairBalance, SharedSpent, SharedSpentMember
+
+pytestmark = pytest.mark.django_db
+URL = '/api/splitting/balances/'
+SPENTS_URL = '/api/splitting/spents/'
+
+
+def client_for(user):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def create_spent(befriend):
+    def create(owner, category, total, participants):
+        befriend(owner, *[participant for participant, _ in participants])
+        return post_spent(owner, category, total, participants)
+
+    return create
+
+
+def post_spent(owner, category, total, participants):
+    response = client_for(owner).post(SPENTS_URL, {
+        "category": category.id,
+        "total_amount": total,
+        "date": "2025-11-15",
+        "participants": [
+            {"user_id": user.id, "amount": amount} for user, amount in participants
+        ]
+    }, format='json')
+    assert response.status_code == 201
+    return response.data['id']
+
+
+def balances_of(user):
+    response = client_for(user).get(URL)
+    assert response.status_code == 200
+    return response.data
+
+
+def test_balances_follow_create_leave_and_delete(
+        user, user2, user_factory, standard_category, create_spent
+):
+    user3 = user_factory()
+    first = create_spent(user, standard_category, '1000.00', [(user2, '300.00'), (user3, '200.00')])
+    create_spent(user2, standard_category, '500.00', [(user, '100.00')])
+
+    data = balances_of(user)
+    assert [(b['user']['id'], b['amount']) for b in data['balances']] == [
+        (user2.id, '200.00'), (user3.id, '200.00')
+    ]
+    assert data['owed_to_you'] == Decimal('400.00')
+    assert data['you_owe'] == Decimal('0.00')
+    assert data['net'] == Decimal('400.00')
+
+    assert [(b['user']['id'], b['amount']) for b in balances_of(user2)['balances']] == [
+        (user.id, '-200.00')
+    ]
+
+    assert client_for(user3).post(f"{SPENTS_URL}{first}/leave/").status_code == 200
+    assert balances_of(user3)['balances'] == []
+
+    assert client_for(user).delete(f"{SPENTS_URL}{first}/").status_code == 204
+    data = balances_of(user)
+    assert [(b['user']['id'], b['amount']) for b in data['balances']] == [(user2.id, '-100.00')]
+    assert data['you_owe'] == Decimal('100.00')
+    assert data['net'] == Decimal('-100.00')
+    assert find_balance_mismatches() == []
+
+
+def test_member_amount_and_owner_changes_update_ledger(
+        user, user2, user_factory, standard_category, create_spent
+):
+    user3 = user_factory()
+    spent_id = create_spent(user, standard_category, '100.00', [(user2, '40.00')])
+
+    SharedSpentMember.objects.filter(shared_spent_id=spent_id, user=user2).update(amount=25)
+    assert PairBalance.objects.get(user=user, counterparty=user2).amount == Decimal('25.00')
+
+    SharedSpent.objects.filter(id=spent_id).update(owner=user3)
+    assert not PairBalance.objects.filter(user=user).exists()
+    assert PairBalance.objects.get(user=user3, counterparty=user2).amount == Decimal('25.00')
+    assert find_balance_mismatches() == []
+
+
+def test_deleted_user_leaves_no_balances(user, user2, standard_category, create_spent):
+    create_spent(user, standard_category, '100.00', [(user2, '40.00')])
+    create_spent(user2, standard_category, '100.00', [(user, '10.00')])
+
+    user2.delete()
+
+    assert not PairBalance.objects.exists()
+
+
+def test_balances_query_count_does_not_grow_with_spents(
+        user, user_factory, standard_category, django_assert_num_queries, create_spent
+):
+    friends = [user_factory() for _ in range(5)]
+    for _ in range(4):
+        create_spent(user, standard_category, '100.00', [(friend, '10.00') for friend in friends])
+
+    client = client_for(user)
+    with django_assert_num_queries(1):
+        response = client.get(URL)
+
+    assert len(response.data['balances']) == 5
+    assert response.data['owed_to_you'] == Decimal('200.00')
+
+
+def test_rebuild_balances_command(user, user2, standard_category, create_spent):
+    create_spent(user, standard_category, '100.00', [(user2, '40.00')])
+    call_command('rebuild_balances', verify=True)
+
+    PairBalance.objects.filter(user=user).update(amount=1)
+    PairBalance.objects.create(user=user2, counterparty=user2, amount=5)
+    with pytest.raises(CommandError, match='2 inconsistent'):
+        call_command('rebuild_balances', verify=True)
+
+    call_command('rebuild_balances')
+    assert find_balance_mismatches() == []
+    assert PairBalance.objects.get(user=user, counterparty=user2).amount == Decimal('40.00')
@@ -0,0 +1,98 @@
+import random
+import time
+import pytest
+from collections import defaultdict
+from decimal import Decimal
+from rest_framework.test import APIClient
+from splitting.models import SharedSpent, SharedSpentMember
+from splitting.settlements import plan_settlements
+
+pytestmark = pytest.mark.django_db
+URL = '/api/splitting/settlements/'
+
+
+def apply(balances, transfers):
+    remaining = defaultdict(Decimal, balances)
+    for debtor, creditor, amount in transfers:
+        assert amount > 0
+        remaining[debtor] += amount
+        remaining[creditor] -= amount
+    return {user_id: amount for user_id, amount in remaining.items() if amount}
+
+
+def owe(debtor, creditor, amount):
+    spent = SharedSpent.objects.create(
+        owner=creditor, total_amount=Decimal(amount) * 2, date='2025-11-15'
+    )
+    SharedSpentMember.objects.bulk_create([
+        SharedSpentMember(
+            shared_spent=spent, user=creditor, amount=Decimal(amount), is_owner_part=True
+        ),
+        SharedSpentMember(shared_spent=spent, user=debtor, amount=Decimal(amount)),
+    ])
+
+
+def test_plan_settlements_collapses_chain():
+    # 1 owes 2 owes 3 owes 4 the same amount: one payment settles everything.
+    balances = {1: Decimal('-10.00'), 2: Decimal('0.00'), 3: Decimal('0.00'), 4: Decimal('10.00')}
+
+    assert plan_settlements(balances) == [(1, 4, Decimal('10.00'))]
+
+
+def test_plan_settlements_matches_equal_amounts_first():
+    balances = {
+        1: Decimal('-30.00'), 2: Decimal('-20.00'), 3: Decimal('20.00'), 4: Decimal('30.00'),
+    }
+
+    assert sorted(plan_settlements(balances)) == [
+        (1, 4, Decimal('30.00')), (2, 3, Decimal('20.00'))
+    ]
+
+
+def test_plan_settlements_rejects_unbalanced_input():
+    with pytest.raises(ValueError):
+        plan_settlements({1: Decimal('-1.00'), 2: Decimal('0.99')})
+
+
+def test_plan_settlements_large_group_is_exact_and_fast():
+    rng = random.Random(7)
+    balances = {
+        user_id: Decimal(rng.randint(-100000, 100000)) / 100 for user_id in range(1, 500)
+    }
+    balances[500] = -sum(balances.values())
+
+    started = time.perf_counter()
+    transfers = plan_settlements(balances)
+    elapsed = time.perf_counter() - started
+
+    assert apply(balances, transfers) == {}
+    assert len(transfers) <= len(balances) - 1
+    assert elapsed < 0.5
+
+
+def test_settlement_endpoint_plans_the_circle(user, user2, user_factory):
+    user3 = user_factory()
+    outsider = user_factory()
+    owe(user2, user, '30.00')
+    owe(user, user3, '30.00')
+    # Spents the requester is not part of stay private.
+    owe(user3, outsider, '5.00')
+    owe(user3, user2, '10.00')
+
+    client = APIClient()
+    client.force_authenticate(user=user)
+    response = client.get(URL)
+
+    assert response.status_code == 200
+    assert [
+        (t['from_user']['id'], t['to_user']['id'], t['amount'])
+        for t in response.data['transfers']
+    ] == [(user2.id, user3.id, '30.00')]
+    assert set(response.data['transfers'][0]['from_user']) == {'id', 'username'}
+
+
+def test_settlement_endpoint_without_balances(authenticated_client):
+    response = authenticated_client.get(URL)
+
+    assert response.status_code == 200
+    assert response.data['transfers'] == []
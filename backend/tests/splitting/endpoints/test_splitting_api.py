@@ -1,4 +1,10 @@
 import pytest
+import threading
+from decimal import Decimal
+from django.db import connection
+from rest_framework.test import APIClient
+from reports.rollup import find_rollup_mismatches
+from splitting.balances import find_balance_mismatches
 from splitting.models import SharedSpent, SharedSpentMember
 
 pytestmark = pytest.mark.django_db
@@ -6,7 +12,8 @@ URL = '/api/splitting/spents/'
 
 
 @pytest.fixture
-def shared_spent_payload(standard_category, user2):
+def shared_spent_payload(standard_category, user, user2, befriend):
+    befriend(user, user2)
     return {
         "category": standard_category.id,
         "total_amount": 1000.00,
@@ -41,6 +48,15 @@ def test_create_shared_spent_fail_sum_too_high(
     assert 'participants' in response.data
 
 
+def test_create_shared_spent_without_category(authenticated_client, shared_spent_payload):
+    shared_spent_payload['category'] = None
+
+    response = authenticated_client.post(URL, shared_spent_payload, format='json')
+
+    assert response.status_code == 201
+    assert SharedSpent.objects.get().category is None
+
+
 def test_participant_leave_spent_success(
         authenticated_client, shared_spent_payload, user, user2, api_client
 ):
@@ -61,6 +77,19 @@ def test_participant_leave_spent_success(
     assert owner_part.amount == 1000.00
 
 
+def test_leave_without_owner_part_keeps_member(
+        authenticated_client, shared_spent_payload, user2, api_client
+):
+    spent_id = authenticated_client.post(URL, shared_spent_payload, format='json').data['id']
+    SharedSpentMember.objects.filter(shared_spent_id=spent_id, is_owner_part=True).delete()
+
+    api_client.force_authenticate(user=user2)
+    response = api_client.post(f"{URL}{spent_id}/leave/")
+
+    assert response.status_code == 400
+    assert SharedSpentMember.objects.filter(shared_spent_id=spent_id, user=user2).exists()
+
+
 def test_owner_delete_spent_success(authenticated_client, shared_spent_payload):
     response = authenticated_client.post(URL, shared_spent_payload, format='json')
     spent_id = response.data['id']
@@ -84,3 +113,144 @@ def test_participant_delete_spent_fails(
 
     assert delete_response.status_code == 403
     assert SharedSpent.objects.count() == 1
+
+
+def test_list_shows_participants_and_my_share(
+        authenticated_client, shared_spent_payload, user, user2, user_factory, api_client
+):
+    outsider = user_factory()
+    authenticated_client.post(URL, shared_spent_payload, format='json')
+
+    response = authenticated_client.get(URL)
+
+    assert response.status_code == 200
+    spent = response.data['results'][0]
+    assert spent['my_share'] == '700.00'
+    assert [(p['user_id'], p['amount'], p['is_owner_part']) for p in spent['participants']] == [
+        (user.id, '700.00', True), (user2.id, '300.00', False)
+    ]
+
+    api_client.force_authenticate(user=user2)
+    assert api_client.get(URL).data['results'][0]['my_share'] == '300.00'
+
+    api_client.force_authenticate(user=outsider)
+    assert api_client.get(URL).data['results'] == []
+
+
+def test_list_is_paginated_without_n_plus_one(
+        user, user2, user_factory, standard_category, authenticated_client, assert_query_budget
+):
+    others = [user_factory() for _ in range(3)]
+    spents = SharedSpent.objects.bulk_create([
+        SharedSpent(owner=owner, category=standard_category, total_amount=100,
+                    date=f'2025-01-{day:02d}')
+        for day in range(1, 16)
+        for owner in (user, others[day % 3])
+    ])
+    SharedSpentMember.objects.bulk_create([
+        member
+        for spent in spents
+        for member in (
+            SharedSpentMember(shared_spent=spent, user=spent.owner, amount=60, is_owner_part=True),
+            SharedSpentMember(
+                shared_spent=spent, user=user2 if spent.owner_id == user.id else user, amount=40
+            ),
+        )
+    ])
+
+    with assert_query_budget(2):
+        response = authenticated_client.get(URL, {'page_size': 20})
+
+    assert len(response.data['results']) == 20
+    assert response.data['next'] is not None
+    assert all(len(spent['participants']) == 2 for spent in response.data['results'])
+
+    rest = authenticated_client.get(response.data['next'])
+    ids = [spent['id'] for spent in response.data['results'] + rest.data['results']]
+    assert sorted(ids) == sorted(spent.id for spent in spents)
+
+
+def test_create_rejects_duplicate_participants(authenticated_client, shared_spent_payload, user2):
+    shared_spent_payload['participants'].append({"user_id": user2.id, "amount": 100.00})
+
+    response = authenticated_client.post(URL, shared_spent_payload, format='json')
+
+    assert response.status_code == 400
+    assert str(user2.id) in response.data['participants'][0]
+    assert SharedSpent.objects.count() == 0
+
+
+def test_create_rejects_unknown_users_and_non_friends(
+        authenticated_client, shared_spent_payload, user_factory
+):
+    stranger = user_factory()
+    shared_spent_payload['participants'].append({"user_id": stranger.id, "amount": 100.00})
+
+    response = authenticated_client.post(URL, shared_spent_payload, format='json')
+    assert response.status_code == 400
+    assert response.data['participants'][0] == (
+        f"You can only share spents with friends: {stranger.id}."
+    )
+
+    shared_spent_payload['participants'][-1]['user_id'] = 999999
+    response = authenticated_client.post(URL, shared_spent_payload, format='json')
+    assert response.status_code == 400
+    assert response.data['participants'][0] == "Users do not exist: 999999."
+    assert SharedSpent.objects.count() == 0
+
+
+def test_create_validates_participants_in_constant_queries(
+        authenticated_client, user, user_factory, standard_category, befriend,
+        django_assert_max_num_queries
+):
+    friends = [user_factory() for _ in range(30)]
+    befriend(user, *friends)
+    payload = {
+        "category": standard_category.id,
+        "total_amount": 1000.00,
+        "date": "2025-11-15",
+        "participants": [{"user_id": friend.id, "amount": 10.00} for friend in friends]
+    }
+
+    with django_assert_max_num_queries(10):
+        response = authenticated_client.post(URL, payload, format='json')
+
+    assert response.status_code == 201
+    assert SharedSpentMember.objects.count() == 31
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_leaves_conserve_amounts(user, user_factory, standard_category):
+    members = [user_factory() for _ in range(12)]
+    spent = SharedSpent.objects.create(
+        owner=user, category=standard_category, total_amount=1000, date='2025-11-15'
+    )
+    SharedSpentMember.objects.bulk_create(
+        [SharedSpentMember(shared_spent=spent, user=user, amount=400, is_owner_part=True)]
+        + [SharedSpentMember(shared_spent=spent, user=member, amount=50) for member in members]
+    )
+
+    # Every member leaves twice at the same time; only one leave per member may count.
+    leavers = members * 2
+    barrier = threading.Barrier(len(leavers))
+    statuses = []
+
+    def leave(member):
+        client = APIClient()
+        client.force_authenticate(user=member)
+        try:
+            barrier.wait()
+            statuses.append(client.post(f"{URL}{spent.id}/leave/").status_code)
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=leave, args=(member,)) for member in leavers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert statuses.count(200) == len(members)
+    assert SharedSpentMember.objects.get().amount == Decimal('1000.00')
+    assert find_balance_mismatches() == []
+    assert find_rollup_mismatches() == []
@@ -0,0 +1,157 @@
+import pytest
+from datetime import date, timedelta
+from django.core.management import call_command
+from django.utils import timezone
+from splitting.models import SharedSpent, SharedSpentMember
+from sync.models import Tombstone
+from sync.services import encode_sync_token
+from transactions.models import Category, Transaction
+
+pytestmark = pytest.mark.django_db
+URL = '/api/sync/'
+
+
+def sync(client, token=None):
+    response = client.get(URL, {'since': token} if token else {})
+    assert response.status_code == 200
+    return response.data
+
+
+def make_shared(owner, members, category=None):
+    spent = SharedSpent.objects.create(
+        owner=owner, category=category, total_amount=90, date=date(2025, 1, 1)
+    )
+    SharedSpentMember.objects.create(
+        shared_spent=spent, user=owner, amount=90 - 10 * len(members), is_owner_part=True
+    )
+    for member in members:
+        SharedSpentMember.objects.create(shared_spent=spent, user=member, amount=10)
+    return spent
+
+
+def past_token(seconds=3600):
+    return encode_sync_token(timezone.now() - timedelta(seconds=seconds))
+
+
+def test_first_sync_returns_snapshot(authenticated_client, user, user2, standard_category):
+    own = Transaction.objects.create(
+        owner=user, category=standard_category, amount=5, date=date(2025, 1, 1)
+    )
+    Transaction.objects.create(
+        owner=user2, category=standard_category, amount=5, date=date(2025, 1, 1)
+    )
+    spent = make_shared(user2, [user])
+
+    data = sync(authenticated_client)
+
+    assert data['full'] is True
+    assert data['token']
+    assert [t['id'] for t in data['transactions']] == [own.id]
+    assert [c['id'] for c in data['categories']] == [standard_category.id]
+    assert [s['id'] for s in data['shared_spents']] == [spent.id]
+    assert len(data['shared_spent_members']) == 2
+    assert data['deleted'] == []
+
+
+def test_delta_sync_returns_only_changes(authenticated_client, user, standard_category):
+    old = Transaction.objects.create(
+        owner=user, category=standard_category, amount=5, date=date(2025, 1, 1)
+    )
+    Transaction.objects.filter(id=old.id).update(updated_at=timezone.now() - timedelta(days=1))
+    Category.objects.filter(id=standard_category.id).update(
+        updated_at=timezone.now() - timedelta(days=1)
+    )
+    new = Transaction.objects.create(
+        owner=user, category=standard_category, amount=7, date=date(2025, 1, 2)
+    )
+
+    data = sync(authenticated_client, past_token())
+
+    assert data['full'] is False
+    assert [t['id'] for t in data['transactions']] == [new.id]
+    assert data['categories'] == []
+
+
+def test_bulk_update_and_cascade_bump_updated_at(authenticated_client, user, category_factory):
+    category = category_factory(owner=user)
+    category_id = category.id
+    row = Transaction.objects.create(owner=user, category=category, amount=5, date='2025-01-01')
+    stale = timezone.now() - timedelta(days=1)
+    Transaction.objects.filter(id=row.id).update(updated_at=stale)
+
+    Transaction.objects.filter(id=row.id).update(amount=6)
+    row.refresh_from_db()
+    assert row.updated_at > stale
+
+    Transaction.objects.filter(id=row.id).update(updated_at=stale)
+    category.delete()
+    data = sync(authenticated_client, past_token())
+
+    assert [(t['id'], t['category']) for t in data['transactions']] == [(row.id, None)]
+    assert {'type': 'category', 'id': category_id} in data['deleted']
+
+
+def test_deletions_are_reported_as_tombstones(authenticated_client, user, user2, standard_category):
+    row = Transaction.objects.create(
+        owner=user, category=standard_category, amount=5, date=date(2025, 1, 1)
+    )
+    spent = make_shared(user2, [user])
+    members = list(spent.participants.values_list('id', flat=True))
+    foreign = Transaction.objects.create(
+        owner=user2, category=standard_category, amount=5, date=date(2025, 1, 1)
+    )
+
+    Transaction.objects.filter(id__in=[row.id, foreign.id]).delete()
+    spent.delete()
+    data = sync(authenticated_client, past_token())
+
+    deleted = {(d['type'], d['id']) for d in data['deleted']}
+    assert deleted == {('transaction', row.id)} | {
+        ('shared_spent_member', member_id) for member_id in members
+    }
+    assert data['shared_spents'] == []
+
+
+def test_joining_a_spent_sends_it_whole(authenticated_client, user, user2, user_factory):
+    other = user_factory()
+    spent = make_shared(user2, [other])
+    stale = timezone.now() - timedelta(days=1)
+    SharedSpent.objects.filter(id=spent.id).update(updated_at=stale)
+    SharedSpentMember.objects.filter(shared_spent=spent).update(updated_at=stale)
+
+    SharedSpentMember.objects.create(shared_spent=spent, user=user, amount=10)
+    data = sync(authenticated_client, past_token())
+
+    assert [s['id'] for s in data['shared_spents']] == [spent.id]
+    assert len(data['shared_spent_members']) == 3
+
+
+def test_removed_member_is_reported_to_other_participants(api_client, user, user2):
+    spent = make_shared(user2, [user])
+    member = SharedSpentMember.objects.get(shared_spent=spent, user=user)
+    member_id = member.id
+
+    member.delete()
+    api_client.force_authenticate(user=user2)
+    data = sync(api_client, past_token())
+
+    assert {'type': 'shared_spent_member', 'id': member_id} in data['deleted']
+
+
+def test_expired_or_invalid_token(authenticated_client, settings):
+    settings.SYNC_TOMBSTONE_RETENTION_DAYS = 1
+    assert sync(authenticated_client, past_token(3 * 86400))['full'] is True
+
+    response = authenticated_client.get(URL, {'since': 'garbage'})
+    assert response.status_code == 400
+
+
+def test_purge_tombstones(user):
+    Tombstone.objects.create(
+        user=user, kind='transaction', object_id=1, deleted_at=timezone.now() - timedelta(days=100)
+    )
+    Tombstone.objects.create(user=user, kind='transaction', object_id=2, deleted_at=timezone.now())
+
+    call_command('purge_sync_tombstones', days=90)
+
+    assert list(Tombstone.objects.values_list('object_id', flat=True)) == [2]
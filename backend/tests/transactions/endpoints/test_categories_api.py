@@ -1,4 +1,7 @@
 import pytest
+import time
+from django.core.cache import cache
+from transactions.category_cache import get_standard_categories, get_user_categories
 from transactions.models import Category
 
 pytestmark = pytest.mark.django_db
@@ -44,3 +47,95 @@ def test_delete_personal_category_success(authenticated_client, category_factory
 
     assert response.status_code == 204
     assert not Category.objects.filter(id=personal_category.id).exists()
+
+
+def test_list_categories_served_from_cache(
+        authenticated_client, user, standard_category, django_assert_num_queries, settings
+):
+    settings.CATEGORY_CACHE_SHARED = True
+    authenticated_client.get(URL)
+
+    # Authentication of a force-authenticated client runs no query either.
+    with django_assert_num_queries(0):
+        response = authenticated_client.get(URL)
+
+    assert [item['name'] for item in response.data] == ["Products"]
+
+
+def test_category_changes_invalidate_cache(authenticated_client, user, standard_category):
+    authenticated_client.get(URL)
+
+    created = authenticated_client.post(
+        URL, {"name": "Gifts", "type": Category.CategoryType.EXPENSE}
+    ).data
+    assert {item['name'] for item in authenticated_client.get(URL).data} == {
+        "Products", "Gifts"
+    }
+
+    authenticated_client.patch(f"{URL}{created['id']}/", {"name": "Presents"})
+    assert {item['name'] for item in authenticated_client.get(URL).data} == {
+        "Products", "Presents"
+    }
+
+    standard_category.name = "Food"
+    standard_category.save()
+    authenticated_client.delete(f"{URL}{created['id']}/")
+    assert [item['name'] for item in authenticated_client.get(URL).data] == ["Food"]
+
+
+def test_list_categories_reads_database_without_shared_cache(
+        authenticated_client, standard_category
+):
+    # Another worker with its own LocMemCache renamed the category.
+    authenticated_client.get(URL)
+    Category.objects.filter(id=standard_category.id).update(name="Food")
+
+    assert [item['name'] for item in authenticated_client.get(URL).data] == ["Food"]
+
+
+@pytest.mark.parametrize('shared', [False, True])
+def test_category_versions_expire_only_without_shared_cache(
+        user, standard_category, settings, monkeypatch, shared
+):
+    settings.CATEGORY_CACHE_SHARED = shared
+    cache.clear()
+    get_user_categories(user.id)
+    Category.objects.filter(id=standard_category.id).update(name="Food")
+    assert get_user_categories(user.id).get_id("Products") == standard_category.id
+
+    # A per-process cache misses other workers' invalidations and reloads once its
+    # version expires; a shared one is invalidated explicitly and keeps its versions.
+    now = time.time()
+    monkeypatch.setattr(time, 'time', lambda: now + settings.CATEGORY_CACHE_VERSION_TIMEOUT + 1)
+    assert (get_user_categories(user.id).get_id("Food") is not None) is not shared
+
+
+def test_category_lookup(user, user2, category_factory, standard_category):
+    own = category_factory(owner=user, name="products")
+    foreign = category_factory(owner=user2, name="Secret")
+    income = category_factory(owner=None, name="Products", type=Category.CategoryType.INCOME)
+
+    lookup = get_user_categories(user.id)
+
+    assert lookup.get_id("PRODUCTS", Category.CategoryType.EXPENSE) == own.id
+    assert lookup.get_id("Products", Category.CategoryType.INCOME) == income.id
+    assert lookup.get_id("Products") == standard_category.id
+    assert lookup.get_type_owner(own.id) == (Category.CategoryType.EXPENSE, user.id)
+    assert lookup.get_type_owner(standard_category.id) == (Category.CategoryType.EXPENSE, None)
+    assert foreign.id not in lookup
+    assert set(get_standard_categories().by_id) == {standard_category.id, income.id}
+
+
+def test_transaction_category_resolved_from_cache(
+        authenticated_client, user, standard_category, assert_query_budget
+):
+    get_user_categories(user.id)
+    data = {'category': standard_category.id, 'amount': '10.00', 'date': '2025-01-01'}
+
+    # Just the INSERT: the category comes from the warm cache.
+    with assert_query_budget(1) as metrics:
+        response = authenticated_client.post('/api/transactions/', data)
+
+    assert response.status_code == 201
+    assert response.data['category'] == standard_category.id
+    assert not any('transactions_category' in sql for sql in metrics.shapes)
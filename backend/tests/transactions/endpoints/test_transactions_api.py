@@ -0,0 +1,180 @@
+import pytest
+from datetime import date
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from transactions.models import Transaction
+
+pytestmark = pytest.mark.django_db
+URL = '/api/transactions/'
+
+
+def test_list_returns_etag_and_last_modified(authenticated_client, user, standard_category):
+    Transaction.objects.create(
+        owner=user, category=standard_category, amount=10, date=date(2025, 1, 1)
+    )
+
+    response = authenticated_client.get(URL)
+
+    assert response.status_code == 200
+    assert response['ETag'].startswith('W/"')
+    assert 'Last-Modified' in response
+
+
+def test_list_not_modified_skips_query(authenticated_client, user, standard_category):
+    Transaction.objects.create(
+        owner=user, category=standard_category, amount=10, date=date(2025, 1, 1)
+    )
+    etag = authenticated_client.get(URL)['ETag']
+
+    with CaptureQueriesContext(connection) as queries:
+        response = authenticated_client.get(URL, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 304
+    assert not any('transactions_transaction' in q['sql'] for q in queries)
+
+
+def test_list_etag_changes_after_write(authenticated_client, user, standard_category):
+    etag = authenticated_client.get(URL)['ETag']
+
+    authenticated_client.post(URL, {
+        'category': standard_category.id, 'amount': '5.00', 'date': '2025-01-02'
+    })
+
+    response = authenticated_client.get(URL, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response['ETag'] != etag
+    assert response.data['results'][0]['updated_at'] is not None
+
+
+def test_list_if_modified_since(authenticated_client, user, standard_category):
+    Transaction.objects.create(
+        owner=user, category=standard_category, amount=10, date=date(2025, 1, 1)
+    )
+    last_modified = authenticated_client.get(URL)['Last-Modified']
+
+    response = authenticated_client.get(URL, HTTP_IF_MODIFIED_SINCE=last_modified)
+    assert response.status_code == 304
+
+
+def test_list_cursor_pagination(authenticated_client, user, standard_category):
+    for day in range(1, 6):
+        Transaction.objects.create(
+            owner=user, category=standard_category, amount=day, date=date(2025, 1, day)
+        )
+        Transaction.objects.create(
+            owner=user, category=standard_category, amount=day, date=date(2025, 1, day)
+        )
+
+    url = f'{URL}?page_size=3'
+    seen = []
+    while url:
+        response = authenticated_client.get(url)
+        assert response.status_code == 200
+        seen.extend((item['date'], item['id']) for item in response.data['results'])
+        url = response.data['next']
+
+    assert len(seen) == 10
+    assert seen == sorted(seen, reverse=True)
+
+
+def test_list_matches_model_serializer(authenticated_client, user, standard_category):
+    transaction = Transaction.objects.create(
+        owner=user, category=standard_category, amount='12.50',
+        date=date(2025, 1, 1), description='Silpo'
+    )
+
+    listed = authenticated_client.get(URL).data['results'][0]
+    detail = authenticated_client.get(f'{URL}{transaction.id}/').data
+
+    assert dict(listed) == dict(detail)
+
+
+def test_list_search_ranks_and_paginates(authenticated_client, user, user2, standard_category):
+    for day, description in enumerate([
+        'Silpo', 'Silpo Silpo groceries', 'Uber ride', 'silpo market', 'ATB'
+    ], start=1):
+        Transaction.objects.create(
+            owner=user, category=standard_category, amount=day,
+            date=date(2025, 1, day), description=description
+        )
+    Transaction.objects.create(
+        owner=user2, category=standard_category, amount=1,
+        date=date(2025, 1, 1), description='Silpo'
+    )
+
+    response = authenticated_client.get(URL, {'search': 'silp', 'page_size': 2})
+    assert response.status_code == 200
+    first_page = response.data['results']
+    assert first_page[0]['description'] == 'Silpo Silpo groceries'
+
+    response = authenticated_client.get(response.data['next'])
+    descriptions = [t['description'] for t in first_page + response.data['results']]
+    assert sorted(descriptions) == ['Silpo', 'Silpo Silpo groceries', 'silpo market']
+    assert response.data['next'] is None
+
+
+def test_list_search_matches_every_word(authenticated_client, user, standard_category):
+    Transaction.objects.create(
+        owner=user, category=standard_category, amount=1,
+        date=date(2025, 1, 1), description='Uber ride to airport'
+    )
+    Transaction.objects.create(
+        owner=user, category=standard_category, amount=1,
+        date=date(2025, 1, 2), description='Uber Eats'
+    )
+
+    response = authenticated_client.get(URL, {'search': 'uber air'})
+    assert [t['description'] for t in response.data['results']] == ['Uber ride to airport']
+
+    response = authenticated_client.get(URL, {'search': '&|!'})
+    assert response.data['results'] == []
+
+
+def test_list_filters(authenticated_client, user, standard_category, category_factory):
+    groceries = category_factory(owner=user, name='Groceries')
+    salary = category_factory(owner=None, name='Salary', type='INCOME')
+    rows = [
+        (groceries, 600, date(2025, 3, 5)),
+        (groceries, 300, date(2025, 3, 6)),
+        (groceries, 900, date(2025, 2, 27)),
+        (standard_category, 700, date(2025, 3, 7)),
+        (salary, 5000, date(2025, 3, 1)),
+    ]
+    for category, amount, day in rows:
+        Transaction.objects.create(owner=user, category=category, amount=amount, date=day)
+
+    def amounts(params):
+        response = authenticated_client.get(URL, params)
+        assert response.status_code == 200
+        return sorted(int(float(t['amount'])) for t in response.data['results'])
+
+    march = {'date_from': '2025-03-01', 'date_to': '2025-03-31'}
+    assert amounts({**march, 'category': groceries.id, 'amount_min': 500}) == [600]
+    assert amounts({**march, 'category': f'{groceries.id},{standard_category.id}'}) == [
+        300, 600, 700
+    ]
+    assert amounts({'type': 'INCOME'}) == [5000]
+    assert amounts({'type': 'EXPENSE', 'amount_max': 700}) == [300, 600, 700]
+
+
+def test_list_filters_reject_invalid_values(authenticated_client):
+    response = authenticated_client.get(URL, {'category': 'food'})
+    assert response.status_code == 400
+
+    response = authenticated_client.get(URL, {'type': 'TRANSFER'})
+    assert response.status_code == 400
+
+
+def test_list_query_budget(authenticated_client, user, standard_category, assert_query_budget):
+    Transaction.objects.bulk_create([
+        Transaction(owner=user, category=standard_category, amount=day, date=date(2025, 1, day))
+        for day in range(1, 29)
+    ])
+
+    # The data version for the ETag, then the page itself.
+    with assert_query_budget(2):
+        response = authenticated_client.get(URL, {'type': 'EXPENSE', 'amount_min': 5})
+    with assert_query_budget(2):
+        response = authenticated_client.get(URL)
+
+    assert len(response.data['results']) == 28
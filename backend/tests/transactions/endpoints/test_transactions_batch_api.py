@@ -0,0 +1,107 @@
+import pytest
+from decimal import Decimal
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from transactions.models import Transaction
+
+pytestmark = pytest.mark.django_db
+URL = '/api/transactions/batch/'
+
+
+def test_batch_create_validates_categories_in_one_query(
+        authenticated_client, user, user2, standard_category, category_factory,
+        django_assert_max_num_queries
+):
+    foreign_category = category_factory(owner=user2)
+    items = [
+        {'category': standard_category.id, 'amount': '10.00', 'date': '2025-01-01'}
+        for _ in range(50)
+    ]
+    items.append({'category': foreign_category.id, 'amount': '1.00', 'date': '2025-01-01'})
+    items.append({'category': standard_category.id, 'amount': 'abc', 'date': '2025-01-01'})
+
+    with django_assert_max_num_queries(5):
+        response = authenticated_client.post(URL, items, format='json')
+
+    assert response.status_code == 200
+    results = response.data['results']
+    assert [r['status'] for r in results] == ['created'] * 50 + ['invalid', 'invalid']
+    assert 'category' in results[50]['errors']
+    assert 'amount' in results[51]['errors']
+    assert results[0]['data']['id'] is not None
+    assert Transaction.objects.filter(owner=user).count() == 50
+
+
+def test_batch_update(authenticated_client, user, user2, standard_category):
+    own = Transaction.objects.create(
+        owner=user, category=standard_category, amount=1, date='2025-01-01'
+    )
+    foreign = Transaction.objects.create(
+        owner=user2, category=standard_category, amount=1, date='2025-01-01'
+    )
+
+    response = authenticated_client.patch(URL, [
+        {'id': own.id, 'amount': '99.50', 'description': 'fixed'},
+        {'id': foreign.id, 'amount': '5.00'},
+        {'id': own.id + foreign.id + 100, 'amount': '5.00'},
+    ], format='json')
+
+    assert response.status_code == 200
+    assert [r['status'] for r in response.data['results']] == [
+        'updated', 'not_found', 'not_found'
+    ]
+    own.refresh_from_db()
+    foreign.refresh_from_db()
+    assert own.amount == Decimal('99.50')
+    assert own.description == 'fixed'
+    assert foreign.amount == 1
+
+
+def test_batch_update_locks_rows_and_writes_only_sent_fields(
+        authenticated_client, user, standard_category
+):
+    first, second = Transaction.objects.bulk_create([
+        Transaction(owner=user, category=standard_category, amount=1, date='2025-01-01'),
+        Transaction(owner=user, category=standard_category, amount=2, date='2025-01-02'),
+    ])
+
+    with CaptureQueriesContext(connection) as queries:
+        response = authenticated_client.patch(URL, [
+            {'id': first.id, 'amount': '10.00'},
+            {'id': second.id, 'description': 'taxi'},
+        ], format='json')
+
+    assert [r['status'] for r in response.data['results']] == ['updated', 'updated']
+    sql = [query['sql'] for query in queries]
+    assert any('FOR UPDATE' in statement for statement in sql)
+    updates = [s for s in sql if s.startswith('UPDATE "transactions_transaction"')]
+    assert len(updates) == 2
+    assert all(('"amount"' in s) != ('"description"' in s) for s in updates)
+    assert not any('"date"' in s or '"category_id"' in s for s in updates)
+    assert list(Transaction.objects.order_by('id').values_list('amount', 'description')) == [
+        (Decimal('10.00'), ''), (Decimal('2.00'), 'taxi')
+    ]
+
+
+def test_batch_delete(authenticated_client, user, user2, standard_category):
+    own = Transaction.objects.create(
+        owner=user, category=standard_category, amount=1, date='2025-01-01'
+    )
+    foreign = Transaction.objects.create(
+        owner=user2, category=standard_category, amount=1, date='2025-01-01'
+    )
+
+    response = authenticated_client.delete(URL, {'ids': [own.id, foreign.id]}, format='json')
+
+    assert response.status_code == 200
+    assert response.data['results'] == [
+        {'id': own.id, 'status': 'deleted'}, {'id': foreign.id, 'status': 'not_found'}
+    ]
+    assert not Transaction.objects.filter(id=own.id).exists()
+    assert Transaction.objects.filter(id=foreign.id).exists()
+
+
+def test_batch_rejects_non_list(authenticated_client):
+    response = authenticated_client.post(URL, {'amount': 1}, format='json')
+
+    assert response.status_code == 400
@@ -0,0 +1,151 @@
+import csv
+import io
+import pytest
+from decimal import Decimal
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from transactions.importers import StatementImportError, import_statement
+from transactions.models import Category, Transaction
+
+pytestmark = pytest.mark.django_db
+URL = '/api/transactions/import/'
+
+CSV_STATEMENT = (
+    "Date,Amount,Description,Category\n"
+    "2025-01-05,-120.50,Silpo groceries,Products\n"
+    "05.01.2025,-40,Coffee,\n"
+    "05.01.2025,-40,Coffee,\n"
+    "2025-01-06,1500,Salary,\n"
+    "not-a-date,-1,Broken,\n"
+)
+
+OFX_STATEMENT = """OFXHEADER:100
+DATA:OFXSGML
+<OFX><BANKMSGSRSV1><STMTTRNRS><STMTRS><BANKTRANLIST>
+<STMTTRN>
+<TRNTYPE>DEBIT
+<DTPOSTED>20250107120000
+<TRNAMT>-15.00
+<NAME>Metro
+<MEMO>Card payment
+</STMTTRN>
+<STMTTRN><TRNTYPE>CREDIT<DTPOSTED>20250108<TRNAMT>200.00<NAME>Refund</STMTTRN>
+</BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1></OFX>
+"""
+
+
+def upload(client, content, name):
+    file = SimpleUploadedFile(name, content.encode('utf-8'))
+    return client.post(URL, {'file': file}, format='multipart')
+
+
+def test_import_csv(authenticated_client, user, standard_category, category_factory):
+    other_expense = category_factory(owner=None, name='Other')
+    other_income = category_factory(owner=None, name='Other', type=Category.CategoryType.INCOME)
+
+    response = upload(authenticated_client, CSV_STATEMENT, 'statement.csv')
+
+    assert response.status_code == 200
+    assert response.data['created'] == 4
+    assert response.data['invalid'] == 1
+    assert response.data['errors'][0]['line'] == 6
+
+    rows = Transaction.objects.filter(owner=user).order_by('date', 'amount')
+    assert [(str(t.date), t.amount, t.category_id) for t in rows] == [
+        ('2025-01-05', Decimal('40.00'), other_expense.id),
+        ('2025-01-05', Decimal('40.00'), other_expense.id),
+        ('2025-01-05', Decimal('120.50'), standard_category.id),
+        ('2025-01-06', Decimal('1500.00'), other_income.id),
+    ]
+
+
+def test_reimport_skips_existing_rows(authenticated_client, user):
+    Transaction.objects.create(owner=user, amount=40, date='2025-01-05', description='coffee')
+
+    response = upload(authenticated_client, CSV_STATEMENT, 'statement.csv')
+    assert response.data['created'] == 3
+    assert response.data['duplicates'] == 1
+
+    response = upload(authenticated_client, CSV_STATEMENT, 'statement.csv')
+    assert response.data['created'] == 0
+    assert response.data['duplicates'] == 4
+    assert Transaction.objects.filter(owner=user).count() == 4
+
+
+def test_import_ofx(authenticated_client, user):
+    response = upload(authenticated_client, OFX_STATEMENT, 'statement.ofx')
+
+    assert response.status_code == 200
+    assert response.data['created'] == 2
+    descriptions = set(
+        Transaction.objects.filter(owner=user).values_list('date', 'amount', 'description')
+    )
+    assert {(str(d), a, desc) for d, a, desc in descriptions} == {
+        ('2025-01-07', Decimal('15.00'), 'Metro Card payment'),
+        ('2025-01-08', Decimal('200.00'), 'Refund'),
+    }
+
+
+def test_import_rejects_unknown_format_and_bad_header(authenticated_client):
+    response = upload(authenticated_client, CSV_STATEMENT, 'statement.txt')
+    assert response.status_code == 400
+    assert 'format' in response.data
+
+    response = upload(authenticated_client, "when,how much\n", 'statement.csv')
+    assert response.status_code == 400
+    assert 'file' in response.data
+
+
+def test_import_reports_malformed_rows_and_oversized_amounts(authenticated_client, user):
+    statement = (
+        "Date,Amount,Description\n"
+        "2025-01-05,-10,Coffee, milk\n"
+        "2025-01-05,-100000000,Car\n"
+        "2025-01-05,-99999999.999,Rounded up\n"
+        "2025-01-05,1e40,Huge\n"
+        "2025-01-06,-99999999.99,House\n"
+    )
+
+    response = upload(authenticated_client, statement, 'statement.csv')
+
+    assert response.status_code == 200
+    assert response.data['created'] == 1
+    assert [error['line'] for error in response.data['errors']] == [2, 3, 4, 5]
+    assert 'fields' in response.data['errors'][0]['error']
+    assert Transaction.objects.get(owner=user).amount == Decimal('99999999.99')
+
+
+def test_import_command_uses_fixed_batches(user, tmp_path, django_assert_max_num_queries):
+    path = tmp_path / 'statement.csv'
+    lines = ["date,amount,description"]
+    lines += [f"2025-02-{day % 28 + 1:02d},-{day + 1},Row {day}" for day in range(250)]
+    path.write_text("\n".join(lines))
+
+    with django_assert_max_num_queries(15):
+        call_command('import_statement', str(path), email=user.email, batch_size=100)
+
+    assert Transaction.objects.filter(owner=user).count() == 250
+
+
+@pytest.mark.parametrize('batch_size', [1, 2, 1000])
+def test_duplicates_do_not_depend_on_batch_size(user, batch_size):
+    Transaction.objects.create(owner=user, amount=40, date='2025-01-05', description='Coffee')
+    statement = "date,amount,description\n" + "2025-01-05,-40,Coffee\n" * 3
+
+    summary = import_statement(user, io.BytesIO(statement.encode()), 'csv', batch_size)
+
+    assert (summary['created'], summary['duplicates']) == (2, 1)
+    assert Transaction.objects.filter(owner=user).count() == 3
+
+
+def test_malformed_file_imports_nothing(user):
+    statement = (
+        "date,amount,description\n"
+        "2025-01-05,-40,Coffee\n"
+        f"2025-01-06,-10,{'x' * (csv.field_size_limit() + 1)}\n"
+    )
+
+    with pytest.raises(StatementImportError):
+        import_statement(user, io.BytesIO(statement.encode()), 'csv', batch_size=1)
+
+    assert not Transaction.objects.filter(owner=user).exists()
@@ -0,0 +1,166 @@
+import pytest
+from datetime import date, datetime, timezone as dt_timezone
+from decimal import Decimal
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.utils import timezone
+from reports.rollup import find_rollup_mismatches
+from sync.models import Tombstone
+from transactions.models import Transaction
+from transactions.partitioning import (
+    DEFAULT_PARTITION,
+    create_partitions,
+    get_partitions,
+    is_partitioned,
+    partition_table,
+    unpartition_table
+)
+
+pytestmark = pytest.mark.django_db
+
+TODAY = date(2025, 6, 15)
+TODAY_NOW = datetime(2025, 6, 15, 12, tzinfo=dt_timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def plain_table(db):
+    # The suite may run against a schema migrated with TRANSACTIONS_PARTITION_INTERVAL.
+    with connection.cursor() as cursor:
+        if is_partitioned(cursor):
+            unpartition_table(cursor)
+
+
+@pytest.fixture
+def partitioned(user, standard_category):
+    Transaction.objects.bulk_create([
+        Transaction(owner=user, category=standard_category, amount=10, date=date(2025, 1, 5)),
+        Transaction(owner=user, category=standard_category, amount=20, date=date(2025, 3, 9)),
+    ])
+    with connection.cursor() as cursor:
+        partition_table(cursor, 'month', TODAY, 2)
+
+
+def partition_names():
+    with connection.cursor() as cursor:
+        return [name for name, _ in get_partitions(cursor).values()]
+
+
+def test_partition_table_keeps_rows_ids_and_triggers(partitioned, user, standard_category):
+    assert partition_names() == [
+        'transactions_transaction_p2025_01', 'transactions_transaction_p2025_03',
+        'transactions_transaction_p2025_06', 'transactions_transaction_p2025_07',
+        'transactions_transaction_p2025_08',
+    ]
+    assert Transaction.objects.count() == 2
+    last_id = Transaction.objects.order_by('-id').values_list('id', flat=True)[0]
+
+    moved = Transaction.objects.create(
+        owner=user, category=standard_category, amount=5, date=date(2025, 6, 1)
+    )
+    assert moved.id > last_id
+
+    # Cross-partition update, then delete: rollup, sync and versions still follow.
+    moved.date = date(2025, 1, 20)
+    moved.amount = 7
+    moved.save()
+    assert Transaction.objects.get(id=moved.id).date == date(2025, 1, 20)
+    moved_id = moved.id
+    moved.delete()
+
+    assert find_rollup_mismatches() == []
+    assert Tombstone.objects.filter(
+        kind=Tombstone.Kind.TRANSACTION, object_id=moved_id, user=user
+    ).exists()
+
+
+def test_date_bounded_queries_prune_partitions(partitioned, user):
+    queryset = Transaction.objects.filter(
+        owner=user, date__gte=date(2025, 3, 1), date__lte=date(2025, 3, 31)
+    )
+    with connection.cursor() as cursor:
+        sql, params = queryset.query.sql_with_params()
+        cursor.execute(f'EXPLAIN {sql}', params)
+        plan = '\n'.join(row[0] for row in cursor.fetchall())
+
+    assert 'transactions_transaction_p2025_03' in plan
+    assert 'transactions_transaction_p2025_01' not in plan
+    assert DEFAULT_PARTITION not in plan
+
+
+def test_reports_work_on_partitioned_table(partitioned, authenticated_client):
+    params = {'date_from': '2025-03-01', 'date_to': '2025-12-31'}
+
+    summary = authenticated_client.get('/api/reports/by-category/', params)
+    activity = authenticated_client.get('/api/reports/activity/', params)
+
+    assert summary.data['total_spent'] == Decimal('20.00')
+    assert [item['amount'] for item in activity.data['results']] == ['20.00']
+
+
+def test_create_partitions_moves_rows_out_of_default(partitioned, user, standard_category):
+    late = Transaction.objects.create(
+        owner=user, category=standard_category, amount=3, date=date(2030, 2, 2)
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT count(*) FROM {DEFAULT_PARTITION}')
+        assert cursor.fetchone()[0] == 1
+
+        assert create_partitions(cursor, [date(2030, 2, 1)], 'month') == [
+            'transactions_transaction_p2030_02'
+        ]
+        cursor.execute(f'SELECT count(*) FROM {DEFAULT_PARTITION}')
+        assert cursor.fetchone()[0] == 0
+        cursor.execute('SELECT id FROM transactions_transaction_p2030_02')
+        assert cursor.fetchall() == [(late.id,)]
+
+    assert find_rollup_mismatches() == []
+    assert not Tombstone.objects.filter(object_id=late.id).exists()
+
+
+def test_command_splits_default_partition(partitioned, user, standard_category):
+    Transaction.objects.create(
+        owner=user, category=standard_category, amount=3, date=date(2024, 11, 30)
+    )
+
+    call_command('transaction_partitions', '--split-default')
+
+    assert 'transactions_transaction_p2024_11' in partition_names()
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT count(*) FROM {DEFAULT_PARTITION}')
+        assert cursor.fetchone()[0] == 0
+
+
+def test_command_creates_future_partitions_and_detaches(partitioned, monkeypatch):
+    monkeypatch.setattr('django.utils.timezone.now', lambda: TODAY_NOW)
+
+    call_command('transaction_partitions', '--ahead=4', '--detach-before=2025-02-01')
+
+    names = partition_names()
+    assert 'transactions_transaction_p2025_01' not in names
+    assert names[-1] == 'transactions_transaction_p2025_10'
+    assert Transaction.objects.count() == 1
+
+
+def test_command_requires_partitioned_table_or_convert(user, standard_category):
+    with pytest.raises(CommandError):
+        call_command('transaction_partitions')
+
+    call_command('transaction_partitions', convert=True, interval='year', ahead=1)
+
+    year = timezone.now().year
+    with connection.cursor() as cursor:
+        assert is_partitioned(cursor)
+    assert partition_names() == [
+        f'transactions_transaction_p{year}', f'transactions_transaction_p{year + 1}'
+    ]
+
+
+def test_unpartition_table(partitioned):
+    with connection.cursor() as cursor:
+        unpartition_table(cursor)
+        assert not is_partitioned(cursor)
+
+    assert Transaction.objects.count() == 2
+    assert find_rollup_mismatches() == []
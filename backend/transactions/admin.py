@@ -1,5 +1,18 @@
 from django.contrib import admin
 from .models import Transaction, Category
 
-admin.site.register(Transaction)
-admin.site.register(Category)
+
+@admin.register(Transaction)
+class TransactionAdmin(admin.ModelAdmin):
+    list_select_related = ('owner',)
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        # Category.__str__ shows the owner's email.
+        if db_field.name == 'category':
+            kwargs['queryset'] = Category.objects.select_related('owner')
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
+
+@admin.register(Category)
+class CategoryAdmin(admin.ModelAdmin):
+    list_select_related = ('owner',)
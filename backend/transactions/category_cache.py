@@ -0,0 +1,201 @@
+import threading
+import uuid
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Category
+
+CACHED_FIELDS = ('id', 'name', 'type', 'owner_id', 'updated_at')
+STANDARD_SCOPE = 'standard'
+
+
+class CategoryLookup:
+    """
+    Read-only view of a set of categories: name -> id and id -> (type, owner_id) maps,
+    plus Category instances built from the cached rows without a query. When built for
+    a user, personal categories override standard ones with the same name and type.
+    """
+
+    def __init__(self, rows):
+        self.rows = sorted(rows, key=lambda row: row['id'])
+        self.by_id = {row['id']: row for row in self.rows}
+        self.by_name = {}
+        self.by_plain_name = {}
+        for row in sorted(self.rows, key=lambda row: (row['owner_id'] is not None, row['id'])):
+            name = row['name'].lower()
+            self.by_name[(name, row['type'])] = row['id']
+            if row['owner_id'] is None:
+                self.by_plain_name.setdefault(name, row['id'])
+
+    def __contains__(self, category_id):
+        return category_id in self.by_id
+
+    def get_id(self, name, category_type=None):
+        """
+        Id of the category called `name` (case-insensitive). Without a type only standard
+        categories are matched, lowest id first.
+        """
+        if category_type is None:
+            return self.by_plain_name.get(name.lower())
+        return self.by_name.get((name.lower(), category_type))
+
+    def get_type_owner(self, category_id):
+        row = self.by_id.get(category_id)
+        return (row['type'], row['owner_id']) if row else None
+
+    def get_instance(self, category_id):
+        row = self.by_id.get(category_id)
+        if row is None:
+            return None
+        return Category.from_db(
+            None, CACHED_FIELDS, [row[field] for field in CACHED_FIELDS]
+        )
+
+    def instances(self):
+        return [self.get_instance(row['id']) for row in self.rows]
+
+
+class _LocalCache:
+    """
+    Small thread-safe LRU of built lookups, keyed by scope and tagged with the shared
+    cache versions they were built from.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key, version):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry[0] != version:
+                return None
+            self.entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, version, value):
+        with self.lock:
+            self.entries[key] = (version, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+
+
+_local = _LocalCache(settings.CATEGORY_CACHE_LOCAL_SIZE)
+
+
+def _version_key(scope):
+    return f'categories:version:{scope}'
+
+
+def _rows_key(scope, version):
+    return f'categories:rows:{scope}:{version}'
+
+
+def _user_scope(user_id):
+    return f'user:{user_id}'
+
+
+def _scope_owner(scope):
+    return None if scope == STANDARD_SCOPE else int(scope.split(':')[1])
+
+
+def _version_timeout():
+    # A per-process cache never sees other workers' invalidations; expiring its versions
+    # bounds how long they serve stale lookups. Shared versions live until invalidated.
+    return None if settings.CATEGORY_CACHE_SHARED else settings.CATEGORY_CACHE_VERSION_TIMEOUT
+
+
+def _get_versions(*scopes):
+    # Versions are random tokens rather than counters, so a version key lost to eviction,
+    # a flush or expiry can never come back with a value some process still holds.
+    keys = {scope: _version_key(scope) for scope in scopes}
+    found = cache.get_many(keys.values())
+    versions = []
+    for scope, key in keys.items():
+        version = found.get(key)
+        if version is None:
+            version = uuid.uuid4().hex
+            cache.add(key, version, _version_timeout())
+            version = cache.get(key, version)
+        versions.append(version)
+    return versions
+
+
+def _load_rows(scopes, versions):
+    """
+    Rows of each scope from the shared cache; scopes missing there are read with a
+    single query and stored back.
+    """
+    keys = {scope: _rows_key(scope, version) for scope, version in zip(scopes, versions)}
+    found = cache.get_many(keys.values())
+    rows = {scope: found[key] for scope, key in keys.items() if key in found}
+
+    missing = [scope for scope in scopes if scope not in rows]
+    if missing:
+        owner_ids = [_scope_owner(scope) for scope in missing]
+        condition = Q(owner_id__in=[i for i in owner_ids if i is not None])
+        if None in owner_ids:
+            condition |= Q(owner=None)
+        for scope in missing:
+            rows[scope] = []
+        for row in Category.objects.filter(condition).values(*CACHED_FIELDS):
+            owner_id = row['owner_id']
+            rows[STANDARD_SCOPE if owner_id is None else _user_scope(owner_id)].append(row)
+        cache.set_many(
+            {keys[scope]: rows[scope] for scope in missing}, settings.CATEGORY_CACHE_TIMEOUT
+        )
+
+    return [row for scope in scopes for row in rows[scope]]
+
+
+def _get_lookup(*scopes):
+    versions = tuple(_get_versions(*scopes))
+    local_key = scopes[-1]
+    lookup = _local.get(local_key, versions)
+    if lookup is None:
+        lookup = CategoryLookup(_load_rows(scopes, versions))
+        _local.set(local_key, versions, lookup)
+    return lookup
+
+
+def get_standard_categories():
+    """
+    CategoryLookup of the standard (ownerless) categories.
+    """
+    return _get_lookup(STANDARD_SCOPE)
+
+
+def get_user_categories(user_id):
+    """
+    CategoryLookup of the categories visible to a user: standard plus personal.
+    A warm lookup costs one shared cache round trip (the version tokens) and no queries;
+    the maps themselves are kept in process and in the shared cache.
+    """
+    return _get_lookup(STANDARD_SCOPE, _user_scope(user_id))
+
+
+def invalidate_categories(owner_id=None):
+    """
+    Drops the cached categories of one owner; None means the standard ones, which are
+    part of every user's lookup. Writes through the ORM call this automatically;
+    queryset.update() and raw SQL do not and have to call it themselves.
+    """
+    scope = STANDARD_SCOPE if owner_id is None else _user_scope(owner_id)
+    cache.set(_version_key(scope), uuid.uuid4().hex, _version_timeout())
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_on_change(sender, instance, **kwargs):
+    # Invalidate now for this connection's own reads and again on commit, in case another
+    # request refilled the cache from the old rows while the transaction was open.
+    invalidate_categories(instance.owner_id)
+    transaction.on_commit(lambda: invalidate_categories(instance.owner_id))
@@ -0,0 +1,55 @@
+import django_filters
+from .models import Category, Transaction
+from .search import search_descriptions
+
+
+class NumberInFilter(django_filters.BaseInFilter, django_filters.NumberFilter):
+    pass
+
+
+class TransactionFilter(django_filters.FilterSet):
+    """
+    Date and category filters map onto the (owner, [category,] date, id) composite indexes;
+    amount and type are checked on the rows those index scans return.
+    """
+    date_from = django_filters.DateFilter(
+        field_name='date',
+        lookup_expr='gte',
+        label='Date From (YYYY-MM-DD)'
+    )
+    date_to = django_filters.DateFilter(
+        field_name='date',
+        lookup_expr='lte',
+        label='Date To (YYYY-MM-DD)'
+    )
+    category = NumberInFilter(
+        field_name='category',
+        lookup_expr='in',
+        label='Category ID or comma-separated list of IDs'
+    )
+    amount_min = django_filters.NumberFilter(
+        field_name='amount',
+        lookup_expr='gte',
+        label='Minimum Amount'
+    )
+    amount_max = django_filters.NumberFilter(
+        field_name='amount',
+        lookup_expr='lte',
+        label='Maximum Amount'
+    )
+    type = django_filters.ChoiceFilter(
+        field_name='category__type',
+        choices=Category.CategoryType.choices,
+        label='Category Type'
+    )
+    search = django_filters.CharFilter(
+        method='filter_search',
+        label='Search descriptions (full-text prefix match, best matches first)'
+    )
+
+    class Meta:
+        model = Transaction
+        fields = ['date_from', 'date_to', 'category', 'amount_min', 'amount_max', 'type', 'search']
+
+    def filter_search(self, queryset, name, value):
+        return search_descriptions(queryset, value)
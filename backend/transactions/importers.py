@@ -0,0 +1,264 @@
+import csv
+import hashlib
+import io
+import os
+import re
+from collections import Counter
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+
+from django.db import transaction
+
+from .category_cache import get_user_categories
+from .models import Category, Transaction
+
+DATE_FORMATS = ('%Y-%m-%d', '%d.%m.%Y', '%d/%m/%Y', '%Y%m%d')
+MAX_REPORTED_ERRORS = 100
+AMOUNT_FIELD = Transaction._meta.get_field('amount')
+MAX_AMOUNT = Decimal(10) ** (AMOUNT_FIELD.max_digits - AMOUNT_FIELD.decimal_places)
+CENT = Decimal(10) ** -AMOUNT_FIELD.decimal_places
+OFX_TAG_RE = re.compile(r'^(/?)([A-Z0-9.]+)>(.*)$', re.DOTALL)
+
+
+class StatementImportError(ValueError):
+    pass
+
+
+def parse_csv_statement(stream):
+    """
+    Yields raw rows from a CSV statement with a header containing `date`, `amount`,
+    `description` and optionally `category`. Reads the file line by line.
+    """
+    reader = csv.DictReader(stream)
+    header = {name.strip().lower() for name in (reader.fieldnames or [])}
+    missing = {'date', 'amount'} - header
+    if missing:
+        raise StatementImportError(f"CSV header is missing: {', '.join(sorted(missing))}")
+
+    for row in reader:
+        if None in row:
+            # DictReader puts the values beyond the header under the key None.
+            yield {
+                'line': reader.line_num,
+                'error': f"Row has {len(reader.fieldnames) + len(row[None])} fields, "
+                         f"the header has {len(reader.fieldnames)}",
+            }
+            continue
+
+        row = {key.strip().lower(): (value or '').strip() for key, value in row.items()}
+        yield {
+            'line': reader.line_num,
+            'date': row.get('date', ''),
+            'amount': row.get('amount', ''),
+            'description': row.get('description', ''),
+            'category': row.get('category', ''),
+        }
+
+
+def _ofx_tokens(stream, chunk_size=64 * 1024):
+    # OFX 1.x is SGML without closing tags, OFX 2.x is XML; splitting on '<'
+    # handles both, one chunk at a time.
+    buffer = ''
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        buffer += chunk
+        *tokens, buffer = buffer.split('<')
+        yield from tokens
+    yield buffer
+
+
+def parse_ofx_statement(stream):
+    """
+    Yields raw rows from the <STMTTRN> blocks of an OFX statement.
+    """
+    current = None
+    number = 0
+    for token in _ofx_tokens(stream):
+        match = OFX_TAG_RE.match(token.strip())
+        if not match:
+            continue
+        closing, tag, value = match.groups()
+        value = value.strip()
+
+        if tag == 'STMTTRN':
+            if closing and current is not None:
+                yield current
+                current = None
+            elif not closing:
+                number += 1
+                current = {
+                    'line': number, 'date': '', 'amount': '', 'description': '', 'category': ''
+                }
+        elif current is not None and not closing and value:
+            if tag == 'DTPOSTED':
+                current['date'] = value[:8]
+            elif tag == 'TRNAMT':
+                current['amount'] = value
+            elif tag in ('NAME', 'MEMO'):
+                current['description'] = ' '.join(filter(None, [current['description'], value]))
+
+    if current is not None:
+        yield current
+
+
+STATEMENT_PARSERS = {
+    'csv': parse_csv_statement,
+    'ofx': parse_ofx_statement,
+}
+
+
+def description_hash(description):
+    normalized = ' '.join(description.lower().split())
+    return hashlib.sha1(normalized.encode('utf-8')).hexdigest()
+
+
+class StatementImporter:
+    """
+    Imports parsed statement rows for one user in fixed-size batches.
+    Negative amounts are expenses and positive ones are income; amounts are stored
+    as absolute values with the category carrying the type, as elsewhere in the app.
+    Rows already present (same date, amount and description hash) are skipped, counted
+    as a multiset: a statement with two identical rows against one stored row adds one.
+    Rows handled earlier in the same import are left out of that count, so the result
+    does not depend on the batch size.
+    """
+
+    def __init__(self, user, batch_size=1000):
+        self.user = user
+        self.batch_size = batch_size
+        self.created = 0
+        self.duplicates = 0
+        self.errors = []
+        self.error_count = 0
+        # Keys of every row handled so far, created or matched to a stored row.
+        self.seen_keys = Counter()
+        # Personal categories override standard ones with the same name.
+        self.categories = get_user_categories(user.id)
+
+    def _add_error(self, line, message):
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'line': line, 'error': message})
+
+    def _clean(self, raw):
+        if 'error' in raw:
+            raise ValueError(raw['error'])
+
+        for fmt in DATE_FORMATS:
+            try:
+                date = datetime.strptime(raw['date'], fmt).date()
+                break
+            except ValueError:
+                continue
+        else:
+            raise ValueError(f"Invalid date: {raw['date']!r}")
+
+        try:
+            amount = Decimal(raw['amount'].replace(' ', '').replace(',', '.'))
+        except InvalidOperation:
+            raise ValueError(f"Invalid amount: {raw['amount']!r}")
+        if not amount.is_finite() or amount == 0:
+            raise ValueError(f"Invalid amount: {raw['amount']!r}")
+        # Checked before quantize(), which fails for values beyond the decimal precision.
+        if abs(amount) >= MAX_AMOUNT or abs(amount).quantize(CENT) >= MAX_AMOUNT:
+            raise ValueError(f"Amount out of range: {raw['amount']!r}")
+
+        category_type = (
+            Category.CategoryType.EXPENSE if amount < 0 else Category.CategoryType.INCOME
+        )
+        name = raw['category'].lower() or 'other'
+        category_id = (
+            self.categories.get_id(name, category_type)
+            or self.categories.get_id('other', category_type)
+        )
+
+        return Transaction(
+            owner=self.user,
+            category_id=category_id,
+            amount=abs(amount).quantize(CENT),
+            date=date,
+            description=raw['description'][:500]
+        )
+
+    def _existing_keys(self, batch):
+        dates = [obj.date for obj in batch]
+        rows = Transaction.objects.filter(
+            owner=self.user,
+            date__gte=min(dates),
+            date__lte=max(dates),
+            amount__in={obj.amount for obj in batch}
+        ).values_list('date', 'amount', 'description')
+        existing = Counter(
+            (date, amount, description_hash(description)) for date, amount, description in rows
+        )
+        existing.subtract(self.seen_keys)
+        return existing
+
+    def _flush(self, batch):
+        if not batch:
+            return
+
+        existing = self._existing_keys(batch)
+        to_create = []
+        for obj in batch:
+            key = (obj.date, obj.amount, description_hash(obj.description))
+            if existing[key] > 0:
+                existing[key] -= 1
+                self.duplicates += 1
+            else:
+                to_create.append(obj)
+            self.seen_keys[key] += 1
+
+        Transaction.objects.bulk_create(to_create)
+        self.created += len(to_create)
+
+    def run(self, rows):
+        batch = []
+        for raw in rows:
+            try:
+                batch.append(self._clean(raw))
+            except ValueError as e:
+                self._add_error(raw['line'], str(e))
+                continue
+
+            if len(batch) >= self.batch_size:
+                self._flush(batch)
+                batch = []
+
+        self._flush(batch)
+
+        return {
+            'created': self.created,
+            'duplicates': self.duplicates,
+            'invalid': self.error_count,
+            'errors': self.errors,
+        }
+
+
+def detect_statement_format(filename):
+    extension = os.path.splitext(filename or '')[1].lower().lstrip('.')
+    if extension in ('qfx',):
+        return 'ofx'
+    return extension if extension in STATEMENT_PARSERS else None
+
+
+def import_statement(user, binary_file, statement_format, batch_size=1000):
+    """
+    Streams a binary statement file through the matching parser into StatementImporter,
+    in one transaction. Raises StatementImportError for an unreadable file or an unknown
+    format; nothing is imported then.
+    """
+    parser = STATEMENT_PARSERS.get(statement_format)
+    if parser is None:
+        raise StatementImportError(f"Unsupported statement format: {statement_format!r}")
+
+    stream = io.TextIOWrapper(binary_file, encoding='utf-8-sig', errors='replace', newline='')
+    try:
+        with transaction.atomic():
+            return StatementImporter(user, batch_size=batch_size).run(parser(stream))
+    except csv.Error as e:
+        raise StatementImportError(f"Malformed CSV: {e}")
+    finally:
+        stream.detach()
@@ -0,0 +1,250 @@
+import math
+import random
+import re
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from social.models import Friendship
+from splitting.models import SharedSpent, SharedSpentMember
+from transactions.models import Category, Transaction
+from users.models import CustomUser, Profile
+
+# (name, weight, median amount, spread of log(amount), merchants)
+EXPENSE_PROFILE = [
+    ('Groceries', 30, 350, 0.8, ['Silpo', 'ATB', 'Novus', 'Fora', 'Auchan', 'Varus']),
+    ('Restaurants', 14, 420, 0.7, ['Puzata Hata', "McDonald's", 'Lviv Croissants', 'Sushi Master']),
+    ('Transport', 15, 120, 0.6, ['Uber', 'Bolt', 'Uklon', 'WOG', 'OKKO', 'Metro']),
+    ('Housing', 2, 12000, 0.2, ['Apartment rent']),
+    ('Utilities', 4, 1800, 0.3, ['Electricity', 'Water', 'Internet', 'Kyivstar']),
+    ('Entertainment', 8, 500, 0.9, ['Multiplex', 'Netflix', 'Steam', 'Concert tickets']),
+    ('Health', 5, 700, 1.0, ['Apteka ANC', 'Dentist', 'Medical lab']),
+    ('Electronics', 2, 6000, 0.8, ['Rozetka', 'Comfy', 'Foxtrot']),
+    ('Clothing', 5, 1500, 0.7, ['Zara', 'H&M', 'Intertop']),
+    ('Other', 10, 300, 1.2, ['Nova Poshta', 'Gift', 'Cash withdrawal']),
+]
+INCOME_PROFILE = [
+    ('Salary', 4, 35000, 0.3, ['Salary']),
+    ('Other', 1, 2000, 1.0, ['Transfer', 'Cashback', 'Refund']),
+]
+INCOME_SHARE = 0.05
+SHARED_PROFILE = ['Restaurants', 'Groceries', 'Entertainment', 'Transport', 'Other']
+DEFAULT_END_DATE = '2025-12-31'
+
+
+class Command(BaseCommand):
+    help = (
+        'Generates a deterministic synthetic dataset (users, friendships, transactions and '
+        'shared spents) for load tests and benchmarks'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=100, help='Number of users.')
+        parser.add_argument(
+            '--transactions', type=int, default=1000, help='Personal transactions per user.'
+        )
+        parser.add_argument(
+            '--shared', type=int, default=50, help='Shared spents created per user.'
+        )
+        parser.add_argument(
+            '--max-participants', type=int, default=4,
+            help='Maximum number of friends in one shared spent.'
+        )
+        parser.add_argument('--friends', type=int, default=10, help='Friends per user.')
+        parser.add_argument('--days', type=int, default=730, help='Length of the date span.')
+        parser.add_argument(
+            '--end-date', default=DEFAULT_END_DATE,
+            help='Last day of the date span (YYYY-MM-DD); fixed so runs are reproducible.'
+        )
+        parser.add_argument('--seed', type=int, default=42, help='Random seed.')
+        parser.add_argument(
+            '--batch-size', type=int, default=5000, help='Rows per bulk INSERT.'
+        )
+        parser.add_argument(
+            '--prefix', default='load',
+            help='Generated users are named <prefix><n>@example.com.'
+        )
+        parser.add_argument(
+            '--clear', action='store_true',
+            help='Delete users generated earlier with the same prefix first.'
+        )
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+        self.end_date = date.fromisoformat(options['end_date'])
+        self.days = options['days']
+        prefix = options['prefix']
+
+        existing = CustomUser.objects.filter(username__regex=rf'^{re.escape(prefix)}[0-9]+$')
+        if existing.exists():
+            if not options['clear']:
+                raise CommandError(
+                    f"Users with prefix '{prefix}' already exist. Use --clear to replace them."
+                )
+            existing.delete()
+
+        started = time.monotonic()
+        with transaction.atomic():
+            expense, income = self.create_categories()
+            users = self.create_users(prefix, options['users'])
+            friends = self.create_friendships(users, options['friends'])
+            count = self.create_transactions(users, options['transactions'], expense, income)
+            shared = self.create_shared_spents(
+                users, friends, options['shared'], options['max_participants'], expense
+            )
+
+        with connection.cursor() as cursor:
+            for table in (
+                'transactions_transaction', 'splitting_sharedspent',
+                'splitting_sharedspentmember', 'reports_dailyspending'
+            ):
+                cursor.execute(f'ANALYZE {table}')
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Generated {len(users)} users, {count} transactions and {shared} shared spents "
+            f"in {time.monotonic() - started:.1f}s."
+        ))
+
+    def bulk_create(self, model, objs):
+        return model.objects.bulk_create(objs, batch_size=self.batch_size)
+
+    def create_categories(self):
+        def ensure(profile, category_type):
+            lookup = {}
+            for name, weight, median, sigma, merchants in profile:
+                category = Category.objects.filter(
+                    name=name, type=category_type, owner=None
+                ).order_by('id').first()
+                if category is None:
+                    category = Category.objects.create(name=name, type=category_type)
+                lookup[name] = (category, weight, median, sigma, merchants)
+            return lookup
+
+        return (
+            ensure(EXPENSE_PROFILE, Category.CategoryType.EXPENSE),
+            ensure(INCOME_PROFILE, Category.CategoryType.INCOME),
+        )
+
+    def create_users(self, prefix, count):
+        # Hashing is deliberately slow; every generated user shares one password.
+        password = make_password('loadtest123')
+        users = self.bulk_create(CustomUser, [
+            CustomUser(email=f'{prefix}{i}@example.com', username=f'{prefix}{i}', password=password)
+            for i in range(count)
+        ])
+        # bulk_create skips the post_save signal that creates profiles.
+        self.bulk_create(Profile, [
+            Profile(user=user, first_name='Load', last_name=str(i))
+            for i, user in enumerate(users)
+        ])
+        return users
+
+    def create_friendships(self, users, per_user):
+        """
+        Gives every user up to `per_user` friends by sampling random users directly, so the
+        cost grows with users * per_user instead of users². Friendships are written in
+        batches; the returned map (user id -> friends) is what shared spents draw from.
+        """
+        friends = {user.id: [] for user in users}
+        batch = []
+        for user in users:
+            wanted = per_user - len(friends[user.id])
+            known = {friend.id for friend in friends[user.id]}
+            # A bounded number of draws: near the end few users still have free slots.
+            for _ in range(max(wanted, 0) * 4):
+                if wanted <= 0:
+                    break
+                other = users[self.rng.randrange(len(users))]
+                if other.id == user.id or other.id in known or len(friends[other.id]) >= per_user:
+                    continue
+                known.add(other.id)
+                friends[user.id].append(other)
+                friends[other.id].append(user)
+                wanted -= 1
+                batch.append(
+                    Friendship(from_user=user, to_user=other, status=Friendship.Status.ACCEPTED)
+                )
+                if len(batch) >= self.batch_size:
+                    self.bulk_create(Friendship, batch)
+                    batch = []
+        self.bulk_create(Friendship, batch)
+        return friends
+
+    def pick(self, lookup):
+        entries = list(lookup.values())
+        return self.rng.choices(entries, weights=[entry[1] for entry in entries])[0]
+
+    def amount(self, median, sigma):
+        value = math.exp(self.rng.gauss(math.log(median), sigma))
+        return Decimal(str(max(round(value, 2), 1)))
+
+    def random_date(self):
+        return self.end_date - timedelta(days=self.rng.randrange(self.days))
+
+    def create_transactions(self, users, per_user, expense, income):
+        batch = []
+        total = 0
+        for user in users:
+            for _ in range(per_user):
+                lookup = income if self.rng.random() < INCOME_SHARE else expense
+                category, _, median, sigma, merchants = self.pick(lookup)
+                batch.append(Transaction(
+                    owner=user,
+                    category=category,
+                    amount=self.amount(median, sigma),
+                    date=self.random_date(),
+                    description=self.rng.choice(merchants)
+                ))
+                if len(batch) >= self.batch_size:
+                    total += len(self.bulk_create(Transaction, batch))
+                    batch = []
+        total += len(self.bulk_create(Transaction, batch))
+        return total
+
+    def create_shared_spents(self, users, friends, per_user, max_participants, expense):
+        spents = []
+        groups = []
+        total = 0
+        for user in users:
+            if not friends[user.id]:
+                continue
+            for _ in range(per_user):
+                category, _, median, sigma, merchants = expense[self.rng.choice(SHARED_PROFILE)]
+                size = self.rng.randint(1, min(max_participants, len(friends[user.id])))
+                group = self.rng.sample(friends[user.id], size)
+                spents.append(SharedSpent(
+                    owner=user,
+                    category=category,
+                    total_amount=self.amount(median * (size + 1), sigma),
+                    date=self.random_date(),
+                    description=self.rng.choice(merchants)
+                ))
+                groups.append(group)
+                if len(spents) >= self.batch_size:
+                    total += self.write_shared_spents(spents, groups)
+                    spents, groups = [], []
+        total += self.write_shared_spents(spents, groups)
+        return total
+
+    def write_shared_spents(self, spents, groups):
+        spents = self.bulk_create(SharedSpent, spents)
+        members = []
+        for spent, group in zip(spents, groups):
+            share = (spent.total_amount / (len(group) + 1)).quantize(Decimal('0.01'))
+            members.append(SharedSpentMember(
+                shared_spent=spent,
+                user=spent.owner,
+                amount=spent.total_amount - share * len(group),
+                is_owner_part=True
+            ))
+            members.extend(
+                SharedSpentMember(shared_spent=spent, user=member, amount=share)
+                for member in group
+            )
+        self.bulk_create(SharedSpentMember, members)
+        return len(spents)
@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from transactions.importers import StatementImportError, detect_statement_format, import_statement
+from users.models import CustomUser
+
+
+class Command(BaseCommand):
+    help = 'Imports a CSV or OFX bank statement into the transactions of a user'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Path to the statement file.')
+        parser.add_argument('--email', required=True, help='Email of the owning user.')
+        parser.add_argument(
+            '--format',
+            choices=['csv', 'ofx'],
+            help='Statement format; guessed from the file extension when omitted.'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of rows inserted per bulk INSERT.'
+        )
+
+    def handle(self, *args, **options):
+        try:
+            user = CustomUser.objects.get(email=options['email'])
+        except CustomUser.DoesNotExist:
+            raise CommandError(f"User {options['email']} does not exist.")
+
+        statement_format = options['format'] or detect_statement_format(options['path'])
+        if statement_format is None:
+            raise CommandError("Could not detect the statement format, pass --format.")
+
+        try:
+            with open(options['path'], 'rb') as f:
+                summary = import_statement(
+                    user, f, statement_format, batch_size=options['batch_size']
+                )
+        except OSError as e:
+            raise CommandError(str(e))
+        except StatementImportError as e:
+            raise CommandError(str(e))
+
+        for error in summary['errors']:
+            self.stdout.write(f"line {error['line']}: {error['error']}")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {summary['created']} transactions, skipped {summary['duplicates']} "
+            f"duplicates and {summary['invalid']} invalid rows."
+        ))
@@ -0,0 +1,83 @@
+from datetime import date
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from transactions.partitioning import (
+    INTERVALS,
+    create_future_partitions,
+    detach_partitions,
+    is_partitioned,
+    partition_table,
+    split_default_partition
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Creates the transaction partitions for the coming months or years ahead of time; '
+        'run it regularly (e.g. daily from cron). Can also convert the table to a '
+        'partitioned one and detach old partitions for archiving'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--ahead',
+            type=int,
+            default=settings.TRANSACTIONS_PARTITIONS_AHEAD,
+            help='Number of future partitions to keep ready besides the current one.'
+        )
+        parser.add_argument(
+            '--convert',
+            action='store_true',
+            help='Partition the transactions table first if it is a plain table '
+                 '(locks and copies the table).'
+        )
+        parser.add_argument(
+            '--interval',
+            choices=INTERVALS,
+            default=settings.TRANSACTIONS_PARTITION_INTERVAL or 'month',
+            help='Partition size used by --convert.'
+        )
+        parser.add_argument(
+            '--split-default',
+            action='store_true',
+            help='Also create partitions for the rows that landed in the default partition.'
+        )
+        parser.add_argument(
+            '--detach-before',
+            type=date.fromisoformat,
+            help='Detach partitions ending on or before this date (YYYY-MM-DD). The tables '
+                 'are kept for archiving; report totals stay in the rollup until it is rebuilt.'
+        )
+
+    def handle(self, *args, **options):
+        today = timezone.now().date()
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            if not is_partitioned(cursor):
+                if not options['convert']:
+                    raise CommandError(
+                        "The transactions table is not partitioned. Set "
+                        "TRANSACTIONS_PARTITION_INTERVAL and migrate, or pass --convert."
+                    )
+                partition_table(cursor, options['interval'], today, options['ahead'])
+                self.stdout.write(
+                    f"Partitioned the transactions table by {options['interval']}."
+                )
+
+            created = create_future_partitions(cursor, today, options['ahead'])
+            if options['split_default']:
+                created += split_default_partition(cursor)
+            detached = (
+                detach_partitions(cursor, options['detach_before'])
+                if options['detach_before'] else []
+            )
+
+        for name in detached:
+            self.stdout.write(f"Detached {name}.")
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {len(created)} partitions, detached {len(detached)}."
+        ))
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:50
+
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # transactions_transaction is the largest table; build the indexes without
+    # blocking writes.
+    atomic = False
+
+    dependencies = [
+        ('transactions', '0003_transaction_updated_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='transaction',
+            index=models.Index(fields=['owner', 'date', 'id'], name='transaction_owner_date_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='transaction',
+            index=models.Index(fields=['owner', 'category', 'date', 'id'], name='transaction_owner_cat_idx'),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:58
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import DatabaseError, migrations
+
+TRIGRAM_INDEX = 'transaction_desc_trgm_idx'
+
+
+def create_trigram_index(apps, schema_editor):
+    # pg_trgm ships with the PostgreSQL contrib package, which is not always present;
+    # search falls back to full-text matching only (see transactions.search).
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        if cursor.fetchone() is None:
+            return
+        try:
+            cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        except DatabaseError:
+            return
+        cursor.execute(
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {TRIGRAM_INDEX} '
+            f'ON transactions_transaction USING gin (description gin_trgm_ops)'
+        )
+
+
+def drop_trigram_index(apps, schema_editor):
+    schema_editor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {TRIGRAM_INDEX}')
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('transactions', '0004_transaction_transaction_owner_date_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='transaction',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.SearchVector('description', config='simple'), name='transaction_desc_fts_idx'),
+        ),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
@@ -0,0 +1,40 @@
+from django.conf import settings
+from django.db import migrations
+from django.utils import timezone
+
+
+def partition_transactions(apps, schema_editor):
+    from transactions.partitioning import is_partitioned, partition_table
+
+    interval = settings.TRANSACTIONS_PARTITION_INTERVAL
+    with schema_editor.connection.cursor() as cursor:
+        if interval and not is_partitioned(cursor):
+            partition_table(
+                cursor, interval, timezone.now().date(), settings.TRANSACTIONS_PARTITIONS_AHEAD
+            )
+
+
+def unpartition_transactions(apps, schema_editor):
+    from transactions.partitioning import is_partitioned, unpartition_table
+
+    with schema_editor.connection.cursor() as cursor:
+        if is_partitioned(cursor):
+            unpartition_table(cursor)
+
+
+class Migration(migrations.Migration):
+    """
+    Partitions the transactions table by date when TRANSACTIONS_PARTITION_INTERVAL is
+    set (see transactions.partitioning); a no-op otherwise. Runs after every migration
+    that adds triggers to the table so they are carried over.
+    """
+
+    dependencies = [
+        ('transactions', '0006_category_updated_at_transaction_owner_upd_idx'),
+        ('reports', '0003_dailyspending_rollup_user_cat_date_idx'),
+        ('sync', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_transactions, unpartition_transactions),
+    ]
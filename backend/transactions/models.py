@@ -1,5 +1,7 @@
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from users.models import CustomUser
+from .search import description_vector
 
 
 class Category(models.Model):
@@ -17,6 +19,7 @@ class Category(models.Model):
         null=True,
         blank=True
     )
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         unique_together = ('name', 'type', 'owner')
@@ -42,9 +45,23 @@ class Transaction(models.Model):
     amount = models.DecimalField(max_digits=10, decimal_places=2)
     date = models.DateField()
     description = models.TextField(blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['-date']
+        indexes = [
+            # Feeds, list pagination and date-bounded reports: owner + (date, id) order.
+            models.Index(fields=['owner', 'date', 'id'], name='transaction_owner_date_idx'),
+            # Category-filtered reports and listings.
+            models.Index(
+                fields=['owner', 'category', 'date', 'id'], name='transaction_owner_cat_idx'
+            ),
+            # Description search; the trigram index is added by migration 0005 when
+            # pg_trgm is available.
+            GinIndex(description_vector(), name='transaction_desc_fts_idx'),
+            # Delta sync: the owner's rows changed since a token.
+            models.Index(fields=['owner', 'updated_at'], name='transaction_owner_upd_idx'),
+        ]
 
     def __str__(self):
         return f"{self.owner.email} - {self.amount} on {self.date}"
@@ -0,0 +1,18 @@
+from rest_framework.pagination import CursorPagination
+
+
+class TransactionCursorPagination(CursorPagination):
+    """
+    Cursor pagination over (date, id), newest first.
+    Search results are ordered by their rank instead.
+    """
+    ordering = ('-date', '-id')
+    search_ordering = ('-search_rank', '-date', '-id')
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+
+    def get_ordering(self, request, queryset, view):
+        if 'search_rank' in queryset.query.annotations:
+            return self.search_ordering
+        return super().get_ordering(request, queryset, view)
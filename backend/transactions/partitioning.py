@@ -0,0 +1,278 @@
+"""
+Optional declarative range partitioning of the transactions table by `date`.
+
+With TRANSACTIONS_PARTITION_INTERVAL set to 'month' or 'year', migration 0007 (or
+`manage.py transaction_partitions --convert`) rebuilds `transactions_transaction` as a
+table partitioned by date, with one partition per interval and a default partition for
+dates outside them. Indexes, foreign keys and triggers (report rollup, data versions,
+sync) are carried over from the existing table, so the ORM and the triggers see no
+difference; the primary key becomes (id, date) because PostgreSQL requires it to contain
+the partition key, while Django keeps treating `id` as the primary key.
+
+Date-bounded queries then only scan the partitions of their range, and old partitions
+can be detached as standalone tables for archiving. Requires PostgreSQL 13 or newer.
+New indexes on Transaction have to use AddIndex, since CREATE INDEX CONCURRENTLY is not
+supported on partitioned tables.
+"""
+import re
+from datetime import date
+
+from .models import Transaction
+
+TABLE = Transaction._meta.db_table
+OLD_TABLE = f'{TABLE}_old'
+DEFAULT_PARTITION = f'{TABLE}_default'
+INTERVALS = ('month', 'year')
+PARTITION_NAME_RE = re.compile(rf'^{TABLE}_p(\d{{4}})(?:_(\d{{2}}))?$')
+
+
+def interval_start(day, interval):
+    return date(day.year, day.month, 1) if interval == 'month' else date(day.year, 1, 1)
+
+
+def next_interval(start, interval):
+    if interval == 'year' or start.month == 12:
+        return date(start.year + 1, 1 if interval == 'month' else start.month, 1)
+    return date(start.year, start.month + 1, 1)
+
+
+def partition_name(start, interval):
+    suffix = f'{start:%Y_%m}' if interval == 'month' else f'{start:%Y}'
+    return f'{TABLE}_p{suffix}'
+
+
+def is_partitioned(cursor):
+    cursor.execute(
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s))",
+        [TABLE]
+    )
+    return cursor.fetchone()[0]
+
+
+def get_partitions(cursor):
+    """
+    {start: (name, interval)} of the attached range partitions, oldest first.
+    """
+    cursor.execute(
+        """
+        SELECT c.relname FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = to_regclass(%s)
+        """,
+        [TABLE]
+    )
+    partitions = {}
+    for (name,) in cursor.fetchall():
+        match = PARTITION_NAME_RE.match(name)
+        if match:
+            year, month = match.groups()
+            start = date(int(year), int(month or 1), 1)
+            partitions[start] = (name, 'month' if month else 'year')
+    return dict(sorted(partitions.items()))
+
+
+def get_partition_interval(cursor):
+    intervals = {interval for _, interval in get_partitions(cursor).values()}
+    return intervals.pop() if len(intervals) == 1 else None
+
+
+def create_partitions(cursor, starts, interval):
+    """
+    Creates the partitions beginning at `starts` that do not exist yet and returns
+    their names. Rows already in the default partition for a new range are moved into
+    it; the rollup triggers see the move as a delete and an insert, which cancel out.
+    """
+    created = []
+    cursor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+    for start in sorted(set(starts)):
+        name = partition_name(start, interval)
+        cursor.execute("SELECT to_regclass(%s) IS NOT NULL", [name])
+        if cursor.fetchone()[0]:
+            continue
+
+        end = next_interval(start, interval)
+        cursor.execute(
+            f'SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE date >= %s AND date < %s)',
+            [start, end]
+        )
+        if cursor.fetchone()[0]:
+            cursor.execute(f'CREATE TEMPORARY TABLE moved_rows (LIKE {TABLE}) ON COMMIT DROP')
+            cursor.execute(
+                f"""
+                WITH moved AS (
+                    DELETE FROM {DEFAULT_PARTITION} WHERE date >= %s AND date < %s RETURNING *
+                )
+                INSERT INTO moved_rows SELECT * FROM moved
+                """,
+                [start, end]
+            )
+            cursor.execute(
+                f'CREATE TABLE {name} PARTITION OF {TABLE} FOR VALUES FROM (%s) TO (%s)',
+                [start, end]
+            )
+            cursor.execute(f'INSERT INTO {name} SELECT * FROM moved_rows')
+            cursor.execute('DROP TABLE moved_rows')
+        else:
+            cursor.execute(
+                f'CREATE TABLE {name} PARTITION OF {TABLE} FOR VALUES FROM (%s) TO (%s)',
+                [start, end]
+            )
+        created.append(name)
+    return created
+
+
+def create_future_partitions(cursor, today, ahead):
+    """
+    Makes sure the partitions for the current interval and the `ahead` following ones
+    exist. Returns the names of the created partitions.
+    """
+    interval = get_partition_interval(cursor)
+    if interval is None:
+        raise ValueError(f"{TABLE} is not partitioned by month or year.")
+
+    starts = [interval_start(today, interval)]
+    for _ in range(ahead):
+        starts.append(next_interval(starts[-1], interval))
+    return create_partitions(cursor, starts, interval)
+
+
+def split_default_partition(cursor):
+    """
+    Creates partitions for every interval that has rows in the default partition, e.g.
+    after importing history older than the existing partitions. Returns their names.
+    """
+    interval = get_partition_interval(cursor)
+    if interval is None:
+        raise ValueError(f"{TABLE} is not partitioned by month or year.")
+
+    cursor.execute(
+        f'SELECT DISTINCT date_trunc(%s, date)::date FROM {DEFAULT_PARTITION}', [interval]
+    )
+    return create_partitions(cursor, [row[0] for row in cursor.fetchall()], interval)
+
+
+def detach_partitions(cursor, before):
+    """
+    Detaches every partition ending on or before `before`; the tables stay in the
+    database for archiving or dropping. Returns their names.
+    """
+    detached = []
+    for start, (name, interval) in get_partitions(cursor).items():
+        if next_interval(start, interval) <= before:
+            cursor.execute(f'ALTER TABLE {TABLE} DETACH PARTITION {name}')
+            detached.append(name)
+    return detached
+
+
+def _rebuild_table(cursor, partition_by, primary_key, fill):
+    """
+    Recreates the transactions table with `partition_by` (or as a plain table), copies
+    the rows, and restores the ids, primary key, indexes, foreign keys and triggers of
+    the current table. `fill` runs after CREATE TABLE, before the copy.
+    """
+    # Deferred foreign key checks queued earlier in the transaction would block ALTER TABLE.
+    cursor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+    cursor.execute(
+        "SELECT conname FROM pg_constraint WHERE conrelid = to_regclass(%s) AND contype = 'p'",
+        [TABLE]
+    )
+    pkey = cursor.fetchone()[0]
+    cursor.execute(
+        "SELECT indexname, indexdef FROM pg_indexes WHERE tablename = %s AND indexname <> %s",
+        [TABLE, pkey]
+    )
+    indexes = cursor.fetchall()
+    cursor.execute(
+        """
+        SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint
+        WHERE conrelid = to_regclass(%s) AND contype = 'f'
+        """,
+        [TABLE]
+    )
+    foreign_keys = cursor.fetchall()
+    cursor.execute(
+        """
+        SELECT tgname, pg_get_triggerdef(oid) FROM pg_trigger
+        WHERE tgrelid = to_regclass(%s) AND NOT tgisinternal
+        """,
+        [TABLE]
+    )
+    triggers = cursor.fetchall()
+
+    # Free the names the new table takes over.
+    for name, _ in triggers:
+        cursor.execute(f'DROP TRIGGER {name} ON {TABLE}')
+    for name, _ in indexes:
+        cursor.execute(f'DROP INDEX {name}')
+    cursor.execute(f'ALTER TABLE {TABLE} DROP CONSTRAINT {pkey}')
+    cursor.execute(f'ALTER TABLE {TABLE} RENAME TO {OLD_TABLE}')
+    cursor.execute("SELECT pg_get_serial_sequence(%s, 'id')", [OLD_TABLE])
+    old_sequence = cursor.fetchone()[0]
+    cursor.execute(f'ALTER SEQUENCE {old_sequence} RENAME TO {OLD_TABLE}_id_seq')
+    old_sequence = f'{OLD_TABLE}_id_seq'
+
+    cursor.execute(
+        f"""
+        CREATE TABLE {TABLE} (
+            LIKE {OLD_TABLE} INCLUDING DEFAULTS INCLUDING IDENTITY INCLUDING CONSTRAINTS
+        ) {partition_by}
+        """
+    )
+    fill(cursor)
+    cursor.execute(f'INSERT INTO {TABLE} SELECT * FROM {OLD_TABLE}')
+    cursor.execute(
+        f"""
+        SELECT setval(pg_get_serial_sequence(%s, 'id'), last_value, is_called)
+        FROM {old_sequence}
+        """,
+        [TABLE]
+    )
+
+    cursor.execute(f'ALTER TABLE {TABLE} ADD CONSTRAINT {pkey} PRIMARY KEY ({primary_key})')
+    for _, definition in indexes:
+        # Indexes of a partitioned table are reported as "ON ONLY <table>".
+        cursor.execute(definition.replace(' ON ONLY ', ' ON ', 1))
+    for name, definition in foreign_keys:
+        cursor.execute(f'ALTER TABLE {TABLE} ADD CONSTRAINT {name} {definition}')
+    for _, definition in triggers:
+        cursor.execute(definition)
+
+    cursor.execute(f'DROP TABLE {OLD_TABLE}')
+    cursor.execute(f'ANALYZE {TABLE}')
+
+
+def partition_table(cursor, interval, today, ahead):
+    """
+    Converts the plain transactions table into one partitioned by `interval`, with
+    partitions for every interval that has rows, the current one and `ahead` more.
+    Takes an exclusive lock and copies the table; run it in a maintenance window.
+    """
+    if interval not in INTERVALS:
+        raise ValueError(f"Unknown partition interval: {interval!r}")
+
+    cursor.execute(f'SELECT DISTINCT date_trunc(%s, date)::date FROM {TABLE}', [interval])
+    starts = [row[0] for row in cursor.fetchall()]
+    start = interval_start(today, interval)
+    starts.append(start)
+    for _ in range(ahead):
+        start = next_interval(start, interval)
+        starts.append(start)
+
+    def fill(cursor):
+        for start in sorted(set(starts)):
+            cursor.execute(
+                f'CREATE TABLE {partition_name(start, interval)} PARTITION OF {TABLE} '
+                f'FOR VALUES FROM (%s) TO (%s)',
+                [start, next_interval(start, interval)]
+            )
+        cursor.execute(f'CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {TABLE} DEFAULT')
+
+    _rebuild_table(cursor, 'PARTITION BY RANGE (date)', 'id, date', fill)
+
+
+def unpartition_table(cursor):
+    """
+    Converts a partitioned transactions table back into a plain one. Detached
+    partitions are left alone.
+    """
+    _rebuild_table(cursor, '', 'id', lambda cursor: None)
@@ -0,0 +1,75 @@
+import re
+from functools import cache
+
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramWordSimilarity
+)
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import FloatField, IntegerField, Q
+from django.db.models.functions import Cast
+
+# Descriptions are short merchant names in mixed languages, so no stemming.
+SEARCH_CONFIG = 'simple'
+MAX_SEARCH_LENGTH = 100
+RANK_SCALE = 1_000_000
+
+
+def description_vector(field='description'):
+    """
+    The tsvector expression the description GIN indexes are built on; queries must use
+    the same expression for the planner to pick the index.
+    """
+    return SearchVector(field, config=SEARCH_CONFIG)
+
+
+def build_prefix_query(term):
+    """
+    Turns free text into a tsquery matching every word as a prefix ("silp uber" ->
+    'silp:* & uber:*'). Returns None when the text contains no words.
+    """
+    words = re.findall(r'\w+', term[:MAX_SEARCH_LENGTH])
+    if not words:
+        return None
+    return SearchQuery(
+        ' & '.join(f'{word}:*' for word in words), search_type='raw', config=SEARCH_CONFIG
+    )
+
+
+@cache
+def trigram_available(alias=DEFAULT_DB_ALIAS):
+    """
+    pg_trgm is optional: the migrations only install it (and the trigram indexes)
+    where the server provides the extension.
+    """
+    with connections[alias].cursor() as cursor:
+        cursor.execute("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')")
+        return cursor.fetchone()[0]
+
+
+def search_descriptions(queryset, term, field='description'):
+    """
+    Filters `queryset` to rows whose `field` matches `term` by full-text prefix match or,
+    with pg_trgm, by trigram word similarity (typos such as "slipo"). Matching rows are
+    annotated with an integer `search_rank`, higher is better.
+    """
+    query = build_prefix_query(term)
+    if query is None:
+        return queryset.none()
+
+    term = term[:MAX_SEARCH_LENGTH]
+    vector = description_vector(field)
+    queryset = queryset.alias(search_document=vector)
+    condition = Q(search_document=query)
+    rank = SearchRank(vector, query)
+
+    if trigram_available(queryset.db):
+        condition |= Q(**{f'{field}__trigram_word_similar': term})
+        rank = rank + TrigramWordSimilarity(term, field)
+
+    # Integer ranks keep cursor positions exact (ts_rank is a float4).
+    return queryset.filter(condition).annotate(
+        search_rank=Cast(Cast(rank, FloatField()) * RANK_SCALE, IntegerField())
+    )
@@ -1,28 +1,129 @@
 from rest_framework import serializers
+from .category_cache import get_user_categories
 from .models import Category, Transaction
 
 
 class CategorySerializer(serializers.ModelSerializer):
     class Meta:
         model = Category
-        fields = ['id', 'name', 'type', 'owner']
-        read_only_fields = ['owner']
+        fields = ['id', 'name', 'type', 'owner', 'updated_at']
+        read_only_fields = ['owner', 'updated_at']
+
+
+class CachedCategoryField(serializers.PrimaryKeyRelatedField):
+    """
+    Resolves ids of categories visible to the requesting user from the category cache;
+    other ids fall back to a query, so validators still see foreign categories.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('queryset', Category.objects.all())
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        request = self.context.get('request')
+        if request is not None and not isinstance(data, bool):
+            try:
+                category = get_user_categories(request.user.id).get_instance(int(data))
+            except (TypeError, ValueError):
+                category = None
+            if category is not None:
+                return category
+        return super().to_internal_value(data)
 
 
 class TransactionSerializer(serializers.ModelSerializer):
     owner = serializers.PrimaryKeyRelatedField(read_only=True)
+    category = CachedCategoryField(allow_null=True, required=False)
 
     class Meta:
         model = Transaction
         fields = [
             'id', 'owner', 'category', 'amount',
-            'date', 'description'
+            'date', 'description', 'updated_at'
         ]
+        read_only_fields = ['updated_at']
 
     def validate_category(self, category):
         user = self.context['request'].user
-        if category.owner is not None and category.owner != user:
+        if category is not None and category.owner_id not in (None, user.id):
             raise serializers.ValidationError(
                 "That`s not your category"
             )
         return category
+
+
+class PreloadedCategoryField(serializers.PrimaryKeyRelatedField):
+    """
+    Resolves category ids from `context['categories']` (id -> Category) instead of
+    querying per item. Used by batch endpoints that preload all categories at once.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('queryset', Category.objects.all())
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        if isinstance(data, bool):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        try:
+            return self.context['categories'][int(data)]
+        except KeyError:
+            self.fail('does_not_exist', pk_value=data)
+        except (TypeError, ValueError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+
+
+class TransactionBatchSerializer(TransactionSerializer):
+    category = PreloadedCategoryField(allow_null=True)
+
+    @staticmethod
+    def preload_categories(items, user):
+        """
+        Resolves every category referenced by `items`: the user's own and standard ones
+        from the category cache, any others with a single query.
+        """
+        ids = set()
+        for item in items:
+            try:
+                ids.add(int(item['category']))
+            except (KeyError, TypeError, ValueError):
+                continue
+
+        lookup = get_user_categories(user.id)
+        categories = {i: lookup.get_instance(i) for i in ids if i in lookup}
+        missing = ids - categories.keys()
+        if missing:
+            categories.update(Category.objects.in_bulk(missing))
+        return categories
+
+
+class BatchDeleteSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False)
+
+
+class StatementImportSerializer(serializers.Serializer):
+    file = serializers.FileField()
+    format = serializers.ChoiceField(
+        choices=['csv', 'ofx'],
+        required=False,
+        help_text="Statement format; guessed from the file extension when omitted."
+    )
+
+
+class TransactionListSerializer(serializers.Serializer):
+    """
+    Read-only serializer for `.values()` rows of Transaction, used by the list endpoint
+    to skip model instantiation. Output matches TransactionSerializer.
+    """
+    id = serializers.IntegerField(read_only=True)
+    owner = serializers.IntegerField(source='owner_id', read_only=True)
+    category = serializers.IntegerField(source='category_id', allow_null=True, read_only=True)
+    amount = serializers.DecimalField(max_digits=10, decimal_places=2, read_only=True)
+    date = serializers.DateField(read_only=True)
+    description = serializers.CharField(read_only=True)
+    updated_at = serializers.DateTimeField(read_only=True)
+
+    VALUES_FIELDS = (
+        'id', 'owner_id', 'category_id', 'amount', 'date', 'description', 'updated_at'
+    )
@@ -1,16 +1,37 @@
+from collections import defaultdict
+
 from rest_framework import viewsets, permissions
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.decorators import action
+from rest_framework.exceptions import PermissionDenied, ValidationError
+from rest_framework.parsers import FormParser, MultiPartParser
+from rest_framework.response import Response
+from django.conf import settings
+from django.db import transaction
 from django.db.models import Q
+from django.utils import timezone
+from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema, extend_schema_view
+from reports.cache import conditional_on_user_data
+from .category_cache import get_user_categories
+from .filters import TransactionFilter
+from .importers import StatementImportError, detect_statement_format, import_statement
 from .models import Category, Transaction
+from .pagination import TransactionCursorPagination
 from .serializers import (
-    CategorySerializer, TransactionSerializer
+    BatchDeleteSerializer,
+    CategorySerializer,
+    StatementImportSerializer,
+    TransactionBatchSerializer,
+    TransactionListSerializer,
+    TransactionSerializer
 )
 
+MAX_BATCH_SIZE = 1000
+
 
 class IsOwner(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
-        return obj.owner == request.user
+        return obj.owner_id == request.user.id
 
 @extend_schema_view(
     list=extend_schema(
@@ -42,23 +63,39 @@ class CategoryViewSet(viewsets.ModelViewSet):
             Q(owner=self.request.user) | Q(owner=None)
         )
 
+    def list(self, request, *args, **kwargs):
+        # Other workers cannot invalidate a per-process cache, so only a shared one may
+        # answer the list users see right after editing their categories.
+        if settings.CATEGORY_CACHE_SHARED:
+            categories = get_user_categories(request.user.id).instances()
+        else:
+            categories = self.get_queryset().order_by('id')
+        return Response(self.get_serializer(categories, many=True).data)
+
     def perform_create(self, serializer):
         serializer.save(owner=self.request.user)
 
     def perform_update(self, serializer):
-        if serializer.instance.owner is None:
+        if serializer.instance.owner_id is None:
             raise PermissionDenied("Ви не можете редагувати стандартні категорії.")
         serializer.save()
 
     def perform_destroy(self, instance):
-        if instance.owner is None:
+        if instance.owner_id is None:
             raise PermissionDenied("Ви не можете видаляти стандартні категорії.")
         instance.delete()
 
 @extend_schema_view(
     list=extend_schema(
         summary="List transactions",
-        description="Get a list of all personal transactions."
+        description=(
+            "Get a cursor-paginated list of personal transactions, newest first "
+            "(best match first when `search` is given). Filter by date range, one or more "
+            "categories, amount range and category type. "
+            "Supports conditional requests: "
+            "send the returned ETag in If-None-Match (or Last-Modified in "
+            "If-Modified-Since) to get 304 Not Modified when nothing changed."
+        )
     ),
     create=extend_schema(
         summary="Create transaction",
@@ -73,12 +110,201 @@ class CategoryViewSet(viewsets.ModelViewSet):
 class TransactionViewSet(viewsets.ModelViewSet):
     serializer_class = TransactionSerializer
     permission_classes = [permissions.IsAuthenticated, IsOwner]
+    pagination_class = TransactionCursorPagination
+    filterset_class = TransactionFilter
 
     def get_queryset(self):
         return Transaction.objects.filter(owner=self.request.user)
 
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return TransactionListSerializer
+        return TransactionSerializer
+
+    @conditional_on_user_data()
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        # The cursor of ranked search results is positioned on `search_rank`.
+        ranked = ('search_rank',) if 'search_rank' in queryset.query.annotations else ()
+        queryset = queryset.values(*TransactionListSerializer.VALUES_FIELDS, *ranked)
+
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
     def perform_create(self, serializer):
         serializer.save(owner=self.request.user)
 
     def get_serializer_context(self):
         return {'request': self.request}
+
+    def _get_batch_items(self, request):
+        items = request.data
+        if not isinstance(items, list) or not items:
+            raise ValidationError("Expected a non-empty list of transactions.")
+        if len(items) > MAX_BATCH_SIZE:
+            raise ValidationError(f"A batch can contain at most {MAX_BATCH_SIZE} items.")
+        return items
+
+    @extend_schema(
+        summary="Batch create transactions",
+        description=(
+            f"Creates up to {MAX_BATCH_SIZE} transactions in one request. Categories are "
+            "validated with a single query and valid items are inserted with one bulk INSERT. "
+            "Returns a result per item; invalid items are reported and skipped."
+        ),
+        request=TransactionSerializer(many=True),
+        responses={200: OpenApiTypes.OBJECT}
+    )
+    @action(detail=False, methods=['post'], url_path='batch')
+    def batch(self, request):
+        items = self._get_batch_items(request)
+        context = {
+            'request': request,
+            'categories': TransactionBatchSerializer.preload_categories(items, request.user)
+        }
+
+        results = []
+        to_create = []
+        for index, item in enumerate(items):
+            serializer = TransactionBatchSerializer(data=item, context=context)
+            if serializer.is_valid():
+                obj = Transaction(owner=request.user, **serializer.validated_data)
+                to_create.append((index, obj))
+            else:
+                results.append({'index': index, 'status': 'invalid', 'errors': serializer.errors})
+
+        with transaction.atomic():
+            Transaction.objects.bulk_create([obj for _, obj in to_create])
+
+        for index, obj in to_create:
+            results.append({
+                'index': index,
+                'status': 'created',
+                'data': TransactionSerializer(obj, context=context).data
+            })
+
+        results.sort(key=lambda r: r['index'])
+        return Response({'results': results})
+
+    @extend_schema(
+        summary="Batch update transactions",
+        description=(
+            f"Partially updates up to {MAX_BATCH_SIZE} transactions; every item must contain "
+            "`id`. Existing rows are locked and loaded with one query, categories with at most "
+            "one, and rows are written with one bulk UPDATE per set of changed fields."
+        ),
+        request=TransactionSerializer(many=True),
+        responses={200: OpenApiTypes.OBJECT}
+    )
+    @batch.mapping.patch
+    def batch_update(self, request):
+        items = self._get_batch_items(request)
+        context = {
+            'request': request,
+            'categories': TransactionBatchSerializer.preload_categories(items, request.user)
+        }
+
+        ids = [item.get('id') for item in items if isinstance(item, dict)]
+
+        results = []
+        to_update = []
+        now = timezone.now()
+        with transaction.atomic():
+            # Locked in id order, so overlapping batches wait instead of deadlocking.
+            existing = self.get_queryset().select_for_update().order_by('id').in_bulk(
+                [i for i in ids if isinstance(i, int)]
+            )
+            groups = defaultdict(list)
+            for index, item in enumerate(items):
+                instance = existing.get(item.get('id')) if isinstance(item, dict) else None
+                if instance is None:
+                    results.append({'index': index, 'status': 'not_found'})
+                    continue
+
+                serializer = TransactionBatchSerializer(
+                    instance, data=item, partial=True, context=context
+                )
+                if not serializer.is_valid():
+                    results.append(
+                        {'index': index, 'status': 'invalid', 'errors': serializer.errors}
+                    )
+                    continue
+
+                for field, value in serializer.validated_data.items():
+                    setattr(instance, field, value)
+                instance.updated_at = now
+                # Each row is written with only the fields its item sent.
+                groups[frozenset(serializer.validated_data)].append(instance)
+                to_update.append((index, instance))
+
+            for fields, objs in groups.items():
+                Transaction.objects.bulk_update(objs, fields=[*sorted(fields), 'updated_at'])
+
+        for index, obj in to_update:
+            results.append({
+                'index': index,
+                'status': 'updated',
+                'data': TransactionSerializer(obj, context=context).data
+            })
+
+        results.sort(key=lambda r: r['index'])
+        return Response({'results': results})
+
+    @extend_schema(
+        summary="Batch delete transactions",
+        description=f"Deletes up to {MAX_BATCH_SIZE} of your transactions with one DELETE.",
+        request=BatchDeleteSerializer,
+        responses={200: OpenApiTypes.OBJECT}
+    )
+    @batch.mapping.delete
+    def batch_delete(self, request):
+        serializer = BatchDeleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = serializer.validated_data['ids']
+        if len(ids) > MAX_BATCH_SIZE:
+            raise ValidationError(f"A batch can contain at most {MAX_BATCH_SIZE} items.")
+
+        with transaction.atomic():
+            queryset = self.get_queryset().filter(id__in=ids)
+            found = set(queryset.values_list('id', flat=True))
+            queryset.filter(id__in=found).delete()
+
+        return Response({'results': [
+            {'id': pk, 'status': 'deleted' if pk in found else 'not_found'} for pk in ids
+        ]})
+
+    @extend_schema(
+        summary="Import a bank statement",
+        description=(
+            "Uploads a CSV (columns `date`, `amount`, `description`, optional `category`) "
+            "or OFX statement. Negative amounts are imported as expenses, positive ones as "
+            "income. The file is parsed as a stream and inserted in fixed-size batches, all "
+            "in one transaction: a malformed file imports nothing. Rows matching an existing "
+            "transaction by date, amount and description are skipped."
+        ),
+        request=StatementImportSerializer,
+        responses={200: OpenApiTypes.OBJECT}
+    )
+    @action(
+        detail=False,
+        methods=['post'],
+        url_path='import',
+        parser_classes=[MultiPartParser, FormParser]
+    )
+    def import_statement(self, request):
+        serializer = StatementImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upload = serializer.validated_data['file']
+        statement_format = (
+            serializer.validated_data.get('format') or detect_statement_format(upload.name)
+        )
+        if statement_format is None:
+            raise ValidationError({'format': "Could not detect the statement format."})
+
+        try:
+            summary = import_statement(request.user, upload.file, statement_format)
+        except StatementImportError as e:
+            raise ValidationError({'file': str(e)})
+
+        return Response(summary)